@@ -0,0 +1,175 @@
+import pygame
+import os
+import sys
+import threading
+import pygame.sysfont
+
+# Everything except the tracker itself counts as a call site
+_THIS_FILE = os.path.abspath(__file__)
+_PYGAME_DIR = os.path.dirname(os.path.abspath(pygame.__file__))
+
+
+def _call_site():
+    """First frame outside this module and pygame: 'world/parallax.py:42 draw'."""
+    frame = sys._getframe(2)
+    while frame:
+        path = os.path.abspath(frame.f_code.co_filename)
+        if path != _THIS_FILE and not path.startswith(_PYGAME_DIR):
+            rel = os.path.relpath(path)
+            return f"{rel}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class AllocTracker:
+    """
+    Debug-only instrumentation for surface allocations. While installed, it
+    wraps pygame.Surface, transform.rotate/scale/smoothscale/rotozoom,
+    mask.from_surface and Font.render, counting allocations and bytes per
+    call site per frame. Only main-thread allocations between begin_frame()
+    and end_frame() count, so the debug overlays drawn after end_frame() and
+    background loader threads stay out of the report. Enable with
+    DEBUG_ALLOC_TRACKER in settings.py.
+    """
+    def __init__(self, top_n=8):
+        self.top_n = top_n
+        self.installed = False
+        self.paused = False
+        self.in_frame = False
+        self._originals = {}
+
+        self.frame_index = 0
+        self.current = {}     # site -> [count, bytes] for the frame in progress
+        self.last_frame = {}  # same, for the last completed frame
+        self.totals = {}      # site -> [count, bytes, frames_seen]
+
+    # --- INSTALL / UNINSTALL ---
+
+    def install(self):
+        if self.installed: return
+        tracker = self
+        o = self._originals
+        o["Surface"] = pygame.Surface
+        o["Font"] = pygame.font.Font
+        o["rotate"] = pygame.transform.rotate
+        o["scale"] = pygame.transform.scale
+        o["smoothscale"] = pygame.transform.smoothscale
+        o["rotozoom"] = pygame.transform.rotozoom
+        o["from_surface"] = pygame.mask.from_surface
+
+        class TrackedSurface(o["Surface"]):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker.record(self.get_pitch() * self.get_height())
+
+        class TrackedFont(o["Font"]):
+            def render(self, *args, **kwargs):
+                surf = super().render(*args, **kwargs)
+                tracker.record(surf.get_pitch() * surf.get_height())
+                return surf
+
+        def wrap_transform(fn):
+            def wrapper(*args, **kwargs):
+                surf = fn(*args, **kwargs)
+                # scale/smoothscale into a dest_surface return it: nothing was allocated
+                dest = kwargs.get("dest_surface", args[2] if len(args) > 2 else None)
+                if surf is not dest:
+                    tracker.record(surf.get_pitch() * surf.get_height())
+                return surf
+            return wrapper
+
+        def from_surface(*args, **kwargs):
+            mask = o["from_surface"](*args, **kwargs)
+            w, h = mask.get_size()
+            tracker.record((w * h) // 8)
+            return mask
+
+        pygame.Surface = TrackedSurface
+        pygame.font.Font = TrackedFont
+        pygame.sysfont.Font = TrackedFont
+        for name in ["rotate", "scale", "smoothscale", "rotozoom"]:
+            setattr(pygame.transform, name, wrap_transform(o[name]))
+        pygame.mask.from_surface = from_surface
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed: return
+        o = self._originals
+        pygame.Surface = o["Surface"]
+        pygame.font.Font = o["Font"]
+        pygame.sysfont.Font = o["Font"]
+        for name in ["rotate", "scale", "smoothscale", "rotozoom"]:
+            setattr(pygame.transform, name, o[name])
+        pygame.mask.from_surface = o["from_surface"]
+        self.installed = False
+
+    # --- COUNTING ---
+
+    def record(self, nbytes):
+        # Background loaders (world_gen's rock builder) are not frame work, and
+        # must not touch `current` while end_frame() walks it
+        if self.paused or not self.in_frame: return
+        if threading.current_thread() is not threading.main_thread(): return
+        entry = self.current.setdefault(_call_site(), [0, 0])
+        entry[0] += 1
+        entry[1] += nbytes
+
+    def begin_frame(self):
+        self.current = {}
+        self.in_frame = True
+
+    def end_frame(self):
+        self.in_frame = False
+        self.last_frame = self.current
+        for site, (count, nbytes) in self.current.items():
+            total = self.totals.setdefault(site, [0, 0, 0])
+            total[0] += count
+            total[1] += nbytes
+            total[2] += 1
+        self.current = {}
+        self.frame_index += 1
+
+    def frame_allocations(self):
+        """(allocations, bytes) of the last completed frame. (0, 0) means allocation-free."""
+        count = sum(c for c, _ in self.last_frame.values())
+        nbytes = sum(b for _, b in self.last_frame.values())
+        return count, nbytes
+
+    def top_sites(self, n=None, last_frame_only=False):
+        """Worst offenders as (site, allocs/frame, bytes/frame), by bytes."""
+        frames = max(1, self.frame_index)
+        if last_frame_only:
+            rows = [(site, c, b) for site, (c, b) in self.last_frame.items()]
+        else:
+            rows = [(site, c / frames, b / frames) for site, (c, b, _) in self.totals.items()]
+        rows.sort(key=lambda r: r[2], reverse=True)
+        return rows[:n or self.top_n]
+
+    # --- OUTPUT ---
+
+    def draw_overlay(self, screen):
+        self.paused = True
+        try:
+            if not hasattr(self, "_font"):
+                self._font = pygame.font.SysFont("Consolas", 14)
+            count, nbytes = self.frame_allocations()
+            lines = [f"ALLOC {count} surfaces  {nbytes / 1024:.1f} KB this frame"]
+            for site, c, b in self.top_sites(last_frame_only=True):
+                lines.append(f"{c:4d}  {b / 1024:8.1f} KB  {site}")
+
+            y = 4
+            for line in lines:
+                surf = self._font.render(line, True, (255, 255, 0), (0, 0, 0))
+                screen.blit(surf, (4, y))
+                y += surf.get_height()
+        finally:
+            self.paused = False
+
+    def dump(self, path):
+        frames = max(1, self.frame_index)
+        with open(path, "w") as f:
+            f.write(f"Surface allocations over {self.frame_index} frames\n")
+            f.write(f"{'allocs/frame':>12} {'KB/frame':>10} {'frames hit':>10}  call site\n")
+            rows = sorted(self.totals.items(), key=lambda r: r[1][1], reverse=True)
+            for site, (count, nbytes, seen) in rows:
+                f.write(f"{count / frames:12.2f} {nbytes / frames / 1024:10.1f} {seen:10d}  {site}\n")
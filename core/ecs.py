@@ -0,0 +1,263 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- ENTITY HANDLES ---
+# A handle packs a slot index and that slot's generation into one int. Despawning
+# bumps the slot's generation, so a handle kept by a missile or an event stops
+# resolving instead of pointing at whatever entity reuses the slot.
+INDEX_BITS = 20
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+def handle_index(handle):
+    return handle & INDEX_MASK
+
+def handle_generation(handle):
+    return handle >> INDEX_BITS
+
+# Column defaults pick the storage type: 0.0 -> float64, 0 -> int64, False -> bool
+_DTYPES = {float: "f8", int: "i8", bool: "?"}
+
+
+class Archetype:
+    """
+    Every entity sharing one component set, stored column by column. Row i of
+    each column belongs to handles[i] / objects[i]; removing an entity moves the
+    last row into its place so the columns stay dense for the systems.
+    """
+    def __init__(self, name, columns, capacity=32):
+        self.name = name
+        self.defaults = columns
+        self.count = 0
+        self.capacity = capacity
+        self.columns = {col: self._allocate(default, capacity) for col, default in columns.items()}
+        self.handles = []
+        self.objects = []  # Sprite that owns the row, or None for pure data
+
+    def _allocate(self, default, size):
+        if np is not None:
+            return np.full(size, default, dtype=_DTYPES[type(default)])
+        return [default] * size
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed: capacity *= 2
+        for col, data in self.columns.items():
+            grown = self._allocate(self.defaults[col], capacity)
+            grown[:self.count] = data[:self.count]
+            self.columns[col] = grown
+        self.capacity = capacity
+
+    def append(self, handle, obj, values):
+        if self.count >= self.capacity: self._grow(self.count + 1)
+        row = self.count
+        for col, data in self.columns.items():
+            data[row] = values.get(col, self.defaults[col])
+        self.handles.append(handle)
+        self.objects.append(obj)
+        self.count += 1
+        return row
+
+    def extend(self, handles, values):
+        """Appends len(handles) data-only rows. A value is a scalar or a sequence/array with one entry per row."""
+        n = len(handles)
+        if self.count + n > self.capacity: self._grow(self.count + n)
+        start, end = self.count, self.count + n
+        for col, data in self.columns.items():
+            value = values.get(col, self.defaults[col])
+            if np is None and not isinstance(value, (list, tuple)):
+                value = [value] * n
+            data[start:end] = value
+        self.handles.extend(handles)
+        self.objects.extend([None] * n)
+        self.count = end
+        return start
+
+    def remove(self, row):
+        """Swap-removes row. Returns the handle that moved into it, or None."""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            for data in self.columns.values():
+                data[row] = data[last]
+            self.handles[row] = self.handles[last]
+            self.objects[row] = self.objects[last]
+            moved = self.handles[row]
+        self.handles.pop()
+        self.objects.pop()
+        self.count = last
+        return moved
+
+    def row_values(self, row):
+        return {col: data[row] for col, data in self.columns.items()}
+
+    def view(self, col):
+        """The live part of a column. With numpy it is a view that writes through;
+        the list fallback returns a copy, so fallback systems index the column."""
+        return self.columns[col][:self.count]
+
+
+class World:
+    """
+    Entity storage for a run. Entities of one archetype share dense columns
+    that systems (systems/entity_systems.py) update in bulk; game objects that
+    still need a Python side keep a handle and read their Components through it.
+    """
+    def __init__(self):
+        self.archetypes = {}
+        self.generations = []
+        self.locations = []  # slot -> (archetype, row), None when free
+        self.free = []
+
+    def register(self, name, **columns):
+        """Declares an archetype and its columns with their defaults. Idempotent."""
+        if name not in self.archetypes:
+            self.archetypes[name] = Archetype(name, columns)
+        return self.archetypes[name]
+
+    def spawn(self, name, obj=None, **values):
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+            self.locations.append(None)
+        handle = (self.generations[index] << INDEX_BITS) | index
+        archetype = self.archetypes[name]
+        self.locations[index] = (archetype, archetype.append(handle, obj, values))
+        return handle
+
+    def spawn_batch(self, name, n, **values):
+        """
+        Spawns n data-only entities with one slice write per column (bullet
+        volleys); values are scalars or per-row sequences. Returns the handles.
+        """
+        handles = []
+        for _ in range(n):
+            if self.free:
+                index = self.free.pop()
+            else:
+                index = len(self.generations)
+                self.generations.append(0)
+                self.locations.append(None)
+            handles.append((self.generations[index] << INDEX_BITS) | index)
+        archetype = self.archetypes[name]
+        start = archetype.extend(handles, values)
+        for row, handle in enumerate(handles, start):
+            self.locations[handle & INDEX_MASK] = (archetype, row)
+        return handles
+
+    def alive(self, handle):
+        index = handle & INDEX_MASK
+        return (index < len(self.generations) and self.locations[index] is not None
+                and self.generations[index] == handle >> INDEX_BITS)
+
+    def locate(self, handle):
+        """(archetype, row) of a live handle, or (None, -1) for a stale one."""
+        if not self.alive(handle): return None, -1
+        return self.locations[handle & INDEX_MASK]
+
+    def get(self, handle, col):
+        archetype, row = self.locate(handle)
+        return archetype.columns[col][row] if archetype else None
+
+    def set(self, handle, col, value):
+        archetype, row = self.locate(handle)
+        if archetype: archetype.columns[col][row] = value
+
+    def despawn(self, handle):
+        if not self.alive(handle): return False
+        index = handle & INDEX_MASK
+        archetype, row = self.locations[index]
+        obj = archetype.objects[row]
+        if isinstance(obj, Entity):
+            obj.release(archetype.row_values(row))
+
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved & INDEX_MASK] = (archetype, row)
+        self.locations[index] = None
+        self.generations[index] += 1
+        self.free.append(index)
+        return True
+
+    def despawn_rows(self, name, rows):
+        """Despawns the given rows of one archetype; returns their objects in row order."""
+        archetype = self.archetypes[name]
+        removed = []
+        # Highest row first, so a swap-remove never moves a row still to be removed
+        for row in sorted(rows, reverse=True):
+            removed.append(archetype.objects[row])
+            self.despawn(archetype.handles[row])
+        removed.reverse()
+        return removed
+
+    def despawn_where(self, name, mask):
+        """Despawns every entity of name whose mask entry is true."""
+        if np is not None:
+            rows = np.flatnonzero(mask).tolist()
+        else:
+            rows = [row for row, hit in enumerate(mask) if hit]
+        return self.despawn_rows(name, rows) if rows else []
+
+    def clear(self, name):
+        archetype = self.archetypes.get(name)
+        if archetype: self.despawn_rows(name, range(archetype.count))
+
+    def objects(self, name):
+        archetype = self.archetypes.get(name)
+        return archetype.objects[:] if archetype else []
+
+
+class Component:
+    """
+    Attribute that lives in the owner's archetype column while it is spawned,
+    and in the instance dict before spawning and after despawning.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None: return self
+        world = obj.world
+        if world is None: return obj.__dict__[self.name]
+        archetype, row = world.locations[obj.handle & INDEX_MASK]
+        return archetype.columns[self.name][row]
+
+    def __set__(self, obj, value):
+        world = obj.world
+        if world is None:
+            obj.__dict__[self.name] = value
+            return
+        archetype, row = world.locations[obj.handle & INDEX_MASK]
+        archetype.columns[self.name][row] = value
+
+
+class Entity:
+    """
+    Mixin for game objects backed by a World row. Set Component attributes in
+    __init__ as usual; spawn_in() moves them into the archetype's columns.
+    """
+    world = None
+    handle = None
+
+    def spawn_in(self, world, archetype):
+        columns = world.archetypes[archetype].defaults
+        values = {name: self.__dict__.pop(name) for name in columns if name in self.__dict__}
+        self.handle = world.spawn(archetype, self, **values)
+        self.world = world
+        return self.handle
+
+    def release(self, values):
+        """Called by World.despawn: keeps the last component values readable."""
+        self.__dict__.update(values)
+        self.world = None
+
+    def despawn(self):
+        if self.world is not None:
+            self.world.despawn(self.handle)
+
+    def kill(self):
+        self.despawn()
+        super().kill()
@@ -1,7 +1,10 @@
 import pygame
 import sys
+import atexit
 from settings import *
 from core.input_handler import InputHandler
+from core.alloc_tracker import AllocTracker
+from core.overdraw import OverdrawProfiler
 
 class Engine:
     def __init__(self):
@@ -22,6 +25,22 @@ class Engine:
         
         # Core Systems
         self.input_handler = InputHandler()
+
+        # Debug: per-call-site surface allocation counts (F3 toggles the overlay)
+        self.alloc_tracker = None
+        self.show_alloc_overlay = True
+        if DEBUG_ALLOC_TRACKER:
+            self.alloc_tracker = AllocTracker()
+            self.alloc_tracker.install()
+            atexit.register(self.alloc_tracker.dump, ALLOC_REPORT_PATH)
+
+        # Debug: the game draws into a counting offscreen target (F4 toggles the heatmap)
+        self.overdraw = None
+        self.show_overdraw_overlay = True
+        if DEBUG_OVERDRAW:
+            self.overdraw = OverdrawProfiler((WIDTH, HEIGHT))
+            self.overdraw.install()
+            atexit.register(self.overdraw.dump, OVERDRAW_REPORT_PATH)
         
         self.game_state = None 
 
@@ -31,6 +50,7 @@ class Engine:
         while self.running:
             # 1. Delta Time (seconds since last frame)
             dt = self.clock.tick(FPS) / 1000.0
+            if self.alloc_tracker: self.alloc_tracker.begin_frame()
             
             # 2. Event Dispatcher
             self.handle_events()
@@ -42,9 +62,25 @@ class Engine:
                 self.game_state.update(dt, flight_input, combat_input)
             
             # 4. Rendering
-            self.screen.fill(SKY_BLUE) 
+            target = self.overdraw.surface if self.overdraw else self.screen
+            if self.overdraw: self.overdraw.begin_frame()
+
+            # Every scene paints the whole frame, so only clear when there is none
             if self.game_state:
-                self.game_state.draw(self.screen)
+                self.game_state.draw(target)
+            else:
+                target.fill(SKY_BLUE)
+
+            # Close the allocation frame first: the debug overlays are not the game's
+            if self.alloc_tracker: self.alloc_tracker.end_frame()
+
+            if self.overdraw:
+                self.overdraw.end_frame(self.frame_tag())
+                self.screen.blit(target, (0, 0))
+                if self.show_overdraw_overlay: self.overdraw.draw_overlay(self.screen)
+
+            if self.alloc_tracker and self.show_alloc_overlay:
+                self.alloc_tracker.draw_overlay(self.screen)
             
             pygame.display.flip()
 
@@ -55,5 +91,20 @@ class Engine:
                 pygame.quit()
                 sys.exit()
             
+            if self.alloc_tracker and event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_alloc_overlay = not self.show_alloc_overlay
+                continue
+
+            if self.overdraw and event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.show_overdraw_overlay = not self.show_overdraw_overlay
+                continue
+
             if self.game_state:
-                self.game_state.handle_event(event)
\ No newline at end of file
+                self.game_state.handle_event(event)
+
+    def frame_tag(self):
+        """Scene label the overdraw report files this frame under."""
+        if self.game_state and hasattr(self.game_state, "active_scenes"):
+            scenes = self.game_state.active_scenes()
+            return "BOSS" if "BOSS" in scenes else "+".join(sorted(scenes))
+        return "frame"
\ No newline at end of file
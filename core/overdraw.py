@@ -0,0 +1,244 @@
+import pygame
+import os
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_THIS_FILE = os.path.abspath(__file__)
+_PYGAME_DIR = os.path.dirname(os.path.abspath(pygame.__file__))
+
+# Every pygame.draw call in the game returns the rect it touched
+_DRAW_FUNCS = ["rect", "circle", "ellipse", "line", "lines", "polygon", "arc", "aaline", "aalines"]
+
+# Heat ramp: how many times a pixel was written this frame
+HEAT_COLORS = [
+    (0, 0, 0),        # 0 untouched
+    (0, 60, 200),     # 1 written once (ideal)
+    (0, 180, 80),     # 2
+    (230, 220, 0),    # 3
+    (255, 130, 0),    # 4
+    (255, 0, 0),      # 5+
+]
+
+
+def _layer_name():
+    """Names the drawing layer by the object that issued the call: 'ParallaxLayer', 'BlightTitan'."""
+    frame = sys._getframe(2)
+    while frame:
+        path = os.path.abspath(frame.f_code.co_filename)
+        if path != _THIS_FILE and not path.startswith(_PYGAME_DIR):
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return type(owner).__name__
+            return f"{os.path.splitext(os.path.basename(path))[0]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class CountingSurface(pygame.Surface):
+    """Offscreen frame target that reports the rect of every blit/fill to the profiler."""
+    def __init__(self, size, profiler):
+        super().__init__(size)
+        self.profiler = profiler
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        self.profiler.record(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = super().blits(blit_sequence, 1)
+        for rect in rects:
+            self.profiler.record(rect)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = super().fill(color, rect, special_flags)
+        self.profiler.record(rect)
+        return rect
+
+
+class OverdrawProfiler:
+    """
+    Debug-only fill-rate accounting. The game draws into a CountingSurface
+    instead of the display; every blit, fill and pygame.draw call on it adds
+    its clipped rect to a per-pixel write count and to its layer's area total.
+    Enable with DEBUG_OVERDRAW in settings.py.
+    """
+    def __init__(self, size, cell_size=16):
+        self.width, self.height = size
+        self.cell_size = cell_size
+        self.surface = CountingSurface(size, self)
+        self.installed = False
+        self.paused = False
+        self._originals = {}
+
+        # Without numpy, fall back to coarse cells weighted by covered area
+        if np is not None:
+            self.counts = np.zeros((self.height, self.width), dtype=np.uint16)
+            self.last_counts = self.counts.copy()
+        else:
+            self.cols = (self.width + cell_size - 1) // cell_size
+            self.rows = (self.height + cell_size - 1) // cell_size
+            self.counts = [[0.0] * self.cols for _ in range(self.rows)]
+            self.last_counts = [row[:] for row in self.counts]
+
+        self.frame_layers = {}  # layer -> [calls, pixels] for the frame in progress
+        self.last_layers = {}
+        self.totals = {}        # tag -> {layer: [calls, pixels]}
+        self.frames = {}        # tag -> frames counted
+
+    # --- INSTALL / UNINSTALL ---
+
+    def install(self):
+        if self.installed: return
+        profiler = self
+        target = self.surface
+
+        def wrap_draw(fn):
+            def wrapper(surface, *args, **kwargs):
+                rect = fn(surface, *args, **kwargs)
+                if surface is target: profiler.record(rect)
+                return rect
+            return wrapper
+
+        for name in _DRAW_FUNCS:
+            self._originals[name] = getattr(pygame.draw, name)
+            setattr(pygame.draw, name, wrap_draw(self._originals[name]))
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed: return
+        for name, fn in self._originals.items():
+            setattr(pygame.draw, name, fn)
+        self.installed = False
+
+    # --- COUNTING ---
+
+    def record(self, rect):
+        if self.paused or rect is None: return
+        x, y, w, h = rect
+        if w <= 0 or h <= 0: return
+
+        entry = self.frame_layers.setdefault(_layer_name(), [0, 0])
+        entry[0] += 1
+        entry[1] += w * h
+
+        if np is not None:
+            self.counts[y:y + h, x:x + w] += 1
+            return
+
+        cs = self.cell_size
+        cell_area = cs * cs
+        for row in range(y // cs, (y + h - 1) // cs + 1):
+            oy = min(y + h, (row + 1) * cs) - max(y, row * cs)
+            cells = self.counts[row]
+            for col in range(x // cs, (x + w - 1) // cs + 1):
+                ox = min(x + w, (col + 1) * cs) - max(x, col * cs)
+                cells[col] += (ox * oy) / cell_area
+
+    def begin_frame(self):
+        self.frame_layers = {}
+        if np is not None:
+            self.counts.fill(0)
+        else:
+            for row in self.counts:
+                for i in range(len(row)): row[i] = 0.0
+
+    def end_frame(self, tag="frame"):
+        """Closes the frame and files its layer totals under tag (e.g. the active scene)."""
+        self.last_layers = self.frame_layers
+        self.counts, self.last_counts = self.last_counts, self.counts
+
+        totals = self.totals.setdefault(tag, {})
+        for layer, (calls, pixels) in self.frame_layers.items():
+            total = totals.setdefault(layer, [0, 0])
+            total[0] += calls
+            total[1] += pixels
+        self.frames[tag] = self.frames.get(tag, 0) + 1
+
+    def frame_overdraw(self):
+        """Pixels written last frame divided by screen area. 1.0 means every pixel drawn once."""
+        pixels = sum(p for _, p in self.last_layers.values())
+        return pixels / (self.width * self.height)
+
+    def layer_report(self, tag=None):
+        """(layer, calls/frame, screens/frame) sorted by area; last frame if tag is None."""
+        screen_area = self.width * self.height
+        if tag is None:
+            layers, frames = self.last_layers, 1
+        else:
+            layers, frames = self.totals.get(tag, {}), max(1, self.frames.get(tag, 0))
+        rows = [(layer, calls / frames, pixels / frames / screen_area)
+                for layer, (calls, pixels) in layers.items()]
+        rows.sort(key=lambda r: r[2], reverse=True)
+        return rows
+
+    # --- OUTPUT ---
+
+    def _heat_surface(self):
+        """Per-cell heat image at 1/cell_size resolution, coloured by mean write count."""
+        cs = self.cell_size
+        if np is not None:
+            rows, cols = self.height // cs, self.width // cs
+            cells = self.last_counts[:rows * cs, :cols * cs].reshape(rows, cs, cols, cs).mean(axis=(1, 3))
+            levels = np.clip(np.rint(cells), 0, len(HEAT_COLORS) - 1).astype(np.intp)
+            rgb = np.array(HEAT_COLORS, dtype=np.uint8)[levels]
+            surf = pygame.Surface((cols, rows))
+            pygame.surfarray.blit_array(surf, rgb.swapaxes(0, 1))
+            return surf
+
+        surf = pygame.Surface((self.cols, self.rows))
+        for row, cells in enumerate(self.last_counts):
+            for col, value in enumerate(cells):
+                level = min(len(HEAT_COLORS) - 1, int(round(value)))
+                surf.set_at((col, row), HEAT_COLORS[level])
+        return surf
+
+    def draw_overlay(self, screen):
+        self.paused = True
+        try:
+            if not hasattr(self, "_font"):
+                self._font = pygame.font.SysFont("Consolas", 14)
+            # The full-screen heatmap is scaled into one reused surface
+            if not hasattr(self, "_heat"):
+                self._heat = pygame.Surface((self.width, self.height))
+                self._heat.set_alpha(170)
+            pygame.transform.scale(self._heat_surface(), (self.width, self.height), self._heat)
+            screen.blit(self._heat, (0, 0))
+
+            lines = [f"OVERDRAW {self.frame_overdraw():.2f}x screen"]
+            for layer, calls, screens in self.layer_report()[:10]:
+                lines.append(f"{screens:6.2f}x  {int(calls):4d} calls  {layer}")
+
+            y = 4
+            for line in lines:
+                surf = self._font.render(line, True, (255, 255, 255), (0, 0, 0))
+                screen.blit(surf, (self.width - surf.get_width() - 4, y))
+                y += surf.get_height()
+
+            # Legend
+            x = 4
+            for level, color in enumerate(HEAT_COLORS[1:], 1):
+                pygame.draw.rect(screen, color, (x, self.height - 20, 16, 16))
+                label = self._font.render(f"{level}{'+' if level == len(HEAT_COLORS) - 1 else ''}",
+                                          True, (255, 255, 255))
+                screen.blit(label, (x + 20, self.height - 19))
+                x += 48
+        finally:
+            self.paused = False
+
+    def dump(self, path):
+        with open(path, "w") as f:
+            for tag in sorted(self.totals):
+                frames = self.frames.get(tag, 0)
+                rows = self.layer_report(tag)
+                total = sum(r[2] for r in rows)
+                f.write(f"[{tag}] {frames} frames, {total:.2f} screens written per frame\n")
+                f.write(f"{'screens/frame':>13} {'calls/frame':>11}  layer\n")
+                for layer, calls, screens in rows:
+                    f.write(f"{screens:13.3f} {calls:11.1f}  {layer}\n")
+                f.write("\n")
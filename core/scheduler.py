@@ -0,0 +1,177 @@
+import heapq
+import itertools
+
+class Timer:
+    """Handle for a scheduled callback; cancel() stops it from firing (again)."""
+    __slots__ = ("due", "seq", "callback", "args", "interval", "active")
+
+    def __init__(self, due, seq, callback, args, interval):
+        self.due = due
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.interval = interval # None for one-shots; a number or a callable for repeats
+        self.active = True
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def cancel(self):
+        self.active = False
+
+
+# --- COROUTINES ---
+# A script is a generator that yields what it is waiting for. Between yields it
+# costs nothing: the scheduler only resumes it once the wait is over.
+#
+#     def phases(self):
+#         yield until(lambda: self.hp <= self.max_hp * 0.5)
+#         self.enrage()
+#         yield wait(2.0)
+#
+# Yielding None resumes the script on the next tick.
+
+class Wait:
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+class Until:
+    __slots__ = ("condition",)
+
+    def __init__(self, condition):
+        self.condition = condition
+
+def wait(seconds):
+    """Resume after seconds of scheduler time."""
+    return Wait(seconds)
+
+def until(condition):
+    """Resume on the first tick where condition() is true (checked once per tick)."""
+    return Until(condition)
+
+
+class Task:
+    """A running script. cancel() closes the generator wherever it is waiting."""
+    def __init__(self, gen):
+        self.gen = gen
+        self.timer = None
+        self.condition = None
+        self.done = False
+
+    def cancel(self):
+        if self.done: return
+        self.done = True
+        if self.timer: self.timer.cancel()
+        self.gen.close()
+
+
+class Scheduler:
+    """
+    Owns simulated time for a run. Callbacks are kept in a heap by due time,
+    so a tick only touches what is due instead of every countdown polling dt.
+
+    tick(dt) fires due callbacks in time order, with `now` set to each one's
+    due time, so one large step (fast-forward, a fixed-step catch-up) fires a
+    repeating timer as many times as the same time split into frames would.
+    A delay of 0 or less means "on the next tick".
+
+    start() runs a generator script on the same clock (see wait / until).
+    """
+    def __init__(self):
+        self.now = 0.0
+        self.heap = []
+        self.seq = itertools.count()
+        self.ticking = False
+        self.next_tick = [] # zero-delay timers added while firing
+        self.watching = []  # tasks parked on an until() condition
+
+    def _push(self, delay, callback, args, interval):
+        timer = Timer(self.now + max(0.0, delay), next(self.seq), callback, args, interval)
+        if delay <= 0 and self.ticking: self.next_tick.append(timer)
+        else: heapq.heappush(self.heap, timer)
+        return timer
+
+    def after(self, delay, callback, *args):
+        """Calls callback(*args) once, delay seconds from now."""
+        return self._push(delay, callback, args, None)
+
+    def every(self, interval, callback, *args, delay=None):
+        """
+        Calls callback(*args) every interval seconds, the first time after delay
+        (default: one interval). interval may be a callable returning the next
+        delay (for delays that follow difficulty or chance); a callback that
+        returns a number overrides the next delay once, e.g. 0 to retry next tick.
+        """
+        if delay is None: delay = interval() if callable(interval) else interval
+        return self._push(delay, callback, args, interval)
+
+    def start(self, gen):
+        """Runs gen up to its first yield now, then whenever its wait is over."""
+        task = Task(gen)
+        self._resume(task)
+        return task
+
+    def _resume(self, task):
+        while not task.done:
+            try:
+                cmd = next(task.gen)
+            except StopIteration:
+                task.done = True
+                return
+            if isinstance(cmd, Until):
+                if cmd.condition(): continue # Already true: carry straight on
+                task.condition = cmd.condition
+                self.watching.append(task)
+            else:
+                delay = cmd.seconds if isinstance(cmd, Wait) else 0
+                task.timer = self.after(delay, self._resume, task)
+            return
+
+    def remaining(self, timer):
+        return max(0.0, timer.due - self.now) if timer.active else 0.0
+
+    def tick(self, dt):
+        target = self.now + dt
+        heap = self.heap
+        self.ticking = True
+        while heap and heap[0].due <= target:
+            timer = heapq.heappop(heap)
+            if not timer.active: continue
+            self.now = timer.due
+            result = timer.callback(*timer.args)
+            if timer.interval is None or not timer.active:
+                timer.active = False
+                continue
+            # Repeats reuse their handle, so a cancel() from outside still works
+            if isinstance(result, (int, float)) and not isinstance(result, bool):
+                delay = result
+            else:
+                delay = timer.interval() if callable(timer.interval) else timer.interval
+            timer.due = self.now + max(0.0, delay)
+            timer.seq = next(self.seq)
+            if delay <= 0: self.next_tick.append(timer)
+            else: heapq.heappush(heap, timer)
+        self.now = target
+        self.ticking = False
+        for timer in self.next_tick:
+            timer.due = target
+            heapq.heappush(heap, timer)
+        self.next_tick = []
+
+        if self.watching:
+            waiting, self.watching = self.watching, []
+            for task in waiting:
+                if task.done: continue
+                if task.condition():
+                    task.condition = None
+                    self._resume(task)
+                else:
+                    self.watching.append(task)
+
+    def clear(self):
+        for timer in self.heap: timer.active = False
+        self.heap = []
+        self.next_tick = []
+        self.watching = []
@@ -0,0 +1,37 @@
+import pygame
+from managers.asset_manager import get_asset_manager
+
+# --- SHARED STAMPS ---
+# Small pre-drawn shapes for particles and glows. Effects used to allocate a
+# fresh SRCALPHA surface and draw into it every frame; a stamp is drawn once per
+# (shape, size, colour) and then only blitted. Stamps live for the whole session.
+
+def disc(size, color, alpha=255):
+    """size x size surface holding a filled circle of diameter size."""
+    size = max(1, int(size))
+    key = ("stamp_disc", size, tuple(color[:3]), alpha)
+    def build():
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color[:3], alpha), (size / 2, size / 2), size / 2)
+        return surf
+    return get_asset_manager().baked(key, build)
+
+
+def ellipse(width, height, color, alpha=255):
+    """width x height surface holding a filled ellipse."""
+    key = ("stamp_ellipse", int(width), int(height), tuple(color[:3]), alpha)
+    def build():
+        surf = pygame.Surface((int(width), int(height)), pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, (*color[:3], alpha), (0, 0, int(width), int(height)))
+        return surf
+    return get_asset_manager().baked(key, build)
+
+
+def rect(width, height, color, alpha=255):
+    """width x height surface filled with one translucent colour."""
+    key = ("stamp_rect", int(width), int(height), tuple(color[:3]), alpha)
+    def build():
+        surf = pygame.Surface((int(width), int(height)), pygame.SRCALPHA)
+        surf.fill((*color[:3], alpha))
+        return surf
+    return get_asset_manager().baked(key, build)
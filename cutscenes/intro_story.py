@@ -2,10 +2,13 @@ import pygame
 import random
 import math
 from settings import WIDTH, HEIGHT, WHITE
+from core.scheduler import Scheduler, wait, until
+
+# Words that set off lore effects once they have been typed out
+TRIGGER_WORDS = ["Indigo", "Golden", "SKYFALL"]
 
 class IntroCutscene:
-    def __init__(self, screen):
-        self.screen = screen
+    def __init__(self):
         self.font = pygame.font.SysFont("Georgia", 26, italic=True)
         self.active = True
         
@@ -26,10 +29,8 @@ class IntroCutscene:
         ]
         
         self.current_line = 0
-        self.displayed_text = ""
         self.char_index = 0
         self.type_speed = 0.06  
-        self.type_timer = 0
         
         # Visual State
         self.color_progress = 0.0
@@ -40,10 +41,10 @@ class IntroCutscene:
         self.is_fading_out = False
         
         # Astral/Lore effects
-        self.glitch_timer = 0
         self.is_glitching = False
         self.indigo_flash = 0 
         self.gold_glow = 0    
+        self.held = set() # Flashes held at full strength while their line is up
 
         try:
             pygame.mixer.music.load("assets/sfx/cutscene_theme.mp3")
@@ -59,47 +60,101 @@ class IntroCutscene:
         self.black_bar_height = 0
         self.target_bar_height = HEIGHT // 5
 
+        # Character count at which each trigger word is fully typed, per line
+        self.triggers = [{word: line.index(word) + len(word) for word in TRIGGER_WORDS if word in line}
+                         for line in self.script]
+        self.line_cache = {} # (line, glitching) -> (text, shadow, prefix widths)
+
+        # Full-screen overlays, filled once and faded with set_alpha
+        self.indigo_surf = self.make_overlay((100, 0, 255))
+        self.gold_surf = self.make_overlay((255, 200, 0))
+        self.fade_surf = self.make_overlay((0, 0, 0))
+
+        # Typewriter, lore flashes, glitch and the exit fade are scripts on the
+        # cutscene's own clock; they sleep until their next beat
+        self.clock = Scheduler()
+        self.clock.start(self.typewriter())
+        self.clock.start(self.lore_flash("Indigo", "indigo_flash", 120))
+        self.clock.start(self.lore_flash("Golden", "gold_glow", 80))
+        self.clock.start(self.glitch())
+
+    def make_overlay(self, color):
+        surf = pygame.Surface((WIDTH, HEIGHT))
+        surf.fill(color)
+        return surf
+
+    def line_surfaces(self, index, glitching):
+        """A script line rendered once with its shadow, plus the pixel width of every typed prefix."""
+        key = (index, glitching)
+        if key not in self.line_cache:
+            line = self.script[index]
+            text_color = (0, 255, 240) if glitching else (235, 235, 245)
+            text_surf = self.font.render(line, True, text_color)
+            shadow = self.font.render(line, True, (15, 15, 25))
+            widths = [self.font.size(line[:k])[0] for k in range(len(line) + 1)]
+            self.line_cache[key] = (text_surf, shadow, widths)
+        return self.line_cache[key]
+
+    def typed(self, word):
+        """True once word has been typed on the current line."""
+        if self.current_line >= len(self.script): return False
+        trigger = self.triggers[self.current_line].get(word)
+        return trigger is not None and self.char_index >= trigger
+
+    # --- SCRIPTS ---
+
+    def line_done(self):
+        return self.char_index >= len(self.script[self.current_line])
+
+    def typewriter(self):
+        while not self.is_fading_out:
+            if self.line_done():
+                # Sleep until the player moves on to the next line
+                yield until(lambda: self.is_fading_out or not self.line_done())
+                continue
+            yield wait(self.type_speed)
+            if not self.is_fading_out and not self.line_done():
+                self.char_index += 1
+
+    def lore_flash(self, word, attr, strength):
+        yield until(lambda: self.typed(word))
+        setattr(self, attr, strength)
+        self.held.add(attr)
+        yield until(lambda: not self.typed(word))
+        self.held.discard(attr)
+
+    def glitch(self):
+        # Sequel Teaser Glitch
+        yield until(lambda: self.typed("SKYFALL"))
+        while self.typed("SKYFALL"):
+            self.is_glitching = not self.is_glitching
+            yield wait(0.08)
+
+    def fade_out(self):
+        start = self.clock.now
+        while self.fade_alpha < 255:
+            yield # Every tick
+            self.fade_alpha = min(255, (self.clock.now - start) * 250)
+        self.active = False
+
     def update(self, dt):
         if not self.active: return
 
-        if self.is_fading_out:
-            self.fade_alpha += 250 * dt
-            if self.fade_alpha >= 255:
-                self.active = False
-            return
+        self.clock.tick(dt)
+        if self.is_fading_out: return
 
         # Background color transition
         target_progress = self.current_line / (len(self.script) - 1)
         self.color_progress += (target_progress - self.color_progress) * dt * 0.3
         self.current_sky_color = self.start_color.lerp(self.end_color, min(self.color_progress, 1.0))
 
-        # Trigger flashes based on text content
-        if "Indigo" in self.displayed_text: self.indigo_flash = 120
-        if "Golden" in self.displayed_text: self.gold_glow = 80
-        
-        # Decay flashes
-        if self.indigo_flash > 0: self.indigo_flash -= 150 * dt
-        if self.gold_glow > 0: self.gold_glow -= 100 * dt
+        # Decay flashes once their line has gone
+        if self.indigo_flash > 0 and "indigo_flash" not in self.held: self.indigo_flash -= 150 * dt
+        if self.gold_glow > 0 and "gold_glow" not in self.held: self.gold_glow -= 100 * dt
 
         if self.black_bar_height < self.target_bar_height:
             self.black_bar_height += 80 * dt
 
-        # Typewriter Logic
-        if self.current_line < len(self.script):
-            self.type_timer += dt
-            if self.type_timer >= self.type_speed:
-                if self.char_index < len(self.script[self.current_line]):
-                    self.displayed_text += self.script[self.current_line][self.char_index]
-                    self.char_index += 1
-                    self.type_timer = 0
-
-        # Sequel Teaser Glitch
-        if "SKYFALL" in self.displayed_text:
-            self.glitch_timer += dt
-            if self.glitch_timer > 0.08:
-                self.is_glitching = not self.is_glitching
-                self.glitch_timer = 0
-
         for p in self.particles:
             p["pos"][1] += p["vel"][1]
             if p["pos"][1] < 0: p["pos"][1] = HEIGHT
@@ -112,7 +167,6 @@ class IntroCutscene:
             if event.key in [pygame.K_SPACE, pygame.K_RETURN]:
                 if self.char_index < len(self.script[self.current_line]):
                     # Finish typing the current line
-                    self.displayed_text = self.script[self.current_line]
                     self.char_index = len(self.script[self.current_line])
                 else:
                     # Move to next line
@@ -120,51 +174,46 @@ class IntroCutscene:
                     if self.current_line >= len(self.script):
                         self.start_exit_sequence()
                     else:
-                        self.displayed_text = ""
                         self.char_index = 0
 
     def start_exit_sequence(self):
         self.is_fading_out = True
+        self.clock.start(self.fade_out())
         pygame.mixer.music.fadeout(2000)
 
-    def draw(self):
-        self.screen.fill(self.current_sky_color)
+    def draw(self, screen):
+        screen.fill(self.current_sky_color)
         
         # Draw Lore Flashes
         if self.indigo_flash > 0:
-            s = pygame.Surface((WIDTH, HEIGHT))
-            s.fill((100, 0, 255))
-            s.set_alpha(int(self.indigo_flash))
-            self.screen.blit(s, (0,0))
+            self.indigo_surf.set_alpha(int(self.indigo_flash))
+            screen.blit(self.indigo_surf, (0,0))
         if self.gold_glow > 0:
-            s = pygame.Surface((WIDTH, HEIGHT))
-            s.fill((255, 200, 0))
-            s.set_alpha(int(self.gold_glow))
-            self.screen.blit(s, (0,0))
+            self.gold_surf.set_alpha(int(self.gold_glow))
+            screen.blit(self.gold_surf, (0,0))
 
         for p in self.particles:
-            pygame.draw.circle(self.screen, (200, 200, 255, 100), (int(p["pos"][0]), int(p["pos"][1])), p["size"])
+            pygame.draw.circle(screen, (200, 200, 255, 100), (int(p["pos"][0]), int(p["pos"][1])), p["size"])
 
         # Cinema Bars
-        pygame.draw.rect(self.screen, (0, 0, 0), (0, 0, WIDTH, int(self.black_bar_height)))
-        pygame.draw.rect(self.screen, (0, 0, 0), (0, HEIGHT - int(self.black_bar_height), WIDTH, int(self.black_bar_height)))
+        pygame.draw.rect(screen, (0, 0, 0), (0, 0, WIDTH, int(self.black_bar_height)))
+        pygame.draw.rect(screen, (0, 0, 0), (0, HEIGHT - int(self.black_bar_height), WIDTH, int(self.black_bar_height)))
 
         # Text Rendering
         if self.current_line < len(self.script) and not self.is_fading_out:
-            text_color = (0, 255, 240) if self.is_glitching else (235, 235, 245)
             offset = random.randint(-2, 2) if self.is_glitching else 0
-            
-            text_surf = self.font.render(self.displayed_text, True, text_color)
-            text_rect = text_surf.get_rect(center=(WIDTH // 2 + offset, HEIGHT // 2))
-            
+            text_surf, shadow, widths = self.line_surfaces(self.current_line, self.is_glitching)
+
+            # Typewriter: show only the typed prefix, kept centred as it grows
+            reveal = pygame.Rect(0, 0, widths[self.char_index], text_surf.get_height())
+            text_rect = reveal.copy()
+            text_rect.center = (WIDTH // 2 + offset, HEIGHT // 2)
+
             # Shadow
-            shadow = self.font.render(self.displayed_text, True, (15, 15, 25))
-            self.screen.blit(shadow, (text_rect.x + 2, text_rect.y + 2))
-            self.screen.blit(text_surf, text_rect)
+            screen.blit(shadow, (text_rect.x + 2, text_rect.y + 2), reveal)
+            screen.blit(text_surf, text_rect, reveal)
 
         # Fade to Black
         if self.fade_alpha > 0:
-            fade_surf = pygame.Surface((WIDTH, HEIGHT))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(int(self.fade_alpha))
-            self.screen.blit(fade_surf, (0, 0))
\ No newline at end of file
+            self.fade_surf.set_alpha(int(self.fade_alpha))
+            screen.blit(self.fade_surf, (0, 0))
\ No newline at end of file
@@ -0,0 +1,58 @@
+import math
+from core.ecs import np
+from entities.projectiles import ENEMY_BULLET_SPEED, ENEMY_BULLET_SIZE
+
+# --- BULLET PATTERNS ---
+# A pattern is a set of firing angles compiled once into velocity tables. A
+# volley looks up the table for its rotation (whole degrees, built on first
+# use) and writes every bullet into the "enemy_bullet" archetype in one batch,
+# so a denser ring costs the same Python work as a single shot.
+#
+# A spiral is a ring fired with a rotation that advances every volley; an
+# aimed spread is a fan rotated toward the target with aim().
+
+class BulletPattern:
+    def __init__(self, angles, speed=ENEMY_BULLET_SPEED):
+        self.angles = list(angles)
+        self.count = len(self.angles)
+        self.speed = speed
+        self.tables = {} # rotation in degrees -> (vx, vy)
+
+    def velocities(self, rotation):
+        key = int(round(rotation)) % 360
+        table = self.tables.get(key)
+        if table is None:
+            rads = [math.radians(a + key) for a in self.angles]
+            vx = [math.cos(r) * self.speed for r in rads]
+            vy = [math.sin(r) * self.speed for r in rads]
+            if np is not None: vx, vy = np.array(vx), np.array(vy)
+            table = self.tables[key] = (vx, vy)
+        return table
+
+    def emit(self, world, x, y, rotation=0.0):
+        """Fires the pattern from (x, y), turned by rotation degrees."""
+        vx, vy = self.velocities(rotation)
+        return world.spawn_batch("enemy_bullet", self.count, x=x, y=y, vx=vx, vy=vy,
+                                 half_w=ENEMY_BULLET_SIZE, half_h=ENEMY_BULLET_SIZE)
+
+
+def ring(count, speed=ENEMY_BULLET_SPEED):
+    """count bullets evenly around a full circle."""
+    return BulletPattern([i * 360 / count for i in range(count)], speed)
+
+def fan(count, spread, speed=ENEMY_BULLET_SPEED):
+    """count bullets across spread degrees, centred on angle 0."""
+    if count == 1: return BulletPattern([0.0], speed)
+    return BulletPattern([-spread / 2 + i * spread / (count - 1) for i in range(count)], speed)
+
+def spiral(arms, speed=ENEMY_BULLET_SPEED):
+    """A ring whose rotation the shooter advances each volley."""
+    return ring(arms, speed)
+
+def aimed_spread(offsets, speed=ENEMY_BULLET_SPEED):
+    """Bullets at the given angle offsets from the aim direction."""
+    return BulletPattern(offsets, speed)
+
+def aim(origin, target):
+    """Rotation in degrees that points angle 0 of a pattern from origin at target."""
+    return math.degrees(math.atan2(target[1] - origin[1], target[0] - origin[0]))
@@ -2,14 +2,111 @@ import pygame
 import random
 import math
 from settings import WIDTH, HEIGHT
+from systems.sfx_bank import get_cue
+from managers.asset_manager import get_asset_manager, PLAYING
+from core import stamps
+from core.ecs import Entity, Component
+from systems.entity_systems import lifetime_system
+
+ALPHA_STEP = 16 # Fading particles reuse stamps in 16-alpha buckets
+
+class CompanionFX:
+    """
+    Pre-rendered companion effects. Rings, shields and glows are drawn once per
+    pulse level / rotation step and then only blitted, so having every companion
+    out costs a handful of blits instead of a dozen fresh surfaces per frame.
+    """
+    PULSE_STEPS = 8  # Sine pulses are baked at 9 levels between low and high
+    RUNE_FRAMES = 16 # Cici's 8 runes repeat every 45 degrees
+
+    def __init__(self):
+        self.assets = get_asset_manager()
+
+    def _baked(self, key, builder):
+        return self.assets.baked(("companion_fx",) + key, builder, [PLAYING])
+
+    def _level(self, wave):
+        """Maps a -1..1 sine to its baked pulse level."""
+        return int(round((wave + 1) * 0.5 * self.PULSE_STEPS))
+
+    def shield(self, wave):
+        level = self._level(wave)
+        def build():
+            alpha = int(20 + (level / self.PULSE_STEPS) * 20)
+            shield_surf = pygame.Surface((250, 250), pygame.SRCALPHA)
+            pygame.draw.circle(shield_surf, (75, 0, 130, alpha), (125, 125), 110)
+            pygame.draw.circle(shield_surf, (150, 100, 255, 80), (125, 125), 110, 2)
+            return shield_surf
+        return self._baked(("shield", level), build)
+
+    def rune_circle(self, rotation):
+        step = 45 / self.RUNE_FRAMES
+        frame = int((rotation % 45) / step)
+        def build():
+            circle_surf = pygame.Surface((120, 120), pygame.SRCALPHA)
+            pygame.draw.circle(circle_surf, (255, 215, 0, 40), (60, 60), 55, 2)
+            for i in range(8):
+                angle = math.radians(frame * step + (i * 45))
+                tx, ty = 60 + math.cos(angle)*55, 60 + math.sin(angle)*55
+                pygame.draw.circle(circle_surf, (255, 255, 150, 100), (int(tx), int(ty)), 3)
+            return circle_surf
+        return self._baked(("rune_circle", frame), build)
+
+    def heal_glow(self, size):
+        # The player's rect breathes with tilt, so sizes are bucketed to 4px.
+        # It is blitted with BLEND_RGB_ADD, which ignores per-pixel alpha, so
+        # the old alpha pulse never showed and one frame per size is enough.
+        size = max(4, (size // 4) * 4)
+        def build():
+            glow_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.ellipse(glow_surf, (40, 80, 200, 255), glow_surf.get_rect())
+            return glow_surf
+        return self._baked(("heal_glow", size), build)
+
+    def burst_ring(self, radius, alpha):
+        """Expanding ring bucketed to 4px radii; fades via surface alpha."""
+        radius = max(3, (int(radius) // 4) * 4)
+        def build():
+            s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (255, 215, 0, 255), (radius, radius), radius, 3)
+            return s
+        ring = self._baked(("burst_ring", radius), build)
+        ring.set_alpha(max(0, int(alpha)))
+        return ring
+
+    def flash(self, radius, alpha):
+        def build():
+            flash_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(flash_surf, (255, 255, 255, 255), (radius, radius), radius)
+            return flash_surf
+        flash_surf = self._baked(("flash", radius), build)
+        flash_surf.set_alpha(max(0, alpha))
+        return flash_surf
+
+
+_fx = None
+
+def get_companion_fx():
+    global _fx
+    if _fx is None:
+        _fx = CompanionFX()
+    return _fx
+
+class Companion(Entity, pygame.sprite.Sprite):
+    kind = None     # Pickup name; one companion of each kind at a time
+    shields = False # Holds the player's invincibility while out
+
+    # "companion" archetype: position plus the lifetime counted down by lifetime_system
+    x = Component()
+    y = Component()
+    life = Component()
 
-class Companion(pygame.sprite.Sprite):
     def __init__(self, huey, side="TOP"):
         super().__init__()
         self.huey = huey
         self.side = side
-        self.life_timer = 12.0  
-        self.pos = pygame.Vector2(huey.rect.center)
+        self.life = 12.0  
+        self.x, self.y = huey.rect.center
         self.hover_angle = random.uniform(0, math.pi * 2)
         
         # Animation Variables
@@ -20,18 +117,19 @@ class Companion(pygame.sprite.Sprite):
         
         # Effect rotation for visual flares
         self.effect_rotation = 0
+        self.fx = get_companion_fx()
+        self.timer = None # Scheduled attack, if the companion has one
+
+    def start(self, scheduler, targeting):
+        """Registers timed behaviour once the companion is summoned."""
+        pass
+
+    def expire(self):
+        """Cleanup when lifetime_system retires the companion."""
+        if self.timer: self.timer.cancel()
 
     def update_behavior(self, dt):
-        self.life_timer -= dt
         self.effect_rotation += 180 * dt # Rotate 180 degrees per sec
-        
-        # Cleanup logic
-        if self.life_timer <= 0:
-            if isinstance(self, Tine) and hasattr(self.huey, 'is_invincible'):
-                self.huey.is_invincible = False
-            if isinstance(self, Cici) and hasattr(self.huey, 'heat_system'):
-                self.huey.heat_system.apply_cici_boost(False)
-            self.kill()
 
         # Follow distance logic
         offset_x = -80 
@@ -44,52 +142,51 @@ class Companion(pygame.sprite.Sprite):
         
         self.hover_angle += 3 * dt
         target.y += math.sin(self.hover_angle) * 20
-        self.pos += (target - self.pos) * 5 * dt
-        self.rect.center = self.pos
+        self.x += (target.x - self.x) * 5 * dt
+        self.y += (target.y - self.y) * 5 * dt
+        self.rect.center = (self.x, self.y)
 
     def draw_circular_flash(self, screen):
         """Visual feedback when the companion is about to expire."""
-        if self.life_timer < 1.0:
-            alpha = int(self.life_timer * 255) 
+        if self.life < 1.0:
+            alpha = int(self.life * 255) 
             radius = int(self.rect.width * 0.8)
-            flash_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(flash_surf, (255, 255, 255, alpha), (radius, radius), radius)
+            flash_surf = self.fx.flash(radius, alpha)
             screen.blit(flash_surf, flash_surf.get_rect(center=self.rect.center))
 
 class Red(Companion):
+    kind = "RED"
+
     def __init__(self, huey):
         super().__init__(huey, "TOP")
         try:
-            self.image = pygame.image.load("assets/sprites/companions/red_mount.png").convert_alpha()
+            self.image = get_asset_manager().image("assets/sprites/companions/red_mount.png", [PLAYING])
         except:
             self.image = pygame.Surface((60, 50), pygame.SRCALPHA)
             pygame.draw.rect(self.image, (200, 50, 50), (0, 10, 60, 30))
             
-        try:
-            self.shoot_sfx = pygame.mixer.Sound("assets/sfx/Red_Laser.mp3")
-            self.shoot_sfx.set_volume(0.25)
-        except:
-            self.shoot_sfx = None
+        self.shoot_sfx = get_cue("red_railgun")
         
         self.rect = self.image.get_rect()
-        self.attack_cooldown = 0
         self.lasers = []
 
-    def update(self, dt, enemies):
+    def start(self, scheduler, targeting):
+        # Fires straight away, then every 0.8s while there is something to shoot
+        self.timer = scheduler.every(0.8, self.attack, targeting, delay=0)
+
+    def update(self, dt, targeting):
         self.update_behavior(dt)
-        self.attack_cooldown -= dt
         self.lasers = [l for l in self.lasers if l['life'] > 0]
         for l in self.lasers: l['life'] -= dt
 
-        if self.attack_cooldown <= 0:
-            target = self.find_target(enemies)
-            if target:
-                self.fire_railgun(target)
-                self.attack_cooldown = 0.8 
+    def attack(self, targeting):
+        target = self.find_target(targeting)
+        if not target: return 0 # Nothing visible: look again next tick
+        self.fire_railgun(target)
 
-    def find_target(self, enemies):
-        visible = [e for e in enemies if 50 < e.rect.x < WIDTH]
-        return min(visible, key=lambda e: e.rect.x) if visible else None
+    def find_target(self, targeting):
+        # Leftmost enemy that has come on screen
+        return targeting.leftmost(50, WIDTH)
 
     def fire_railgun(self, target):
         self.lasers.append({'start': self.rect.center, 'end': target.rect.center, 'life': 0.2})
@@ -105,8 +202,7 @@ class Red(Companion):
             core_pos = (self.rect.centerx + off_x, self.rect.centery + off_y)
             pygame.draw.circle(screen, (255, 50, 50), core_pos, 6)
             pygame.draw.circle(screen, (255, 255, 255), core_pos, 3) 
-            s = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.circle(s, (200, 0, 0, 100), (10, 10), 10)
+            s = stamps.disc(20, (200, 0, 0), 100)
             screen.blit(s, s.get_rect(center=core_pos), special_flags=pygame.BLEND_RGB_ADD)
 
         for laser in self.lasers:
@@ -118,11 +214,15 @@ class Red(Companion):
         self.draw_circular_flash(screen)
 
 class Tine(Companion):
+    kind = "TINE"
+    shields = True
+
     def __init__(self, huey):
         super().__init__(huey, "BOTTOM")
         try:
-            self.frame1 = pygame.image.load("assets/sprites/companions/tine_witch.png").convert_alpha()
-            self.frame2 = pygame.image.load("assets/sprites/companions/tine_witchframe1.png").convert_alpha()
+            assets = get_asset_manager()
+            self.frame1 = assets.image("assets/sprites/companions/tine_witch.png", [PLAYING])
+            self.frame2 = assets.image("assets/sprites/companions/tine_witchframe1.png", [PLAYING])
             self.image = self.frame1
         except:
             self.frame1 = pygame.Surface((50, 50), pygame.SRCALPHA)
@@ -131,24 +231,21 @@ class Tine(Companion):
             self.image = self.frame1
 
         try:
-            self.bolt_img = pygame.image.load("assets/sprites/effects/lightning_bolt.png").convert_alpha()
-            self.bolt_img = pygame.transform.scale(self.bolt_img, (40, 80)) 
+            self.bolt_img = get_asset_manager().image("assets/sprites/effects/lightning_bolt.png", [PLAYING], size=(40, 80))
         except: self.bolt_img = None
 
-        try:
-            self.zap_sfx = pygame.mixer.Sound("assets/sfx/tine_lightning.mp3")
-            self.zap_sfx.set_volume(0.2)
-        except: self.zap_sfx = None
+        self.zap_sfx = get_cue("tine_zap")
 
         self.rect = self.image.get_rect()
-        self.zap_timer = 0
         self.active_zaps = [] 
         self.aura_particles = [] 
 
-    def update(self, dt, enemies):
+    def start(self, scheduler, targeting):
+        self.timer = scheduler.every(0.5, self.zap, targeting)
+
+    def update(self, dt, targeting):
         self.update_behavior(dt)
         self.animate(dt)
-        self.zap_timer += dt
         self.huey.is_invincible = True
         
         if random.random() < 0.4:
@@ -170,12 +267,15 @@ class Tine(Companion):
         self.active_zaps = [z for z in self.active_zaps if z['life'] > 0]
         for z in self.active_zaps: z['life'] -= dt
 
-        if self.zap_timer > 0.5:
-            potential_targets = [e for e in enemies if pygame.Vector2(self.rect.center).distance_to(e.rect.center) < 700]
-            if potential_targets:
-                primary = min(potential_targets, key=lambda e: pygame.Vector2(self.rect.center).distance_to(e.rect.center))
-                self.perform_chain_zap(primary, enemies)
-                self.zap_timer = 0
+    def zap(self, targeting):
+        primary = targeting.nearest(self.rect.center, 700)
+        if not primary: return 0 # Keep charged until something comes in range
+        self.perform_chain_zap(primary, targeting)
+
+    def expire(self):
+        super().expire()
+        if hasattr(self.huey, 'is_invincible'):
+            self.huey.is_invincible = False
 
     def animate(self, dt):
         self.anim_timer += dt
@@ -187,11 +287,11 @@ class Tine(Companion):
                 self.is_blinking, self.anim_timer, self.image = False, 0, self.frame1
                 self.next_blink_time = random.uniform(2.0, 6.0)
 
-    def perform_chain_zap(self, target, all_enemies):
+    def perform_chain_zap(self, target, targeting):
         if hasattr(target, 'take_damage'):
             target.take_damage(35)
             self.create_zap_visual(pygame.Vector2(self.rect.center), pygame.Vector2(target.rect.center), target.rect.center)
-            chain_target = next((e for e in all_enemies if e != target and pygame.Vector2(target.rect.center).distance_to(e.rect.center) < 250), None)
+            chain_target = targeting.nearest(target.rect.center, 250, exclude=target)
             if chain_target:
                 chain_target.take_damage(15) 
                 self.create_zap_visual(pygame.Vector2(target.rect.center), pygame.Vector2(chain_target.rect.center), chain_target.rect.center)
@@ -207,16 +307,13 @@ class Tine(Companion):
     def draw(self, screen):
         for p in self.aura_particles:
             alpha = max(0, min(255, int(p['life'] * 255)))
-            draw_pos = self.pos + p['rel_pos']
-            glow = pygame.Surface((p['size']*4, p['size']*4), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (*p['color'], alpha // 2), (p['size']*2, p['size']*2), p['size']*2)
+            draw_pos = (self.x + p['rel_pos'].x, self.y + p['rel_pos'].y)
+            # Additive blits ignore per-pixel alpha, one glow per size/colour is enough
+            glow = stamps.disc(p['size']*4, p['color'])
             screen.blit(glow, glow.get_rect(center=draw_pos), special_flags=pygame.BLEND_RGB_ADD)
             pygame.draw.circle(screen, (*p['color'], alpha), draw_pos, p['size'])
 
-        shield_surf = pygame.Surface((250, 250), pygame.SRCALPHA)
-        pulse = 30 + math.sin(pygame.time.get_ticks() * 0.01) * 10
-        pygame.draw.circle(shield_surf, (75, 0, 130, int(pulse)), (125, 125), 110)
-        pygame.draw.circle(shield_surf, (150, 100, 255, 80), (125, 125), 110, 2)
+        shield_surf = self.fx.shield(math.sin(pygame.time.get_ticks() * 0.01))
         screen.blit(shield_surf, shield_surf.get_rect(center=self.huey.rect.center))
 
         for zap in self.active_zaps:
@@ -228,12 +325,15 @@ class Tine(Companion):
         self.draw_circular_flash(screen)
 
 class Cici(Companion):
+    kind = "CICI"
+
     def __init__(self, huey):
         super().__init__(huey, "BACK")
-        self.life_timer = 10.0  
+        self.life = 10.0  
         try:
-            self.frame1 = pygame.image.load("assets/sprites/companions/cici.png").convert_alpha()
-            self.frame2 = pygame.image.load("assets/sprites/companions/cici_frame1.png").convert_alpha()
+            assets = get_asset_manager()
+            self.frame1 = assets.image("assets/sprites/companions/cici.png", [PLAYING])
+            self.frame2 = assets.image("assets/sprites/companions/cici_frame1.png", [PLAYING])
             self.image = self.frame1
         except:
             self.frame1 = pygame.Surface((45, 60), pygame.SRCALPHA)
@@ -250,7 +350,7 @@ class Cici(Companion):
         if hasattr(self.huey, 'heat_system'):
             self.huey.heat_system.apply_cici_boost(True)
 
-    def update(self, dt, enemies):
+    def update(self, dt, targeting):
         self.update_behavior(dt)
         self.animate(dt)
         
@@ -266,7 +366,7 @@ class Cici(Companion):
         
         # Defensive Burst if player takes damage
         if self.huey.health < self.last_huey_hp: 
-            self.trigger_heal_burst(enemies)
+            self.trigger_heal_burst(targeting)
             
         self.last_huey_hp = self.huey.health
         self.update_visual_effects(dt)
@@ -298,77 +398,75 @@ class Cici(Companion):
         self.particles = [p for p in self.particles if p['life'] > 0]
         if random.random() < 0.2: self.spawn_particle(self.rect.center, (255, 230, 100))
 
-    def trigger_heal_burst(self, enemies):
+    def trigger_heal_burst(self, targeting):
         self.burst_visuals.append({'radius': 10, 'alpha': 200})
         for _ in range(20): self.spawn_particle(self.huey.rect.center, (255, 255, 100))
-        for e in enemies:
-            if pygame.Vector2(self.huey.rect.center).distance_to(e.rect.center) < 250:
-                if hasattr(e, 'take_damage'): e.take_damage(20)
+        for e in targeting.within(self.huey.rect.center, 250):
+            if hasattr(e, 'take_damage'): e.take_damage(20)
 
     def draw(self, screen):
-        circle_surf = pygame.Surface((120, 120), pygame.SRCALPHA)
-        pygame.draw.circle(circle_surf, (255, 215, 0, 40), (60, 60), 55, 2)
-        for i in range(8):
-            angle = math.radians(self.effect_rotation + (i * 45))
-            tx, ty = 60 + math.cos(angle)*55, 60 + math.sin(angle)*55
-            pygame.draw.circle(circle_surf, (255, 255, 150, 100), (int(tx), int(ty)), 3)
+        circle_surf = self.fx.rune_circle(self.effect_rotation)
         screen.blit(circle_surf, circle_surf.get_rect(center=self.rect.center))
 
         glow_size = int(self.huey.rect.width * 2.8)
-        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-        pulse = 15 + math.sin(pygame.time.get_ticks() * 0.005) * 8
-        pygame.draw.ellipse(glow_surf, (40, 80, 200, int(pulse)), glow_surf.get_rect())
+        glow_surf = self.fx.heal_glow(glow_size)
         screen.blit(glow_surf, glow_surf.get_rect(center=self.huey.rect.center), special_flags=pygame.BLEND_RGB_ADD)
 
         for p in self.particles:
             alpha = max(0, min(255, int(p['life'] * 255)))
-            p_surf = pygame.Surface((p['size']*2, p['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(p_surf, (*p['color'], alpha), (p['size'], p['size']), p['size'])
+            p_surf = stamps.disc(p['size']*2, p['color'], (alpha // ALPHA_STEP) * ALPHA_STEP)
             screen.blit(p_surf, p['pos'])
 
         for b in self.burst_visuals:
-            s = pygame.Surface((int(b['radius']*2), int(b['radius']*2)), pygame.SRCALPHA)
-            pygame.draw.circle(s, (255, 215, 0, max(0, int(b['alpha']))), (int(b['radius']), int(b['radius'])), int(b['radius']), 3)
+            s = self.fx.burst_ring(b['radius'], b['alpha'])
             screen.blit(s, s.get_rect(center=self.huey.rect.center))
 
         screen.blit(self.image, self.rect)
         self.draw_circular_flash(screen)
 
+    def expire(self):
+        super().expire()
+        if hasattr(self.huey, 'heat_system'):
+            self.huey.heat_system.apply_cici_boost(False)
+
     def update_behavior(self, dt):
         """Cici hovers behind the player."""
-        self.life_timer -= dt
         self.effect_rotation += 180 * dt
-        
-        if self.life_timer <= 0:
-            if hasattr(self.huey, 'heat_system'):
-                self.huey.heat_system.apply_cici_boost(False)
-            self.kill()
 
-        target = pygame.Vector2(self.huey.rect.left - 60, self.huey.rect.centery)
+        target_x = self.huey.rect.left - 60
         self.hover_angle += 2 * dt
-        target.y += math.sin(self.hover_angle) * 15
-        self.pos += (target - self.pos) * 4 * dt
-        self.rect.center = self.pos
+        target_y = self.huey.rect.centery + math.sin(self.hover_angle) * 15
+        self.x += (target_x - self.x) * 4 * dt
+        self.y += (target_y - self.y) * 4 * dt
+        self.rect.center = (self.x, self.y)
+
+COMPANION_TYPES = {cls.kind: cls for cls in (Red, Tine, Cici)}
 
 class CompanionManager:
-    def __init__(self, huey):
+    def __init__(self, huey, world, scheduler, targeting):
         self.huey, self.companions = huey, pygame.sprite.Group()
+        self.world = world
+        self.scheduler = scheduler
+        self.targeting = targeting
+        self.world.register("companion", x=0.0, y=0.0, life=0.0)
 
     def summon(self, comp_type):
         # Prevent duplicates
-        if any(isinstance(c, Red) for c in self.companions) and comp_type == "RED": return
-        if any(isinstance(c, Tine) for c in self.companions) and comp_type == "TINE": return
-        if any(isinstance(c, Cici) for c in self.companions) and comp_type == "CICI": return
+        if any(c.kind == comp_type for c in self.companions): return
         
-        mapping = {"RED": Red, "TINE": Tine, "CICI": Cici}
-        if comp_type in mapping: self.companions.add(mapping[comp_type](self.huey))
+        if comp_type in COMPANION_TYPES:
+            companion = COMPANION_TYPES[comp_type](self.huey)
+            companion.spawn_in(self.world, "companion")
+            companion.start(self.scheduler, self.targeting)
+            self.companions.add(companion)
 
-    def update(self, dt, enemies):
+    def update(self, dt):
         # Safety check for invincibility
-        if not any(isinstance(c, Tine) for c in self.companions) and hasattr(self.huey, 'is_invincible'):
+        if not any(c.shields for c in self.companions):
             self.huey.is_invincible = False
             
-        self.companions.update(dt, enemies)
+        self.companions.update(dt, self.targeting)
+        lifetime_system(self.world, "companion", dt)
 
     def draw(self, screen):
         for c in self.companions: c.draw(screen)
\ No newline at end of file
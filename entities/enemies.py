@@ -2,238 +2,269 @@ import pygame
 import random
 import math
 from settings import *
-from entities.projectiles import EnemyBullet, GloomLaser
+from entities.projectiles import GloomLaser
+from entities import bullet_patterns
+from systems.sfx_bank import get_cue
+from managers.asset_manager import get_asset_manager, PLAYING, BOSS
+from core import stamps
+from core.ecs import Entity, Component
+from core.scheduler import wait, until
+
+# Pulsing glows are baked once per pulse level and picked by phase instead of
+# being redrawn every frame. A sine pulse sampled at 16 phases only visits 9
+# distinct levels, so 8 steps between "fully in" and "fully out" cover it.
+PULSE_STEPS = 8
+
+def pulse_level(pulse):
+    """Maps a 0..1 pulse to its baked frame index."""
+    return int(round(max(0.0, min(1.0, pulse)) * PULSE_STEPS))
+
+# Columns of the "enemy" archetype (see EnemyManager). Movement, wobble, shoot
+# cooldowns, gloom auras and culling run over these arrays in
+# systems/entity_systems.py. Each type only declares its parameters below;
+# scripted enemies (the boss) still move themselves in update().
+ENEMY_COLUMNS = dict(x=0.0, y=0.0, vx=0.0, vy=0.0, hp=0.0, max_hp=0.0,
+                     half_w=0.0, half_h=0.0, boss=False, shoot_timer=0.0, shoot_every=0.0,
+                     wobble_phase=0.0, phase_rate=0.0, wobble=0.0)
+
+class Enemy(Entity, pygame.sprite.Sprite):
+    asset_scenes = (PLAYING,)
+
+    # Per-type kinematics: leftward speed, vertical sine wobble of wobble_amp
+    # pixels per frame at wobble_rate radians per second, shot every cooldown s
+    speed = 0
+    wobble_rate = 0.0
+    wobble_amp = 0.0
+    cooldown = 0.0
+    scripted = False
+
+    x = Component()
+    y = Component()
+    vx = Component()
+    vy = Component()
+    hp = Component()
+    max_hp = Component()
+    half_w = Component()
+    half_h = Component()
+    boss = Component()
+    shoot_timer = Component()
+    shoot_every = Component() # Seconds between shoot() calls, 0 for enemies that never shoot
+    wobble_phase = Component()
+    phase_rate = Component()
+    wobble = Component()
 
-class GloomParticle:
-    """Purple aura particles for enemies."""
-    def __init__(self, x, y):
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
-        self.life = 255
-        self.size = random.randint(2, 4)
-
-    def update(self, dt):
-        self.pos += self.vel * 20 * dt
-        self.life -= 500 * dt
-
-    def draw(self, screen):
-        if self.life > 0:
-            s = pygame.Surface((int(self.size*2), int(self.size*2)), pygame.SRCALPHA)
-            color = (120, 0, 200, int(max(0, self.life)))
-            pygame.draw.circle(s, color, (self.size, self.size), self.size)
-            screen.blit(s, self.pos)
-
-class Enemy(pygame.sprite.Sprite):
     def __init__(self, sprite_path, x, y, hp):
         super().__init__()
         try:
-            self.image = pygame.image.load(sprite_path).convert_alpha()
+            # Shared by every enemy of this type instead of one copy per spawn
+            self.image = get_asset_manager().image(sprite_path, self.asset_scenes)
         except:
             self.image = pygame.Surface((40, 40))
             self.image.fill((100, 0, 100))
             
         self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.Vector2(x, y)
+        self.x, self.y = x, y
+        self.vx, self.vy = -self.speed, 0.0
+        self.half_w, self.half_h = self.rect.width / 2, self.rect.height / 2
         self.hp = hp
         self.max_hp = hp
-        self.particles = []
-        self.is_boss = False
+        self.boss = False
+        self.shoot_timer = 0.0
+        self.shoot_every = self.cooldown
+        self.wobble_phase = 0.0
+        self.phase_rate = self.wobble_rate
+        self.wobble = self.wobble_amp
+
+    @property
+    def is_boss(self):
+        return bool(self.boss)
 
     def take_damage(self, amount):
         self.hp -= amount
         # Small visual flinch
-        self.pos.x += random.randint(-2, 2)
+        self.x += random.randint(-2, 2)
         return self.hp <= 0
 
-    def update_aura(self, dt):
-        if random.random() < 0.3:
-            off_x = random.randint(-15, 15)
-            off_y = random.randint(-15, 15)
-            self.particles.append(GloomParticle(self.rect.centerx + off_x, self.rect.centery + off_y))
-        
-        for p in self.particles[:]:
-            p.update(dt)
-            if p.life <= 0: self.particles.remove(p)
-
-    def draw_aura(self, screen):
-        for p in self.particles: p.draw(screen)
+    # Effects drawn behind the sprite; types with an aura, glow or charge-up override them
+    def draw_aura(self, screen): pass
+    def draw_glow(self, screen): pass
+    def draw_charge(self, screen): pass
 
 class GloomBat(Enemy):
+    speed = 140
+    wobble_rate = 5.0 # Bats flap in step: the phase starts from the clock
+    wobble_amp = 2
+    cooldown = 3.0
+
     def __init__(self, x, y):
         super().__init__("assets/sprites/enemies/gloombat.png", x, y, 2)
-        self.shoot_timer = 0
-        self.speed = 140
+        self.wobble_phase = pygame.time.get_ticks() * 0.005
 
-    def update(self, dt, player_pos, proj_manager):
-        self.update_aura(dt)
-        self.pos.x -= self.speed * dt
-        self.pos.y += math.sin(pygame.time.get_ticks() * 0.005) * 2
-        self.rect.center = self.pos
-        
-        self.shoot_timer += dt
-        if self.shoot_timer > 3.0:
-            angle_to_player = math.degrees(math.atan2(player_pos[1] - self.rect.centery, player_pos[0] - self.rect.centerx))
-            for spread in [-20, 0, 20]:
-                bullet = EnemyBullet(self.rect.centerx, self.rect.centery, angle_to_player + spread)
-                proj_manager.enemy_bullets.add(bullet)
-            self.shoot_timer = 0
+    # Three bullets 20 degrees apart, aimed at the player
+    pattern = bullet_patterns.aimed_spread([-20, 0, 20])
+
+    def shoot(self, player_pos, proj_manager):
+        origin = self.rect.center
+        self.pattern.emit(proj_manager.world, *origin, bullet_patterns.aim(origin, player_pos))
 
 class BushMonster(Enemy):
+    speed = 50
+    cooldown = 3.5
+
     def __init__(self, x, y):
         super().__init__("assets/sprites/enemies/corrupt_bushmonster.png", x, y, 8)
-        self.attack_timer = 0
-        self.speed = 50
-        self.is_charging = False
 
-    def update(self, dt, player_pos, proj_manager):
-        self.update_aura(dt)
-        self.pos.x -= self.speed * dt
-        self.rect.center = self.pos
-        
-        self.attack_timer += dt
-        if self.attack_timer > 2.5: self.is_charging = True
-            
-        if self.attack_timer > 3.5:
-            laser = GloomLaser(0, self.rect.centery)
-            proj_manager.enemy_bullets.add(laser)
-            self.attack_timer = 0
-            self.is_charging = False
+    @property
+    def is_charging(self):
+        # Warning line for the last second before the laser
+        return self.shoot_timer > 2.5
+
+    def shoot(self, player_pos, proj_manager):
+        laser = GloomLaser(0, self.rect.centery)
+        proj_manager.enemy_bullets.add(laser)
 
     def draw_charge(self, screen):
         if self.is_charging:
-            alpha = int(100 + math.sin(pygame.time.get_ticks() * 0.02) * 50)
-            warning_surf = pygame.Surface((WIDTH, 4), pygame.SRCALPHA)
-            pygame.draw.line(warning_surf, (255, 0, 0, alpha), (0, 2), (WIDTH, 2), 2)
+            level = pulse_level((math.sin(pygame.time.get_ticks() * 0.02) + 1) * 0.5)
+            warning_surf = get_asset_manager().baked(("bush_charge", level), lambda: self._build_charge(level), self.asset_scenes)
             screen.blit(warning_surf, (0, self.rect.centery - 2))
 
+    @staticmethod
+    def _build_charge(level):
+        alpha = int(50 + (level / PULSE_STEPS) * 100)
+        warning_surf = pygame.Surface((WIDTH, 4), pygame.SRCALPHA)
+        pygame.draw.line(warning_surf, (255, 0, 0, alpha), (0, 2), (WIDTH, 2), 2)
+        return warning_surf
+
 class MonsterSaucer(Enemy):
+    speed = 200
+    wobble_rate = 5.0
+    wobble_amp = 3
+
     def __init__(self, x, y):
         super().__init__("assets/sprites/enemies/monster_saucer.png", x, y, 5)
-        self.speed = 200 
-        self.sin_timer = random.random() * 10
-
-    def update(self, dt, player_pos, proj_manager):
-        self.update_aura(dt)
-        self.sin_timer += dt * 5
-        self.pos.y += math.sin(self.sin_timer) * 3
-        self.pos.x -= self.speed * dt
-        self.rect.center = self.pos
+        self.wobble_phase = random.random() * 10
 
 class BlightBeast(Enemy):
+    speed = 240
+    wobble_rate = 5.0
+    wobble_amp = 4
+
     def __init__(self, x, y):
         super().__init__("assets/sprites/enemies/blight_beast.png", x, y, 40)
-        self.speed = 240
-        self.timer = 0
-        self.glow_timer = 0
 
-    def update(self, dt, player_pos, proj_manager):
-        self.update_aura(dt)
-        self.timer += dt
-        self.glow_timer += dt
-        self.pos.x -= self.speed * dt
-        self.pos.y += math.sin(self.timer * 5) * 4
-        self.rect.center = self.pos
+    @property
+    def glow_timer(self):
+        # Seconds alive, recovered from the wobble phase that starts at 0
+        return self.wobble_phase / self.wobble_rate
 
     def draw_glow(self, screen):
         pulse = (math.sin(self.glow_timer * 8) + 1) * 0.5
-        glow_radius = int(40 + (pulse * 20))
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (180, 50, 255, 50), (glow_radius, glow_radius), glow_radius)
+        glow_radius = int(40 + (pulse_level(pulse) / PULSE_STEPS * 20))
+        glow_surf = stamps.disc(glow_radius * 2, (180, 50, 255), 50)
         screen.blit(glow_surf, (self.rect.centerx - glow_radius, self.rect.centery - glow_radius), special_flags=pygame.BLEND_RGB_ADD)
 
+# Titan attack pattern per phase: (seconds between volleys, spiral pattern,
+# spiral turn per volley in degrees, chance of a lightning strike per volley)
+TITAN_PHASES = {
+    1: (0.35, bullet_patterns.spiral(4), 15, 0.0),
+    2: (0.28, bullet_patterns.spiral(5), 22, 0.01),
+    3: (0.22, bullet_patterns.spiral(6), 30, 0.04),
+}
+
 class BlightTitan(Enemy):
+    asset_scenes = (BOSS,)
+    scripted = True
+
     def __init__(self, x, y):
         super().__init__("assets/sprites/enemies/blight_titan.png", x, y, 800)
         self.speed = 45
-        self.attack_timer = 0
         self.angle_offset = 0
-        self.is_boss = True 
-        self.phase = 1 
+        self.boss = True 
+        self.phase = 1 # Attack phase 1-3 (TITAN_PHASES); not the wobble column
         
         try:
-            self.img_normal = pygame.image.load("assets/sprites/enemies/blight_titan.png").convert_alpha()
-            self.img_damaged = pygame.image.load("assets/sprites/enemies/blight_titan_damaged.png").convert_alpha()
-            self.img_enraged = pygame.image.load("assets/sprites/enemies/blight_titan_enraged.png").convert_alpha()
+            assets = get_asset_manager()
+            self.img_normal = assets.image("assets/sprites/enemies/blight_titan.png", self.asset_scenes)
+            self.img_damaged = assets.image("assets/sprites/enemies/blight_titan_damaged.png", self.asset_scenes)
+            self.img_enraged = assets.image("assets/sprites/enemies/blight_titan_enraged.png", self.asset_scenes)
         except:
             self.img_normal = self.image
             self.img_damaged = self.image
             self.img_enraged = self.image
 
         self.is_transforming = False
-        self.transition_timer = 0
         self.aura_timer = 0
+        self.tasks = []
         
-        try:
-            self.snd_shoot = pygame.mixer.Sound("assets/sfx/titan_shoot.mp3")
-            self.snd_lightning = pygame.mixer.Sound("assets/sfx/tine_lightning.mp3")
-            self.snd_phase = pygame.mixer.Sound("assets/sfx/titan_roar.mp3")
-            self.snd_shoot.set_volume(0.3)
-        except: self.snd_shoot = self.snd_lightning = self.snd_phase = None
+        self.snd_shoot = get_cue("titan_shoot")
+        self.snd_lightning = get_cue("titan_lightning")
+        self.snd_phase = get_cue("titan_roar")
 
     def take_damage(self, amount):
         if self.is_transforming: return False
-        
-        old_hp_percent = self.hp / self.max_hp
         self.hp -= amount
-        new_hp_percent = self.hp / self.max_hp
+        return self.hp <= 0
 
-        if old_hp_percent > 0.5 and new_hp_percent <= 0.5:
-            self.trigger_transition(2, self.img_damaged)
-        elif old_hp_percent > 0.3 and new_hp_percent <= 0.3:
-            self.trigger_transition(3, self.img_enraged)
+    # --- SCRIPTS (run on the game scheduler; idle between their waits) ---
 
-        return self.hp <= 0
+    def start(self, scheduler, game):
+        self.tasks = [scheduler.start(self.phase_script(game)),
+                      scheduler.start(self.attack_script(game))]
 
-    def trigger_transition(self, next_phase, next_img):
+    def kill(self):
+        for task in self.tasks: task.cancel()
+        super().kill()
+
+    def phase_script(self, game):
+        yield until(lambda: self.hp <= self.max_hp * 0.5)
+        yield from self.transform(2, self.img_damaged, game)
+        yield until(lambda: self.hp <= self.max_hp * 0.3)
+        yield from self.transform(3, self.img_enraged, game)
+
+    def transform(self, next_phase, next_img, game):
         self.phase = next_phase
         self.image = next_img
         self.is_transforming = True
-        self.transition_timer = 2.0
         if self.snd_phase: self.snd_phase.play()
+        # The invulnerable pause shortens with difficulty like the volleys
+        yield wait(2.0 / game.difficulty_mult)
+        self.is_transforming = False
+
+    def attack_script(self, game):
+        proj_manager = game.combat_system.manager
+        while True:
+            every, pattern, rot_speed, lightning_chance = TITAN_PHASES[self.phase]
+            # Volleys speed up with difficulty, like the rest of the enemy clock
+            yield wait(every / game.difficulty_mult)
+            if self.is_transforming:
+                yield until(lambda: not self.is_transforming)
+                continue
+            self.fire_spiral(proj_manager, pattern, rot_speed)
+            if random.random() < lightning_chance: self.fire_lightning(proj_manager)
 
     def update(self, dt, player_pos, proj_manager):
-        self.update_aura(dt)
         self.aura_timer += dt
         
         if self.is_transforming:
-            self.transition_timer -= dt
-            self.pos.x += random.randint(-4, 4)
-            if self.transition_timer <= 0: self.is_transforming = False
-            self.rect.center = self.pos
+            self.x += random.randint(-4, 4)
+            self.rect.center = (self.x, self.y)
             return 
 
         # Entrance Movement
-        if self.pos.x > WIDTH - 350:
-            self.pos.x -= self.speed * 4 * dt
+        if self.x > WIDTH - 350:
+            self.x -= self.speed * 4 * dt
         else:
             # Hover Movement
             amp = 1.0 if self.phase < 3 else 2.5
-            self.pos.y += math.sin(pygame.time.get_ticks() * 0.0015) * amp
+            self.y += math.sin(pygame.time.get_ticks() * 0.0015) * amp
             
-        self.rect.center = self.pos
-
-        # Attack Patterns
-        self.attack_timer += dt
-        if self.phase == 1 and self.attack_timer > 0.35:
-            self.fire_spiral(proj_manager, 4, 15)
-        elif self.phase == 2 and self.attack_timer > 0.28:
-            self.fire_spiral(proj_manager, 5, 22)
-            if random.random() < 0.01: self.fire_lightning(proj_manager)
-        elif self.phase == 3 and self.attack_timer > 0.22:
-            self.fire_spiral(proj_manager, 6, 30)
-            if random.random() < 0.04: self.fire_lightning(proj_manager)
-
-    def fire_spiral(self, proj_manager, count, rot_speed):
+        self.rect.center = (self.x, self.y)
+
+    def fire_spiral(self, proj_manager, pattern, rot_speed):
         self.angle_offset += rot_speed
-        for i in range(count):
-            angle = (i * (360 // count)) + self.angle_offset
-            bullet = EnemyBullet(self.rect.centerx, self.rect.centery, angle)
-            # Enraged damage boost
-            if self.phase == 3 and hasattr(bullet, 'damage'):
-                bullet.damage *= 1.3 
-            proj_manager.enemy_bullets.add(bullet)
+        pattern.emit(proj_manager.world, self.rect.centerx, self.rect.centery, self.angle_offset)
         if self.snd_shoot: self.snd_shoot.play()
-        self.attack_timer = 0
 
     def fire_lightning(self, proj_manager):
         lightning = GloomLaser(0, self.rect.centery)
@@ -241,19 +272,35 @@ class BlightTitan(Enemy):
         if self.snd_lightning: self.snd_lightning.play()
 
     def draw_aura(self, screen):
-        pulse = (math.sin(self.aura_timer * 4) + 1) * 0.5
+        level = pulse_level((math.sin(self.aura_timer * 4) + 1) * 0.5)
+        key = ("titan_aura", level, self.is_transforming)
+        aura = get_asset_manager().baked(key, lambda: self._build_aura(level, self.is_transforming), self.asset_scenes)
+        radius = aura.get_width() // 2
+        screen.blit(aura, (self.rect.centerx - radius, self.rect.centery - radius), special_flags=pygame.BLEND_RGB_ADD)
+
+    @staticmethod
+    def _build_aura(level, is_transforming):
+        """The three additive rings pre-composited on black. Saturating adds of
+        non-negative colours commute, so one add of the sum looks the same."""
+        pulse = level / PULSE_STEPS
         colors = [(100, 0, 255), (0, 80, 255), (60, 0, 120)]
-        
+        rings = []
         for i, col in enumerate(colors):
             radius = int((170 + (i * 35)) + pulse * 25)
             alpha = int(35 - (i * 10))
-            if self.is_transforming: 
+            if is_transforming: 
                 radius += 60
                 alpha += 30
-            
+            rings.append((radius, col, alpha))
+
+        size = max(r for r, _, _ in rings) * 2
+        frame = pygame.Surface((size, size))
+        frame.fill((0, 0, 0))
+        for radius, col, alpha in rings:
             aura_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(aura_surf, (*col, alpha), (radius, radius), radius)
-            screen.blit(aura_surf, (self.rect.centerx - radius, self.rect.centery - radius), special_flags=pygame.BLEND_RGB_ADD)
+            frame.blit(aura_surf, (size // 2 - radius, size // 2 - radius), special_flags=pygame.BLEND_RGB_ADD)
+        return frame
 
     def draw_health_bar(self, screen):
         bar_width = 600
@@ -265,9 +312,15 @@ class BlightTitan(Enemy):
         col = (200, 0, 255) if self.phase == 1 else (100, 100, 255) if self.phase == 2 else (255, 50, 50)
         
         pygame.draw.rect(screen, col, (x, y, fill, 20))
+        # One full-width glow strip, cropped to the remaining health
+        glow = get_asset_manager().baked(("titan_bar_glow", bar_width), lambda: self._build_bar_glow(bar_width), self.asset_scenes)
+        screen.blit(glow, (x, y), (0, 0, max(0, int(fill)), 10))
+
+    @staticmethod
+    def _build_bar_glow(bar_width):
         glow = pygame.Surface((bar_width, 10), pygame.SRCALPHA)
-        pygame.draw.rect(glow, (255, 255, 255, 50), (0, 0, fill, 10))
-        screen.blit(glow, (x, y))
+        glow.fill((255, 255, 255, 50))
+        return glow
 
     def draw_glow(self, screen):
         pass
\ No newline at end of file
@@ -2,7 +2,11 @@ import pygame
 import random
 import math
 from settings import WIDTH, HEIGHT
-from entities.enemies import GloomBat, BushMonster, MonsterSaucer, BlightBeast, BlightTitan
+from entities.enemies import GloomBat, BushMonster, MonsterSaucer, BlightBeast, BlightTitan, ENEMY_COLUMNS
+from systems.entity_systems import (movement_system, wobble_system, sync_rects, shooting_system,
+                                    aura_system, bounds_system, draw_gloom)
+from ui.glyph_atlas import get_atlas
+from managers.asset_manager import get_asset_manager, BOSS
 
 class DeathParticle:
     def __init__(self, x, y):
@@ -28,33 +32,67 @@ class DeathParticle:
             pygame.draw.circle(s, (*self.color, draw_alpha), (int(self.radius), int(self.radius)), int(self.radius))
             screen.blit(s, (self.x - self.radius, self.y - self.radius))
 
+# Enemy kinds named by the world generator's placements
+ENEMY_TYPES = {"BlightBeast": BlightBeast, "GloomBat": GloomBat,
+               "MonsterSaucer": MonsterSaucer, "BushMonster": BushMonster}
+
 class EnemyManager:
-    def __init__(self, game):
+    def __init__(self, game, level=None):
         self.game = game
+        self.world = game.world
+        self.world.register("enemy", **ENEMY_COLUMNS)
+        self.world.register("gloom", x=0.0, y=0.0, vx=0.0, vy=0.0, life=0.0, size=0)
         self.enemies = pygame.sprite.Group()
+        self.scripted = pygame.sprite.Group() # Enemies that still move themselves (the boss)
+        self.view = pygame.Rect(0, 0, WIDTH, HEIGHT)
         self.particles = [] 
-        self.spawn_timer = 0
-        self.spawn_delay = 3.5 
+        
+        # Regular enemies are placed by world.world_gen, or in story mode by
+        # the level's timeline; thunder and the boss warning run on the
+        # game's scheduler
+        self.level = level
+        self.timeline = level.enemy_timeline() if level else None
+        self.scheduler = game.scheduler
+        self.thunder = None
+        self.thunder_flash = False # Drawn over the next frame, then cleared
+        self.show_warning = False
         
         self.boss_active = False
-        self.next_boss_dist = random.randint(8000, 12000)
-        self.warning_timer = 0
-        self.thunder_timer = 0
+        self.next_boss_dist = self.first_boss_dist()
         self.sky_alpha = 0
 
+    def first_boss_dist(self):
+        # Story levels only meet the boss if their data places one
+        if self.level: return self.level.boss_at or math.inf
+        return random.randint(8000, 12000)
+
     def reset(self):
+        self.world.clear("enemy")
+        self.world.clear("gloom")
         self.enemies.empty()
+        self.scripted.empty()
         self.particles = []
-        self.spawn_timer = 0
-        self.spawn_delay = 3.5
+        self.stop_boss_effects()
         self.boss_active = False
         self.sky_alpha = 0
-        self.next_boss_dist = random.randint(8000, 12000)
+        if self.level: self.timeline = self.level.enemy_timeline()
+        self.next_boss_dist = self.first_boss_dist()
 
     def set_next_boss(self):
         """Called when a boss dies to schedule the next one."""
-        self.next_boss_dist = self.game.player.distance + random.randint(15000, 25000)
+        if self.level: self.next_boss_dist = math.inf
+        else: self.next_boss_dist = self.game.player.distance + random.randint(15000, 25000)
         self.boss_active = False
+        self.stop_boss_effects()
+
+    def stop_boss_effects(self):
+        if self.thunder: self.thunder.cancel()
+        self.thunder = None
+        self.thunder_flash = False
+        self.show_warning = False
+
+    def end_warning(self):
+        self.show_warning = False
 
     def update(self, dt, player_pos, proj_manager, difficulty_mult):
         current_dist = self.game.player.distance
@@ -63,48 +101,45 @@ class EnemyManager:
         if not self.boss_active and current_dist >= self.next_boss_dist:
             self.trigger_boss_spawn()
 
-        # 2. BOSS VISUALS (Thunder & Sky Tint)
+        if self.timeline:
+            for wave in self.timeline.due(current_dist): self.place(wave)
+
+        # 2. BOSS VISUALS (Sky Tint; thunder is scheduled)
         if self.boss_active:
             if self.sky_alpha < 150:
                 self.sky_alpha = min(150, self.sky_alpha + 100 * dt)
-            if self.warning_timer > 0: self.warning_timer -= dt
-            
-            self.thunder_timer -= dt
-            if self.thunder_timer <= 0:
-                self.trigger_thunder()
-                self.thunder_timer = random.uniform(4.0, 8.0) # Slightly rarer thunder
         else:
             if self.sky_alpha > 0:
                 self.sky_alpha = max(0, self.sky_alpha - 100 * dt)
 
-        # 3. UPDATE ENEMIES
+        # 3. UPDATE ENEMIES: every regular type moves in one pass over the enemy
+        # columns, then every live rect is synced for drawing, steering and collisions
         scaled_dt = dt * difficulty_mult
-        for enemy in self.enemies:
-            # Pass player position for the new tracking GloomBats
+        for enemy in self.scripted:
             enemy.update(scaled_dt, player_pos, proj_manager)
-            if enemy.rect.right < -150 and not getattr(enemy, 'is_boss', False):
-                enemy.kill()
+        movement_system(self.world, "enemy", scaled_dt)
+        wobble_system(self.world, "enemy", scaled_dt)
+        sync_rects(self.world, "enemy")
+        # Pass player position for the tracking GloomBats
+        shooting_system(self.world, "enemy", scaled_dt, player_pos, proj_manager)
+        aura_system(self.world, scaled_dt)
+        bounds_system(self.world, "enemy", left=-150, keep="boss")
 
         # 4. UPDATE PARTICLES
         for p in self.particles[:]:
             p.update(dt)
             if p.alpha <= 0: self.particles.remove(p)
 
-        # 5. REGULAR SPAWNING (Only if no boss)
-        if self.game.state == "PLAYING" and not self.boss_active:
-            self.spawn_timer += dt
-            current_delay = max(0.7, self.spawn_delay / math.sqrt(difficulty_mult))
-            
-            if self.spawn_timer >= current_delay:
-                self.spawn_random()
-                self.spawn_timer = 0
-
     def trigger_boss_spawn(self):
         self.boss_active = True
-        self.warning_timer = 4.0
+        self.show_warning = True
+        self.scheduler.after(4.0, self.end_warning)
+        self.trigger_thunder()
+        self.thunder = self.scheduler.every(lambda: random.uniform(4.0, 8.0), self.trigger_thunder) # Slightly rarer thunder
         # Blight Titan spawn (Start him further back for entrance)
         boss = BlightTitan(WIDTH + 400, HEIGHT // 2)
-        self.enemies.add(boss)
+        self.add(boss)
+        boss.start(self.scheduler, self.game)
         
         if hasattr(self.game, 'bg'):
             self.game.bg.enter_boss_mode()
@@ -116,25 +151,26 @@ class EnemyManager:
         except: pass
 
     def trigger_thunder(self):
+        self.thunder_flash = True
+
+    @staticmethod
+    def _build_flash():
         flash = pygame.Surface((WIDTH, HEIGHT))
         flash.fill((200, 200, 255)) # Cooler blue thunder
         flash.set_alpha(70)
-        self.game.screen.blit(flash, (0,0))
+        return flash
 
-    def spawn_random(self):
-        y = random.randint(100, HEIGHT - 100)
-        x = WIDTH + 50
-        choice = random.random()
-        
-        # Probabilities adjusted for "Monster Saucer" dominance (40% chance)
-        if choice < 0.10: 
-            self.enemies.add(BlightBeast(x, y))
-        elif choice < 0.35: 
-            self.enemies.add(GloomBat(x, y))
-        elif choice < 0.75: # Saucer: 0.35 to 0.75 = 40% spawn rate!
-            self.enemies.add(MonsterSaucer(x, y))
-        else: 
-            self.enemies.add(BushMonster(x, y))
+    def add(self, enemy):
+        enemy.spawn_in(self.world, "enemy")
+        self.enemies.add(enemy)
+        if enemy.scripted: self.scripted.add(enemy)
+
+    def place(self, wave):
+        """Spawns an enemy (kind, x, y) laid out by world.world_gen or a story
+        timeline. None arrive while the boss is up."""
+        if self.boss_active: return
+        kind, x, y = wave
+        self.add(ENEMY_TYPES[kind](x, y))
 
     def trigger_death_effect(self, x, y, is_boss=False):
         count = 120 if is_boss else 15
@@ -142,39 +178,38 @@ class EnemyManager:
             self.particles.append(DeathParticle(x, y))
 
     def draw(self, screen):
-        # 1. Sky Tint (Darker for Boss)
-        if self.sky_alpha > 0:
-            overlay = pygame.Surface((WIDTH, HEIGHT))
-            overlay.set_alpha(int(self.sky_alpha))
-            overlay.fill((30, 0, 60)) # Deep Indigo
-            screen.blit(overlay, (0, 0))
+        # 1. Sky Tint (Darker for Boss) is applied by ParallaxBackground via sky_alpha
 
         # 2. Draw Aura/Glow/Charge behind sprites
+        draw_gloom(self.world, screen)
         for enemy in self.enemies:
-            if hasattr(enemy, 'draw_aura'): enemy.draw_aura(screen)
-            if hasattr(enemy, 'draw_glow'): enemy.draw_glow(screen)
-            if hasattr(enemy, 'draw_charge'): enemy.draw_charge(screen)
+            if not self.view.colliderect(enemy.rect): continue
+            enemy.draw_aura(screen)
+            enemy.draw_glow(screen)
+            enemy.draw_charge(screen)
         
         # 3. Main Sprite Group
         self.enemies.draw(screen)
         
         # 4. Boss Specific UI (Health Bar)
         for enemy in self.enemies:
-            if getattr(enemy, 'is_boss', False):
+            if enemy.is_boss:
                 enemy.draw_health_bar(screen)
 
         # 5. Particles & Warning
         for p in self.particles: p.draw(screen)
-        if self.warning_timer > 0: self.draw_warning(screen)
+        if self.show_warning: self.draw_warning(screen)
+        if self.thunder_flash:
+            screen.blit(get_asset_manager().baked(("thunder_flash",), self._build_flash, [BOSS]), (0, 0))
+            self.thunder_flash = False
 
     def draw_warning(self, screen):
         pulse = (math.sin(pygame.time.get_ticks() * 0.01) + 1) / 2
-        color = (255, int(50 * pulse), int(50 * pulse))
-        try:
-            font = pygame.font.Font("assets/fonts/Impact.ttf", 60)
-        except:
-            font = pygame.font.SysFont("Impact", 60)
+        # Pulse quantised to 8 steps so the atlas keeps at most 9 tinted copies
+        shade = int(50 * int(pulse * 8) / 8)
+        color = (255, shade, shade)
+        font = get_atlas("assets/fonts/Impact.ttf", 60, ("Impact", 60, False, False))
             
-        warn_surf = font.render("!!! BLIGHT TITAN DETECTED !!!", True, color)
-        warn_rect = warn_surf.get_rect(center=(WIDTH // 2, HEIGHT // 3))
-        screen.blit(warn_surf, warn_rect)
\ No newline at end of file
+        text = "!!! BLIGHT TITAN DETECTED !!!"
+        text_w, text_h = font.size(text)
+        font.draw(screen, text, (WIDTH // 2 - text_w // 2, HEIGHT // 3 - text_h // 2), color)
\ No newline at end of file
@@ -3,6 +3,8 @@ import random
 import math
 from settings import *
 from core.physics import FlightPhysics
+from systems.sfx_bank import get_cue, get_sfx_bank
+from managers.asset_manager import get_asset_manager, PLAYING
 
 # --- ENHANCED PARTICLE CLASS ---
 class Particle:
@@ -52,39 +54,35 @@ class Player(pygame.sprite.Sprite):
         
         # 1. Assets
         try:
-            self.frame_open = pygame.image.load("assets/sprites/huey_plane1.png").convert_alpha()
-            self.frame_blink = pygame.image.load("assets/sprites/huey_plane2.png").convert_alpha()
-            self.image_crash = pygame.image.load("assets/sprites/huey_planecrash.png").convert_alpha()
+            assets = get_asset_manager()
+            self.frame_open = assets.image("assets/sprites/huey_plane1.png", [PLAYING])
+            self.frame_blink = assets.image("assets/sprites/huey_plane2.png", [PLAYING])
+            self.image_crash = assets.image("assets/sprites/huey_planecrash.png", [PLAYING])
         except:
             self.frame_open = pygame.Surface((50, 30)); self.frame_open.fill((200, 200, 200))
             self.frame_blink = self.frame_open.copy()
             self.image_crash = self.frame_open.copy(); self.image_crash.fill((100, 100, 100))
     
         # --- AUDIO SYSTEM ---
-        try:
-            self.sfx_explosion = pygame.mixer.Sound("assets/sfx/explosion.wav")
-            self.sfx_engine = pygame.mixer.Sound("assets/sfx/engine_loop.mp3")
-            self.sfx_stall = pygame.mixer.Sound("assets/sfx/engine_stall.mp3") 
-            
-            # New Weapon SFX
-            self.sfx_lightning = pygame.mixer.Sound("assets/sfx/tine_lightning.mp3")
-            self.sfx_laser_loop = pygame.mixer.Sound("assets/sfx/Red_Laser.mp3")
-            
-            # Volume adjustments
-            self.sfx_lightning.set_volume(0.6)
-            self.sfx_laser_loop.set_volume(0.4)
+        # Huey's own hit/crash boom stays at full volume, apart from the enemy-death cue
+        self.sfx_explosion = get_cue("player_explosion")
+        self.sfx_stall = get_cue("engine_stall")
+        self.sfx_lightning = get_cue("lightning")
 
-            # Dedicated Channels
-            self.engine_channel = pygame.mixer.find_channel()
-            self.laser_channel = pygame.mixer.find_channel() # Continuous channel for Red's Laser
+        # Looping sounds play raw on reserved channels the bank never steals
+        bank = get_sfx_bank()
+        engine_cue = get_cue("engine_loop")
+        laser_cue = get_cue("laser_loop")
+        self.sfx_engine = engine_cue.sound if engine_cue else None
+        self.sfx_laser_loop = laser_cue.sound if laser_cue else None
+        self.engine_channel = bank.loop_channel("engine") if self.sfx_engine else None
+        self.laser_channel = bank.loop_channel("laser") if self.sfx_laser_loop else None # Continuous channel for Red's Laser
 
-            if self.engine_channel:
-                self.engine_channel.play(self.sfx_engine, loops=-1)
-                self.engine_channel.set_volume(0.1)
-        except:
-            self.sfx_explosion = self.sfx_engine = self.sfx_stall = None
-            self.sfx_lightning = self.sfx_laser_loop = None
-            self.engine_channel = self.laser_channel = None
+        if self.engine_channel:
+            self.engine_channel.play(self.sfx_engine, loops=-1)
+            self.engine_channel.set_volume(0.1)
+        if self.laser_channel:
+            self.laser_channel.set_volume(laser_cue.volume)
 
         self.base_image = self.frame_open
         self.image = self.base_image
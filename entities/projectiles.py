@@ -1,7 +1,12 @@
 import pygame
 import random
 import math
-from settings import WIDTH, HEIGHT, GROUND_LINE, SFX_MACHINE_GUN, BULLET_SHED_AMOUNT
+from settings import WIDTH, HEIGHT, GROUND_LINE, BULLET_SHED_AMOUNT
+from systems.sfx_bank import get_cue
+from systems.combat_events import CombatEventBus, HIT
+from managers.asset_manager import get_asset_manager, PLAYING
+from systems.entity_systems import movement_system, bounds_system, collision_pairs, overlap_rows
+from core.ecs import np
 
 # --- SPECIAL EFFECTS ---
 
@@ -67,24 +72,19 @@ class LaserBeam(pygame.sprite.Sprite):
 
 # --- ENEMY PROJECTILES ---
 
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle):
-        super().__init__()
-        self.size = 8
-        self.image = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (200, 50, 255), (self.size, self.size), self.size)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.Vector2(x, y)
-        self.speed = 350
-        self.damage = 10 # Added: Fixes the BlightTitan Phase 3 error
-        rad = math.radians(angle)
-        self.vel = pygame.Vector2(math.cos(rad) * self.speed, math.sin(rad) * self.speed)
+# Titan and GloomBat bullets are rows of the "enemy_bullet" archetype, fired a
+# volley at a time by entities/bullet_patterns.py; lasers stay sprites.
+ENEMY_BULLET_SIZE = 8 # Radius, also the half-size of the hit box
+ENEMY_BULLET_SPEED = 350
+ENEMY_BULLET_COLUMNS = dict(x=0.0, y=0.0, vx=0.0, vy=0.0, half_w=0.0, half_h=0.0)
 
-    def update(self, dt):
-        self.pos += self.vel * dt
-        self.rect.center = self.pos
-        if not (0 <= self.pos.x <= WIDTH and 0 <= self.pos.y <= HEIGHT):
-            self.kill()
+def enemy_bullet_image():
+    def build():
+        size = ENEMY_BULLET_SIZE
+        image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(image, (200, 50, 255), (size, size), size)
+        return image
+    return get_asset_manager().baked(("enemy_bullet",), build, [PLAYING])
 
 class GloomLaser(pygame.sprite.Sprite):
     """The laser class for enemies."""
@@ -115,9 +115,8 @@ class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y, scale=1.0):
         super().__init__()
         try:
-            full_sheet = pygame.image.load("assets/sprites/explosion_effect.png").convert_alpha()
             size = int(32 * scale)
-            self.image = pygame.transform.scale(full_sheet, (size, size))
+            self.image = get_asset_manager().image("assets/sprites/explosion_effect.png", [PLAYING], size=(size, size))
         except:
             size = int(40 * scale)
             self.image = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -133,13 +132,13 @@ class Explosion(pygame.sprite.Sprite):
             self.kill()
 
 class GravityWave(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_group):
+    def __init__(self, x, y, targeting):
         super().__init__()
         self.pos = pygame.Vector2(x, y)
         self.radius = 10
         self.max_radius = 400 
         self.speed = 850
-        self.enemy_group = enemy_group
+        self.targeting = targeting
         self.image = pygame.Surface((self.max_radius * 2, self.max_radius * 2), pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=self.pos)
         self.damage = 100 
@@ -155,24 +154,21 @@ class GravityWave(pygame.sprite.Sprite):
             pygame.draw.circle(self.image, (100, 220, 255, alpha), 
                                (self.max_radius, self.max_radius), int(self.radius), 8)
             
-            for enemy in self.enemy_group:
+            for enemy in self.targeting.within(self.pos, self.radius):
                 if enemy not in self.hit_enemies:
-                    if self.pos.distance_to(enemy.rect.center) <= self.radius:
-                        enemy.take_damage(self.damage)
-                        self.hit_enemies.add(enemy)
+                    enemy.take_damage(self.damage)
+                    self.hit_enemies.add(enemy)
         else:
             self.kill()
 
 # --- PLAYER WEAPONS ---
 
 class FallingBomb(pygame.sprite.Sprite):
-    def __init__(self, x, y, manager, enemy_group):
+    def __init__(self, x, y, manager):
         super().__init__()
         self.manager = manager 
-        self.enemy_group = enemy_group
         try:
-            self.image = pygame.image.load("assets/sprites/scraps/gravity_bomb_pickup.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (25, 25))
+            self.image = get_asset_manager().image("assets/sprites/scraps/gravity_bomb_pickup.png", [PLAYING], size=(25, 25))
         except:
             self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
             pygame.draw.circle(self.image, (50, 50, 255), (10, 10), 10)
@@ -190,18 +186,17 @@ class FallingBomb(pygame.sprite.Sprite):
             self.explode()
 
     def explode(self):
-        wave = GravityWave(self.pos.x, self.pos.y, self.enemy_group)
+        wave = GravityWave(self.pos.x, self.pos.y, self.manager.targeting)
         self.manager.effects.add(wave)
         self.manager.trigger_explosion(self.pos.x, self.pos.y, scale=2.5)
         self.kill()
 
 class Missile(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_group):
+    def __init__(self, x, y, targeting):
         super().__init__()
-        self.enemy_group = enemy_group
+        self.targeting = targeting
         try:
-            self.orig_image = pygame.image.load("assets/sprites/scraps/missile_pickup.png").convert_alpha()
-            self.orig_image = pygame.transform.scale(self.orig_image, (35, 18))
+            self.orig_image = get_asset_manager().image("assets/sprites/scraps/missile_pickup.png", [PLAYING], size=(35, 18))
         except:
             self.orig_image = pygame.Surface((30, 10))
             self.orig_image.fill((255, 100, 0))
@@ -217,7 +212,7 @@ class Missile(pygame.sprite.Sprite):
         self.trail_timer = 0
 
     def update(self, dt):
-        target = self.get_closest_enemy()
+        target = self.targeting.nearest(self.pos, 1000)
         if target:
             diff = pygame.Vector2(target.rect.center) - self.pos
             if diff.length() > 0:
@@ -243,17 +238,6 @@ class Missile(pygame.sprite.Sprite):
         if not (-200 <= self.pos.x <= WIDTH + 500):
             self.kill()
 
-    def get_closest_enemy(self):
-        if not self.enemy_group: return None
-        closest = None
-        min_dist = 1000
-        for enemy in self.enemy_group:
-            dist = self.pos.distance_to(enemy.rect.center)
-            if dist < min_dist:
-                min_dist = dist
-                closest = enemy
-        return closest
-
     def draw_trail(self, screen):
         for p in self.trail_particles:
             size = int(p["life"] * 8)
@@ -261,41 +245,54 @@ class Missile(pygame.sprite.Sprite):
             if size > 0:
                 pygame.draw.circle(screen, color, (int(p["pos"].x), int(p["pos"].y)), size)
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_group):
-        super().__init__()
-        self.enemy_group = enemy_group
-        self.image = pygame.Surface((20, 8), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (255, 255, 100), (0, 0, 20, 8), border_radius=4)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(1400, random.uniform(-15, 15))
-        self.damage = 4
+# Machine-gun rounds are pure data in the world's "bullet" archetype: there can
+# be dozens in flight, and all of them share one image and one straight path.
+BULLET_W, BULLET_H = 20, 8
+BULLET_COLUMNS = dict(x=0.0, y=0.0, vx=0.0, vy=0.0, damage=0.0, half_w=0.0, half_h=0.0)
 
-    def update(self, dt):
-        self.pos += self.vel * dt
-        self.rect.center = self.pos
-        if self.rect.left > WIDTH: self.kill()
+def spawn_bullet(world, x, y):
+    return world.spawn("bullet", x=x, y=y, vx=1400, vy=random.uniform(-15, 15), damage=4,
+                       half_w=BULLET_W / 2, half_h=BULLET_H / 2)
+
+def bullet_image():
+    def build():
+        image = pygame.Surface((BULLET_W, BULLET_H), pygame.SRCALPHA)
+        pygame.draw.rect(image, (255, 255, 100), (0, 0, BULLET_W, BULLET_H), border_radius=4)
+        return image
+    return get_asset_manager().baked(("player_bullet",), build, [PLAYING])
 
 # --- PROJECTILE MANAGER ---
 
 class ProjectileManager:
-    def __init__(self):
-        self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
+    def __init__(self, world, targeting):
+        self.world = world
+        self.targeting = targeting
+        self.world.register("bullet", **BULLET_COLUMNS)
+        self.world.register("enemy_bullet", **ENEMY_BULLET_COLUMNS)
+        self.player_bullets = pygame.sprite.Group() # Missiles and bombs; bullets live in the world
+        self.missiles = pygame.sprite.Group()       # The homing subset of player_bullets
+        self.enemy_bullets = pygame.sprite.Group()  # Lasers; enemy bullets live in the world
         self.effects = pygame.sprite.Group() 
         self.fire_timer = 0
         self.fire_rate = 0.08 
         
-        try:
-            self.shoot_sfx = pygame.mixer.Sound(SFX_MACHINE_GUN)
-            self.shoot_sfx.set_volume(0.15)
-            # Load the hit SFX
-            self.hit_sfx = pygame.mixer.Sound("assets/sfx/explosion_old.mp3")
-            self.hit_sfx.set_volume(0.2)
-        except:
-            self.shoot_sfx = None
-            self.hit_sfx = None
+        # Shared, voice-limited cues (the gun can fire 25 times a second)
+        self.shoot_sfx = get_cue("machine_gun")
+        self.hit_sfx = get_cue("bullet_hit")
+
+        # Hits are posted here and resolved once per frame (see flush_events)
+        self.events = CombatEventBus()
+        self.events.subscribe(HIT, self._on_hits)
+
+    def _on_hits(self, events):
+        for ev in events:
+            # A cluster of hits on one target reads as one slightly bigger burst
+            scale = min(ev.scale * 1.5, ev.scale * (1 + 0.1 * (ev.count - 1)))
+            self.trigger_explosion(ev.x, ev.y, scale)
+        if self.hit_sfx: self.hit_sfx.play()
+
+    def flush_events(self):
+        self.events.flush()
 
     def trigger_explosion(self, x, y, scale=1.0):
         self.effects.add(Explosion(x, y, scale))
@@ -306,7 +303,7 @@ class ProjectileManager:
             end_pos = target.rect.center
             self.effects.add(LightningBolt(current_start, end_pos))
             target.take_damage(50)
-            self.trigger_explosion(end_pos[0], end_pos[1], scale=0.8)
+            self.events.post(HIT, end_pos[0], end_pos[1], target=target, scale=0.8)
             current_start = end_pos 
 
     def process_laser_beam(self, player, enemies):
@@ -319,51 +316,87 @@ class ProjectileManager:
             if beam_rect.colliderect(enemy.rect):
                 enemy.take_damage(5) 
                 if random.random() < 0.1: 
-                    self.trigger_explosion(enemy.rect.centerx, enemy.rect.centery, scale=0.3)
-                    if self.hit_sfx: self.hit_sfx.play()
+                    self.events.post(HIT, enemy.rect.centerx, enemy.rect.centery, target=enemy, scale=0.3)
 
-    def fire_machine_gun(self, player, enemy_group, dt):
+    def fire_machine_gun(self, player, dt):
         if not player.is_alive or player.is_stalled: return False
         self.fire_timer += dt
         if self.fire_timer >= self.fire_rate:
             if player.weight > 0:
                 player.weight = max(0, player.weight - BULLET_SHED_AMOUNT) 
-            self.player_bullets.add(Bullet(player.rect.right, player.rect.centery + 10, enemy_group))
+            spawn_bullet(self.world, player.rect.right, player.rect.centery + 10)
             if self.shoot_sfx: self.shoot_sfx.play()
             self.fire_timer = 0
             return True
         return False
 
-    def launch_missile(self, player, enemy_group):
-        self.player_bullets.add(Missile(player.rect.right, player.rect.centery, enemy_group))
+    def launch_missile(self, player):
+        missile = Missile(player.rect.right, player.rect.centery, self.targeting)
+        self.player_bullets.add(missile)
+        self.missiles.add(missile)
 
-    def trigger_gravity_bomb(self, player, enemy_group):
-        bomb = FallingBomb(player.rect.right, player.rect.centery, self, enemy_group)
+    def trigger_gravity_bomb(self, player):
+        bomb = FallingBomb(player.rect.right, player.rect.centery, self)
         self.player_bullets.add(bomb)
 
     def update(self, dt):
+        movement_system(self.world, "bullet", dt)
+        bounds_system(self.world, "bullet", right=WIDTH)
+        movement_system(self.world, "enemy_bullet", dt)
+        bounds_system(self.world, "enemy_bullet", left=0, right=WIDTH, top=0, bottom=HEIGHT)
         self.player_bullets.update(dt)
         self.enemy_bullets.update(dt)
         self.effects.update(dt)
         
-        for bullet in self.player_bullets:
-            if isinstance(bullet, (Bullet, Missile)):
-                hit_enemies = pygame.sprite.spritecollide(bullet, bullet.enemy_group, False)
-                for enemy in hit_enemies:
-                    enemy.take_damage(bullet.damage)
-                    self.trigger_explosion(bullet.rect.centerx, bullet.rect.centery, scale=0.5)
-                    # Play the hit sound effect when a bullet/missile connects
-                    if self.hit_sfx:
-                        self.hit_sfx.play()
-                    bullet.kill()
+        self.resolve_bullet_hits()
+        enemies = self.world.archetypes["enemy"].objects
+        for bullet in self.missiles:
+            for row in overlap_rows(self.world, "enemy", bullet.rect):
+                enemy = enemies[row]
+                enemy.take_damage(bullet.damage)
+                # VFX + hit sound are coalesced per enemy at the end of the frame
+                self.events.post(HIT, bullet.rect.centerx, bullet.rect.centery, target=enemy, scale=0.5)
+                bullet.kill()
+
+    def resolve_bullet_hits(self):
+        """Bullet-vs-enemy boxes tested in one pass over both archetypes."""
+        pairs = collision_pairs(self.world, "bullet", "enemy")
+        if not pairs: return
+        bullets = self.world.archetypes["bullet"]
+        enemies = self.world.archetypes["enemy"].objects
+        x, y, damage = bullets.columns["x"], bullets.columns["y"], bullets.columns["damage"]
+        for row, enemy_row in pairs:
+            enemy = enemies[enemy_row]
+            enemy.take_damage(damage[row])
+            self.events.post(HIT, int(x[row]), int(y[row]), target=enemy, scale=0.5)
+        self.world.despawn_rows("bullet", {row for row, _ in pairs})
+
+    def enemy_bullet_hits(self, rect):
+        """Removes the enemy bullets overlapping rect; returns where each one hit."""
+        rows = overlap_rows(self.world, "enemy_bullet", rect)
+        if not rows: return []
+        c = self.world.archetypes["enemy_bullet"].columns
+        hits = [(int(c["x"][row]), int(c["y"][row])) for row in rows]
+        self.world.despawn_rows("enemy_bullet", rows)
+        return hits
+
+    def draw_bullets(self, screen, name="bullet", image=None, half_w=BULLET_W / 2, half_h=BULLET_H / 2):
+        bullets = self.world.archetypes[name]
+        if not bullets.count: return
+        image = image or bullet_image()
+        xs, ys = bullets.view("x"), bullets.view("y")
+        if np is not None:
+            xs, ys = xs.tolist(), ys.tolist()
+        screen.blits([(image, (x - half_w, y - half_h)) for x, y in zip(xs, ys)], False)
 
     def draw(self, screen):
-        for sprite in self.player_bullets:
-            if isinstance(sprite, Missile):
-                sprite.draw_trail(screen)
+        for missile in self.missiles:
+            missile.draw_trail(screen)
         
+        self.draw_bullets(screen)
         self.player_bullets.draw(screen)
         self.enemy_bullets.draw(screen)
+        self.draw_bullets(screen, "enemy_bullet", enemy_bullet_image(), ENEMY_BULLET_SIZE, ENEMY_BULLET_SIZE)
         
         for effect in self.effects:
             if hasattr(effect, 'draw_custom'):
@@ -1,134 +1,148 @@
 import pygame
 import random
 import math
-from settings import WIDTH, HEIGHT, GROUND_LINE
+from systems.sfx_bank import get_cue
+from managers.asset_manager import get_asset_manager, PLAYING
+from core.ecs import Entity, Component, np
+from systems.entity_systems import (magnet_system, formation_system, sync_rects, bounds_system,
+                                    overlap_rows, SCRAP_FLOOR)
+
+# --- SCRAP TYPES ---
+# One row of parameters per type, looked up by the "kind" column so the
+# magnet and pickup passes read whole tables instead of per-piece fields.
+#   weight:       weight added to Huey on pickup
+#   value:        score on pickup
+#   magnet_range: distance at which the magnet starts pulling it in
+#   drift:        downward drift while it floats free
+#   special:      plays the special pickup cue
+#   glow:         companion scrap halo colour
+SCRAP_TYPES = {
+    "bolt":        {"weight": 1,  "value": 10,   "magnet_range": 180, "drift": 25},
+    "gear":        {"weight": 45, "value": 50,   "magnet_range": 90,  "drift": 60},
+    "battery":     {"weight": 1,  "value": 100,  "magnet_range": 350, "drift": 10, "special": True},
+    "missile":     {"weight": 5,  "value": 0,    "magnet_range": 250, "drift": 15, "special": True},
+    "bomb":        {"weight": 15, "value": 0,    "magnet_range": 150, "drift": 40, "special": True},
+    # --- COMPANION SCRAPS ---
+    "red_core":    {"weight": 0,  "value": 500,  "magnet_range": 600, "drift": 10, "special": True, "glow": (255, 40, 40, 90)},
+    "tine_soul":   {"weight": 0,  "value": 500,  "magnet_range": 600, "drift": 10, "special": True, "glow": (160, 40, 255, 90)},
+    "gold_oracle": {"weight": 0,  "value": 1000, "magnet_range": 800, "drift": 5,  "special": True, "glow": (255, 255, 100, 110)}, # Cici is legendary!
+}
+SCRAP_KINDS = tuple(SCRAP_TYPES)
+SCRAP_KIND_INDEX = {name: i for i, name in enumerate(SCRAP_KINDS)}
+
+def _table(field):
+    values = [float(SCRAP_TYPES[name][field]) for name in SCRAP_KINDS]
+    return np.array(values) if np is not None else values
+
+# Per-kind columns for magnet_system
+SCRAP_TABLES = {"magnet_range": _table("magnet_range"), "drift_speed": _table("drift")}
+
+# Columns of the "scrap" archetype; magnet_system moves every piece at once
+SCRAP_COLUMNS = dict(x=0.0, y=0.0, half_w=0.0, half_h=0.0, bob_timer=0.0,
+                     attract_speed=0.0, kind=0)
+
+class Scrap(Entity, pygame.sprite.Sprite):
+    x = Component()
+    y = Component()
+    half_w = Component()
+    half_h = Component()
+    bob_timer = Component()
+    attract_speed = Component()
+    kind = Component()
 
-class Scrap(pygame.sprite.Sprite):
     def __init__(self, x, y, scrap_type, images):
         super().__init__()
+        # Unknown types fall back to a golden bolt
+        if scrap_type not in SCRAP_TYPES: scrap_type = "bolt"
+        spec = SCRAP_TYPES[scrap_type]
         self.scrap_type = scrap_type
-        
+        self.kind = SCRAP_KIND_INDEX[scrap_type]
+
         # --- STATS & POWERUPS ---
-        self.weight_value = 1
-        self.value = 10
-        self.magnet_range = 180
-        self.drift_speed = 25
-        self.is_companion_scrap = False
-
-        if self.scrap_type == "battery":
-            self.image = images['battery']
-            self.weight_value = 1   
-            self.value = 100        
-            self.magnet_range = 350 
-            self.drift_speed = 10   
-        
-        elif self.scrap_type == "gear":
-            self.image = images['gear']
-            self.weight_value = 45  
-            self.value = 50         
-            self.magnet_range = 90  
-            self.drift_speed = 60   
-            
-        elif self.scrap_type == "missile":
-            self.image = images['missile']
-            self.weight_value = 5   
-            self.value = 0          
-            self.magnet_range = 250 
-            self.drift_speed = 15   
-            
-        elif self.scrap_type == "bomb":
-            self.image = images['bomb']
-            self.weight_value = 15  
-            self.value = 0          
-            self.magnet_range = 150 
-            self.drift_speed = 40   
-
-        # --- COMPANION SCRAPS ---
-        elif self.scrap_type == "red_core":
-            self.image = images['red_core']
-            self.weight_value = 0   
-            self.value = 500
-            self.magnet_range = 600 
-            self.drift_speed = 10   
-            self.is_companion_scrap = True
-
-        elif self.scrap_type == "tine_soul":
-            self.image = images['tine_soul']
-            self.weight_value = 0
-            self.value = 500
-            self.magnet_range = 600
-            self.drift_speed = 10
-            self.is_companion_scrap = True
-            
-        elif self.scrap_type == "gold_oracle":
-            self.image = images['gold_oracle']
-            self.weight_value = 0
-            self.value = 1000 # Cici is legendary!
-            self.magnet_range = 800 # Super high attraction
-            self.drift_speed = 5
-            self.is_companion_scrap = True
-
-        else: # Golden Bolt
-            self.image = images['bolt']
-            self.weight_value = 1   
-            self.value = 10         
-            self.magnet_range = 180 
-            self.drift_speed = 25   
+        self.image = images[scrap_type]
+        self.weight_value = spec["weight"]
+        self.value = spec["value"]
+        self.is_companion_scrap = "glow" in spec
 
         self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.Vector2(x, y)
+        self.x, self.y = x, y
+        self.half_w, self.half_h = self.rect.width / 2, self.rect.height / 2
         self.bob_timer = random.uniform(0, math.pi * 2)
-        self.attract_speed = 0
-        self.max_attract_speed = 900 
-
-    def update(self, dt, player_pos):
-        self.bob_timer += 4 * dt
-        bob_offset = math.sin(self.bob_timer) * 0.8
-        
-        target_vec = pygame.Vector2(player_pos) - self.pos
-        distance = target_vec.length()
-        
-        if distance < self.magnet_range:
-            self.attract_speed = min(self.max_attract_speed, self.attract_speed + 1500 * dt)
-            move_dir = target_vec.normalize()
-            self.pos += move_dir * self.attract_speed * dt
-        else:
-            self.pos.x -= 250 * dt 
-            self.pos.y += (self.drift_speed * dt) + bob_offset 
-            self.attract_speed = 0 
-
-        if self.pos.y > GROUND_LINE - 20:
-            self.pos.y = GROUND_LINE - 20
-
-        self.rect.center = self.pos
+        self.attract_speed = 0.0
+
+# Columns of the "formation" archetype: a bolt wave that moves as one box
+FORMATION_COLUMNS = dict(x=0.0, y=0.0, half_w=0.0, half_h=0.0, bob_timer=0.0,
+                         drift_speed=0.0, max_y=0.0)
+BOLT_MAGNET_RANGE = SCRAP_TYPES["bolt"]["magnet_range"] # Formations split at a single bolt's range
+
+class BoltFormation(Entity, pygame.sprite.Sprite):
+    """
+    A bolt wave kept as one entity: one box to move and one pre-drawn image
+    to blit, however many bolts it holds. ScrapManager breaks it into single
+    bolts once the magnet could reach any of them.
+    """
+    x = Component()
+    y = Component()
+    half_w = Component()
+    half_h = Component()
+    bob_timer = Component()
+    drift_speed = Component()
+    max_y = Component()
+
+    def __init__(self, pieces, bolt_image):
+        super().__init__()
+        xs = [px for px, _ in pieces]
+        ys = [py for _, py in pieces]
+        cx, cy = (min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2
+        self.offsets = tuple((round(px - cx), round(py - cy)) for px, py in pieces)
+
+        self.image = get_asset_manager().baked(("bolt_formation", self.offsets),
+                                               lambda: self._build_image(bolt_image), [PLAYING])
+        self.rect = self.image.get_rect(center=(cx, cy))
+        self.x, self.y = cx, cy
+        self.half_w, self.half_h = self.rect.width / 2, self.rect.height / 2
+        self.bob_timer = random.uniform(0, math.pi * 2)
+        self.drift_speed = SCRAP_TYPES["bolt"]["drift"]
+        self.max_y = SCRAP_FLOOR - max(oy for _, oy in self.offsets)
+
+    def _build_image(self, bolt_image):
+        bw, bh = bolt_image.get_size()
+        min_x = min(ox for ox, _ in self.offsets)
+        min_y = min(oy for _, oy in self.offsets)
+        w = max(ox for ox, _ in self.offsets) - min_x + bw
+        h = max(oy for _, oy in self.offsets) - min_y + bh
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        for ox, oy in self.offsets:
+            surf.blit(bolt_image, (ox - min_x, oy - min_y))
+        return surf
+
+    def pieces(self):
+        return [(self.x + ox, self.y + oy) for ox, oy in self.offsets]
 
 class ScrapManager:
-    def __init__(self):
+    def __init__(self, world):
+        self.world = world
+        self.world.register("scrap", **SCRAP_COLUMNS)
+        self.world.register("formation", **FORMATION_COLUMNS)
         self.scrap_group = pygame.sprite.Group()
-        self.spawn_timer = 0
-        self.next_spawn_time = random.uniform(2.5, 4.5) 
+        self.formations = pygame.sprite.Group()
         
-        # --- SFX LOADING ---
-        try:
-            self.collect_sfx = pygame.mixer.Sound("assets/sfx/scrap_pickup.mp3")
-            self.collect_sfx.set_volume(0.2)
-            self.special_sfx = pygame.mixer.Sound("assets/sfx/special_pickup.mp3") # For cores/batteries
-            self.special_sfx.set_volume(0.4)
-        except:
-            self.collect_sfx = None
-            self.special_sfx = None
+        # --- SFX (same decoded sounds the Game uses) ---
+        self.collect_sfx = get_cue("scrap_pickup")
+        self.special_sfx = get_cue("special_pickup") # For cores/batteries
 
         path = "assets/sprites/scraps/"
+        assets = get_asset_manager()
         try:
             self.images = {
-                'bolt': pygame.image.load(path + "golden_bolt.png").convert_alpha(),
-                'gear': pygame.image.load(path + "heavy bronze gear.png").convert_alpha(),
-                'battery': pygame.image.load(path + "glowing_battery.png").convert_alpha(),
-                'missile': pygame.image.load(path + "missile_pickup.png").convert_alpha(),
-                'bomb': pygame.image.load(path + "gravity_bomb_pickup.png").convert_alpha(),
-                'red_core': pygame.image.load(path + "aether_core_red.png").convert_alpha(),
-                'tine_soul': pygame.image.load(path + "witch_soul_purple.png").convert_alpha(),
-                'gold_oracle': pygame.image.load(path + "goldencore.png").convert_alpha()
+                'bolt': assets.image(path + "golden_bolt.png", [PLAYING]),
+                'gear': assets.image(path + "heavy bronze gear.png", [PLAYING]),
+                'battery': assets.image(path + "glowing_battery.png", [PLAYING]),
+                'missile': assets.image(path + "missile_pickup.png", [PLAYING]),
+                'bomb': assets.image(path + "gravity_bomb_pickup.png", [PLAYING]),
+                'red_core': assets.image(path + "aether_core_red.png", [PLAYING]),
+                'tine_soul': assets.image(path + "witch_soul_purple.png", [PLAYING]),
+                'gold_oracle': assets.image(path + "goldencore.png", [PLAYING])
             }
         except:
             self.images = {k: pygame.Surface((30, 30)) for k in ['bolt', 'gear', 'battery', 'missile', 'bomb', 'red_core', 'tine_soul', 'gold_oracle']}
@@ -138,46 +152,55 @@ class ScrapManager:
 
     def play_pickup_sound(self, scrap_type):
         """Plays the appropriate sound based on what was collected."""
-        if scrap_type in ["red_core", "tine_soul", "gold_oracle", "battery"]:
+        if SCRAP_TYPES.get(scrap_type, {}).get("special"):
             if self.special_sfx: self.special_sfx.play()
         else:
             if self.collect_sfx: self.collect_sfx.play()
 
-    def spawn_pattern(self):
-        roll = random.random()
-        start_y = random.randint(100, GROUND_LINE - 200)
-        
-        if roll < 0.20:
-            sub_roll = random.random()
-            if sub_roll < 0.55: # Lowered to 10% of the 20% for Cici
-                choice = "gold_oracle"
-            elif sub_roll < 0.60: 
-                choice = "red_core"
-            else:
-                choice = "tine_soul"
-            self.scrap_group.add(Scrap(WIDTH + 100, start_y, choice, self.images))
-
-        elif roll < 0.60:
-            choice = random.choice(["bomb", "missile", "battery", "gear"])
-            self.scrap_group.add(Scrap(WIDTH + 50, start_y, choice, self.images))
-            
-        else:
-            count = random.randint(6, 12)
-            for i in range(count):
-                wave_y = start_y + math.sin(i * 0.5) * 25
-                self.scrap_group.add(Scrap(WIDTH + (i * 55), wave_y, "bolt", self.images))
-
-    def update(self, dt, player_pos):
-        self.spawn_timer += dt
-        if self.spawn_timer >= self.next_spawn_time:
-            self.spawn_pattern()
-            self.spawn_timer = 0
-            self.next_spawn_time = random.uniform(2.5, 4.5) 
-            
-        self.scrap_group.update(dt, player_pos)
-        for scrap in self.scrap_group:
-            if scrap.rect.right < -200:
-                scrap.kill()
+    def place(self, wave):
+        """
+        Spawns a scrap wave laid out by world.world_gen (rolled, or a story
+        level's own waves): (x, y, type) per piece. Its bolts arrive as one BoltFormation.
+        """
+        bolts = [(x, y) for x, y, scrap_type in wave if scrap_type == "bolt"]
+        if len(bolts) > 1:
+            formation = BoltFormation(bolts, self.images['bolt'])
+            formation.spawn_in(self.world, "formation")
+            self.formations.add(formation)
+        for x, y, scrap_type in wave:
+            if scrap_type != "bolt" or len(bolts) == 1:
+                self.add(Scrap(x, y, scrap_type, self.images))
+
+    def add(self, scrap):
+        scrap.spawn_in(self.world, "scrap")
+        self.scrap_group.add(scrap)
+
+    def split(self, formation):
+        """Replaces a formation with loose bolts where its pieces are drawn."""
+        for x, y in formation.pieces():
+            bolt = Scrap(x, y, "bolt", self.images)
+            bolt.bob_timer = formation.bob_timer
+            self.add(bolt)
+        formation.kill()
+
+    def collect(self, rect):
+        """Removes and returns every piece whose box overlaps rect, in one pass."""
+        rows = overlap_rows(self.world, "scrap", rect)
+        collected = self.world.despawn_rows("scrap", rows) if rows else []
+        for scrap in collected: scrap.kill()
+        return collected
+
+    def update(self, dt, player_pos, scroll_speed):
+        # Formations only cost one row each until the magnet reaches them
+        rows = formation_system(self.world, "formation", dt, player_pos, BOLT_MAGNET_RANGE, scroll_speed)
+        for formation in self.world.despawn_rows("formation", rows):
+            self.split(formation)
+        sync_rects(self.world, "formation")
+        bounds_system(self.world, "formation", left=-200)
+
+        magnet_system(self.world, "scrap", dt, player_pos, SCRAP_TABLES, scroll_speed)
+        sync_rects(self.world, "scrap")
+        bounds_system(self.world, "scrap", left=-200)
 
     def draw(self, screen):
         for scrap in self.scrap_group:
@@ -188,16 +211,12 @@ class ScrapManager:
                 
                 glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
                 
-                if scrap.scrap_type == "red_core":
-                    color = (255, 40, 40, 90)
-                elif scrap.scrap_type == "tine_soul":
-                    color = (160, 40, 255, 90)
-                else: 
-                    color = (255, 255, 100, 110) 
+                color = SCRAP_TYPES[scrap.scrap_type]["glow"]
                 
                 pygame.draw.circle(glow_surf, color, (int(glow_size), int(glow_size)), int(glow_size))
                 pygame.draw.circle(glow_surf, (255, 255, 255, 150), (int(glow_size), int(glow_size)), int(glow_size/2.5))
                 
                 screen.blit(glow_surf, glow_surf.get_rect(center=scrap.rect.center))
         
+        self.formations.draw(screen)
         self.scrap_group.draw(screen)
\ No newline at end of file
@@ -4,23 +4,31 @@ import random
 import math
 from settings import *
 from core.engine import Engine
+from core.ecs import World
+from core.scheduler import Scheduler
 from entities.player import Player
 from world.parallax import ParallaxBackground
-from entities.scrap import ScrapManager
+from entities.scrap import ScrapManager, SCRAP_TYPES
 from entities.enemy_manager import EnemyManager
 from world.ground_logic import Ground       
 from world.obstacle_gen import ObstacleManager 
+from world.world_gen import WorldGenerator
 from ui.menus import MainMenu, GameOverScreen
 from ui.hud import HUD               
+from ui.glyph_atlas import get_atlas
 from ui.dialogue_box import DialogueBox 
 
 # --- SYSTEMS IMPORTS ---
 from systems.combat_system import CombatSystem
+from systems.targeting import Targeting
 from systems.heat_system import HeatSystem
 from systems.upgrade_manager import UpgradeManager
+from systems.sfx_bank import get_cue
+from systems.combat_events import PLAYER_HIT, DEATH, PICKUP
+from managers.asset_manager import get_asset_manager, PLAYING, BOSS
+from managers.mode_manager import ModeManager
 from ui.workshop_menu import WorkshopMenu 
 from entities.projectiles import GravityWave, GloomLaser
-from entities.enemies import BlightBeast, GloomBat, BushMonster, MonsterSaucer, BlightTitan
 
 # --- COMPANION SYSTEM IMPORT ---
 from entities.companions import CompanionManager
@@ -32,13 +40,19 @@ class Game:
     def __init__(self, screen):
         self.screen = screen
         self.state = "MENU"
-        self.menu = MainMenu(self.screen)
-        self.game_over_screen = GameOverScreen(self.screen)
+        self.assets = get_asset_manager()
+        self.menu = MainMenu()
+        self.game_over_screen = GameOverScreen()
         
         self.upgrade_manager = UpgradeManager()
-        self.workshop = WorkshopMenu(self.screen, self.upgrade_manager) 
+        self.mode_manager = ModeManager(self.upgrade_manager)
+        self.workshop = WorkshopMenu(self.upgrade_manager) 
         
         self.intro_cutscene = None
+        self.scheduler = Scheduler() # Simulated time of the current run
+        self.world_gen = None
+        self.world = None
+        self.targeting = None
         self.player = None
         self.parallax = None
         self.ground = None          
@@ -48,27 +62,17 @@ class Game:
         self.companion_manager = None 
         self.combat_system = None
         self.heat_system = HeatSystem()
-        self.hud = HUD()            
+        self.hud = HUD(self.scheduler)            
         self.dialogue = DialogueBox() 
         self.score = 0
         self.difficulty_mult = 1.0 
+        self.run_title = "SYSTEM FAILURE"
 
-        # --- AUDIO ASSETS ---
-        try:
-            self.sfx_scrap_normal = pygame.mixer.Sound("assets/sfx/scrap_pickup.mp3")
-            self.sfx_scrap_special = pygame.mixer.Sound("assets/sfx/special_pickup.mp3")
-            self.sfx_explosion = pygame.mixer.Sound("assets/sfx/explosion.wav") 
-            try:
-                self.sfx_gravity_boom = pygame.mixer.Sound("assets/sfx/explosion.wav") 
-            except:
-                self.sfx_gravity_boom = self.sfx_explosion
-
-            self.sfx_scrap_normal.set_volume(0.5)
-            self.sfx_scrap_special.set_volume(0.7)
-            self.sfx_explosion.set_volume(0.4)
-            if self.sfx_gravity_boom: self.sfx_gravity_boom.set_volume(0.8)
-        except:
-            self.sfx_scrap_normal = self.sfx_scrap_special = self.sfx_explosion = self.sfx_gravity_boom = None
+        # --- AUDIO ASSETS (decoded once, budgeted by the shared SFX bank) ---
+        self.sfx_scrap_normal = get_cue("scrap_pickup")
+        self.sfx_scrap_special = get_cue("special_pickup")
+        self.sfx_explosion = get_cue("explosion")
+        self.sfx_gravity_boom = get_cue("gravity_boom") or self.sfx_explosion
 
         self.play_menu_music()
 
@@ -89,6 +93,24 @@ class Game:
             pygame.mixer.music.play(-1)
         except: pass
 
+    def end_session(self):
+        """Drops the gameplay world so its PLAYING/BOSS surfaces can really be freed."""
+        self.stop_player_sfx()
+        self.scheduler.clear()
+        if self.world_gen: self.world_gen.stop()
+        self.world_gen = None
+        self.world = self.targeting = self.player = self.parallax = self.ground = None
+        self.obstacle_manager = self.scrap_manager = self.enemy_manager = None
+        self.companion_manager = self.combat_system = None
+
+    def active_scenes(self):
+        if self.state in ["MENU", "STORY", "WORKSHOP"]:
+            return {self.state}
+        scenes = {PLAYING}
+        if self.enemy_manager and self.enemy_manager.boss_active:
+            scenes.add(BOSS)
+        return scenes
+
     def stop_player_sfx(self):
         """Stops mechanical SFX on death/menu but leaves BGM alone."""
         if self.player:
@@ -98,6 +120,15 @@ class Game:
                 self.player.laser_channel.stop()
 
     def reset_game(self):
+        # Enemies, bullets, scrap and companions of this run live in one entity world
+        self.world = World()
+        self.scheduler = Scheduler()
+        self.difficulty_mult = 1.0
+        # One seed lays out the whole run (see world.world_gen); a story
+        # level brings its own, plus its enemy timeline and scrap waves
+        self.seed = self.mode_manager.run_seed()
+        level = self.mode_manager.level
+        self.targeting = Targeting(self.world)
         self.player = Player()
         self.heat_system = HeatSystem()
         self.combat_system = CombatSystem(self)
@@ -115,25 +146,62 @@ class Game:
         self.parallax = ParallaxBackground()
         self.ground = Ground()      
         self.obstacle_manager = ObstacleManager() 
-        self.scrap_manager = ScrapManager()
-        self.enemy_manager = EnemyManager(self)
-        self.companion_manager = CompanionManager(self.player) 
+        self.scrap_manager = ScrapManager(self.world)
+        self.enemy_manager = EnemyManager(self, level)
+        self.companion_manager = CompanionManager(self.player, self.world, self.scheduler, self.targeting) 
+
+        # Pickup cue tag and effect per scrap type, resolved once per run
+        effects = {
+            "red_core": lambda: self.companion_manager.summon("RED"),
+            "tine_soul": lambda: self.companion_manager.summon("TINE"),
+            "gold_oracle": lambda: self.companion_manager.summon("CICI"),
+            "missile": self._gain_missiles,
+            "bomb": self._gain_bombs,
+            "battery": self._cool_heat,
+        }
+        self.pickup_table = {name: ("special" if spec.get("special") else "normal", effects.get(name))
+                             for name, spec in SCRAP_TYPES.items()}
+
+        handlers = {"rock": self.obstacle_manager.place, "scrap": self.scrap_manager.place}
+        if level is None:
+            handlers["enemy"] = self.enemy_manager.place
+        if self.world_gen: self.world_gen.stop()
+        self.world_gen = WorldGenerator(self.seed, self.obstacle_manager.rock_img, handlers,
+                                        level.scrap_waves() if level else None)
+
+        events = self.combat_system.manager.events
+        events.subscribe(PLAYER_HIT, self._on_player_hits)
+        events.subscribe(DEATH, self._on_deaths)
+        events.subscribe(PICKUP, self._on_pickups)
         
-        self.hud = HUD()            
+        self.hud = HUD(self.scheduler)            
         self.dialogue = DialogueBox() 
         self.score = 0
-        self.difficulty_mult = 1.0
         self.state = "PLAYING"
         
         self.play_random_bgm()
         self.dialogue.trigger_random_quip("enemies")
 
+    def start_story_level(self):
+        """Starts the current story level once its timelines and assets are loaded."""
+        self.mode_manager.start_level(self.mode_manager.current_level_id)
+        self.reset_game()
+
+    def end_run(self, was_victory):
+        self.stop_player_sfx()
+        summary = self.mode_manager.handle_run_completion(self.score, self.player.distance, was_victory)
+        self.run_title = summary["message"] if self.mode_manager.current_mode == "STORY" else "SYSTEM FAILURE"
+        self.game_over_screen.set_next_level(summary["next_level"])
+        self.state = "GAMEOVER"
+
     def handle_event(self, event):
         if self.state == "MENU":
             selection = self.menu.handle_input(event)
             if selection == "Start Game":
-                self.intro_cutscene = IntroCutscene(self.screen)
+                self.mode_manager.set_mode("ARCADE", self.mode_manager.current_level_id)
+                self.intro_cutscene = IntroCutscene()
                 self.state = "STORY"
+            elif selection == "Story Mode": self.start_story_level()
             elif selection == "Workshop": self.state = "WORKSHOP"
             elif selection == "Exit": sys.exit()
         
@@ -146,8 +214,14 @@ class Game:
 
         elif self.state == "GAMEOVER":
             selection = self.game_over_screen.handle_input(event)
-            if selection == "Retry": self.reset_game()
+            if selection == "Next Level":
+                self.mode_manager.next_level()
+                self.start_story_level()
+            elif selection == "Retry":
+                if self.mode_manager.current_mode == "STORY": self.start_story_level()
+                else: self.reset_game()
             elif selection == "Main Menu":
+                self.end_session()
                 self.state = "MENU"
                 self.play_menu_music()
             elif selection == "Exit": sys.exit()
@@ -156,23 +230,24 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p: self.state = "PAUSED"
                 if event.key == pygame.K_ESCAPE:
-                    self.stop_player_sfx()
+                    self.end_session()
                     self.state = "MENU"
                     self.play_menu_music()
+                    return
                 
                 if event.key == pygame.K_r and self.player.missiles > 0:
                     self.player.missiles -= 1
-                    self.combat_system.manager.launch_missile(self.player, self.enemy_manager.enemies)
+                    self.combat_system.manager.launch_missile(self.player)
                 
                 if event.key == pygame.K_g and self.player.bombs > 0:
                     self.player.bombs -= 1
-                    self.combat_system.manager.trigger_gravity_bomb(self.player, self.enemy_manager.enemies)
+                    self.combat_system.manager.trigger_gravity_bomb(self.player)
                     if self.sfx_gravity_boom: self.sfx_gravity_boom.play()
 
                 if event.key == pygame.K_q and self.player.lightning_charges > 0:
                     self.player.lightning_charges -= 1
                     if hasattr(self.player, 'play_lightning_sfx'): self.player.play_lightning_sfx()
-                    targets = list(self.enemy_manager.enemies)[:3]
+                    targets = self.targeting.on_screen(self.player.rect.center, 3)
                     self.combat_system.manager.spawn_lightning(self.player.rect.center, targets)
         
         elif self.state == "PAUSED":
@@ -180,6 +255,10 @@ class Game:
                 self.state = "PLAYING"
 
     def update(self, dt, flight_input, combat_input):
+        # Scene changes release the previous scene's surfaces
+        self.assets.set_active_scenes(self.active_scenes())
+        self.assets.next_frame()
+
         if self.state == "STORY":
             if self.intro_cutscene:
                 self.intro_cutscene.update(dt)
@@ -192,20 +271,25 @@ class Game:
             elif self.state == "GAMEOVER": self.game_over_screen.update(dt)
             return
 
-        self.difficulty_mult = min(2.0, 1.0 + (self.player.distance / 5000) * 0.1)
+        self.difficulty_mult = self.mode_manager.get_spawn_difficulty(self.player.distance)
         current_scroll_speed = BASE_SCROLL_SPEED * self.difficulty_mult
         scroll_move = dt * current_scroll_speed if self.player.is_alive else 0
         self.player.distance += scroll_move
+        # Rocks, scrap and enemies the player has now reached
+        self.world_gen.advance(self.player.distance)
+        # Spawns, companion attacks and hint timeouts that are due this frame
+        self.scheduler.tick(dt)
         
         if self.enemy_manager.boss_active:
             self.parallax.enter_boss_mode()
         else:
             self.parallax.target_boss_factor = 0.0
 
-        self.parallax.update(self.player.distance, dt) 
+        self.parallax.update(self.player.distance, dt, self.enemy_manager.sky_alpha) 
         self.ground.update(dt, self.player.rect, self.player.is_skimming) 
         self.obstacle_manager.update(dt, self.difficulty_mult) 
-        self.scrap_manager.update(dt, self.player.rect.center)
+        # Free scrap scrolls with the rocks, so world_gen's overlap check holds
+        self.scrap_manager.update(dt, self.player.rect.center, current_scroll_speed)
         
         self.player.handle_input(flight_input, dt) 
         self.player.update(dt)
@@ -221,7 +305,7 @@ class Game:
             if firing_mg:
                 # Lowered from 120 to 45 for better sustain
                 self.heat_system.add_heat(45 * dt) 
-                self.combat_system.manager.fire_machine_gun(self.player, self.enemy_manager.enemies, dt)
+                self.combat_system.manager.fire_machine_gun(self.player, dt)
                 is_firing_any = True
             
             if firing_laser:
@@ -231,41 +315,58 @@ class Game:
                 self.player.laser_fuel -= 15 * dt 
                 is_firing_any = True
 
-        if self.companion_manager: self.companion_manager.update(dt, self.enemy_manager.enemies)
+        if self.companion_manager: self.companion_manager.update(dt)
         
         if not self.player.is_alive and self.player.has_exploded:
-            self.stop_player_sfx()
-            self.upgrade_manager.convert_score_to_bolts(self.score)
-            self.state = "GAMEOVER"
+            self.end_run(False)
+        elif not self.enemy_manager.boss_active and self.mode_manager.check_victory_condition(self.player.distance):
+            self.end_run(True)
 
         self.heat_system.update(dt, is_firing_any)
         self.combat_system.update(dt)
         self.enemy_manager.update(dt, self.player.rect.center, self.combat_system.manager, self.difficulty_mult) 
+        # Enemies moved and spawned: the next query rebuilds the lookup
+        self.targeting.invalidate()
         
         self.hud.update(dt, self.player)     
         self.dialogue.update(dt, self.player) 
         self._handle_collisions()
+        self.combat_system.manager.flush_events()
+
+    # --- COALESCED COMBAT FEEDBACK (one pass per frame) ---
+    def _on_player_hits(self, events):
+        pm = self.combat_system.manager
+        for ev in events: pm.trigger_explosion(ev.x, ev.y)
+        if self.sfx_explosion: self.sfx_explosion.play()
+
+    def _on_deaths(self, events):
+        for ev in events: self.enemy_manager.trigger_death_effect(ev.x, ev.y)
+        if self.sfx_explosion: self.sfx_explosion.play()
+
+    def _on_pickups(self, events):
+        tags = {ev.tag for ev in events}
+        if "special" in tags and self.sfx_scrap_special: self.sfx_scrap_special.play()
+        if "normal" in tags and self.sfx_scrap_normal: self.sfx_scrap_normal.play()
 
     def _handle_collisions(self):
         pm = self.combat_system.manager 
+        events = pm.events
         if pygame.sprite.spritecollide(self.player, self.obstacle_manager.obstacles, True, pygame.sprite.collide_mask):
             self.player.take_damage(25) 
-            pm.trigger_explosion(self.player.rect.centerx, self.player.rect.centery)
-            if self.sfx_explosion: self.sfx_explosion.play()
+            events.post(PLAYER_HIT, self.player.rect.centerx, self.player.rect.centery)
 
-        bullet_hits = pygame.sprite.spritecollide(self.player, pm.enemy_bullets, True)
-        for bullet in bullet_hits:
+        # Lasers are sprites; bullets are tested against the player in one pass
+        bullet_hits = [bullet.rect.center for bullet in pygame.sprite.spritecollide(self.player, pm.enemy_bullets, True)]
+        bullet_hits += pm.enemy_bullet_hits(self.player.rect)
+        for x, y in bullet_hits:
             self.player.take_damage(10)
-            pm.trigger_explosion(bullet.rect.centerx, bullet.rect.centery)
-            if self.sfx_explosion: self.sfx_explosion.play()
+            events.post(PLAYER_HIT, x, y)
 
         for enemy in self.enemy_manager.enemies:
             if enemy.hp <= 0:
-                is_boss = isinstance(enemy, BlightTitan)
-                self.enemy_manager.trigger_death_effect(enemy.rect.centerx, enemy.rect.centery)
-                if self.sfx_explosion: self.sfx_explosion.play()
+                events.post(DEATH, enemy.rect.centerx, enemy.rect.centery)
                 
-                if is_boss:
+                if enemy.is_boss:
                     self.score += 15000
                     self.player.scrap += 250
                     self.enemy_manager.set_next_boss()
@@ -276,37 +377,38 @@ class Game:
                     self.player.scrap += 1
                 enemy.kill()
 
-        scrap_hits = pygame.sprite.spritecollide(self.player, self.scrap_manager.scrap_group, True)
-        for scrap in scrap_hits:
+        for scrap in self.scrap_manager.collect(self.player.rect):
             self.score += scrap.value
             self.player.scrap += 5 
             self.player.weight = min(self.player.max_weight, self.player.weight + scrap.weight_value)
-            
-            if scrap.scrap_type in ["red_core", "tine_soul", "gold_oracle", "glowing_battery", "missile", "bomb"]:
-                if self.sfx_scrap_special: self.sfx_scrap_special.play()
-            else:
-                if self.sfx_scrap_normal: self.sfx_scrap_normal.play()
-
-            if scrap.scrap_type == "red_core": self.companion_manager.summon("RED")
-            elif scrap.scrap_type == "tine_soul": self.companion_manager.summon("TINE")
-            elif scrap.scrap_type == "gold_oracle": self.companion_manager.summon("CICI")
-            elif scrap.scrap_type == "missile": self.player.missiles = min(self.player.max_missiles, self.player.missiles + 5)
-            elif scrap.scrap_type == "bomb": self.player.bombs = min(self.player.max_bombs, self.player.bombs + 2)
-            elif scrap.scrap_type == "glowing_battery": self.heat_system.heat = max(0, self.heat_system.heat - 30)
+
+            tag, effect = self.pickup_table[scrap.scrap_type]
+            events.post(PICKUP, scrap.rect.centerx, scrap.rect.centery, tag=tag, key=tag)
+            if effect: effect()
+
+    # --- PICKUP EFFECTS ---
+    def _gain_missiles(self):
+        self.player.missiles = min(self.player.max_missiles, self.player.missiles + 5)
+
+    def _gain_bombs(self):
+        self.player.bombs = min(self.player.max_bombs, self.player.bombs + 2)
+
+    def _cool_heat(self):
+        self.heat_system.heat = max(0, self.heat_system.heat - 30)
 
     def draw(self, screen):
         if self.state == "MENU": 
-            self.menu.draw()
+            self.menu.draw(screen)
             return 
         if self.state == "STORY":
-            if self.intro_cutscene: self.intro_cutscene.draw()
+            if self.intro_cutscene: self.intro_cutscene.draw(screen)
             return
         if self.state == "WORKSHOP": 
-            self.workshop.draw()
+            self.workshop.draw(screen)
             return
 
         self.parallax.draw(screen)
-        self.ground.draw(screen)      
+        self.ground.draw(screen, self.parallax.sky_tint)      
         self.obstacle_manager.draw(screen)
         self.scrap_manager.draw(screen)
         self.enemy_manager.draw(screen)
@@ -317,18 +419,17 @@ class Game:
         self.dialogue.draw(screen)
 
         if self.state == "PAUSED": self._draw_pause_overlay(screen)
-        if self.state == "GAMEOVER": self.game_over_screen.draw(self.player.distance, self.score)
+        if self.state == "GAMEOVER": self.game_over_screen.draw(screen, self.player.distance, self.score, self.run_title)
 
     def _draw_pause_overlay(self, screen):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150)) 
-        screen.blit(overlay, (0, 0))
-        try:
-            font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 72)
-        except:
-            font = pygame.font.SysFont("Impact", 72)
-        text = font.render("PAUSED", True, WHITE)
-        screen.blit(text, text.get_rect(center=(WIDTH//2, HEIGHT//2)))
+        def build_overlay():
+            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 150)) 
+            return overlay
+        screen.blit(self.assets.baked(("pause_overlay",), build_overlay, [PLAYING]), (0, 0))
+        font = get_atlas(FONT_MAIN, 72, ("Impact", 72, False, False))
+        text_w, text_h = font.size("PAUSED")
+        font.draw(screen, "PAUSED", (WIDTH//2 - text_w//2, HEIGHT//2 - text_h//2), WHITE)
 
 if __name__ == "__main__":
     engine = Engine()
@@ -0,0 +1,147 @@
+import pygame
+from settings import SURFACE_MEMORY_BUDGET_MB
+
+# --- SCENES ---
+# Assets are tagged with every scene that draws them. An asset stays resident
+# while at least one of its scenes is active and is dropped when the last exits.
+MENU = "MENU"
+STORY = "STORY"
+WORKSHOP = "WORKSHOP"
+PLAYING = "PLAYING"
+BOSS = "BOSS"
+
+
+def surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+class _Asset:
+    __slots__ = ("surface", "scenes", "refs", "nbytes", "last_used")
+
+    def __init__(self, surface, scenes, refs, tick):
+        self.surface = surface
+        self.scenes = scenes
+        self.refs = refs
+        self.nbytes = surface_bytes(surface)
+        self.last_used = tick
+
+
+class AssetManager:
+    """
+    Scene-scoped surface cache. Every image is loaded (and scaled) once, shared
+    by all its users, reference-counted by active scenes and evicted on scene
+    exit. Owners should fetch surfaces through the manager rather than keep
+    their own long-lived copies, otherwise eviction cannot free them.
+    """
+    def __init__(self, budget_mb=SURFACE_MEMORY_BUDGET_MB):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.assets = {}
+        self.active_scenes = set()
+        self.tick = 0
+
+        self.current_bytes = 0
+        self.peak_bytes = 0
+        self.evictions = 0
+        self.over_budget = False
+
+    # --- LOOKUP ---
+
+    def image(self, path, scenes=None, alpha=True, size=None):
+        """Loads an image file once. Raises like pygame.image.load if it is missing."""
+        key = (path, size, alpha)
+        asset = self.assets.get(key)
+        if asset is None:
+            surf = pygame.image.load(path)
+            surf = surf.convert_alpha() if alpha else surf.convert()
+            if size is not None and surf.get_size() != tuple(size):
+                surf = pygame.transform.scale(surf, size)
+            asset = self._store(key, surf, scenes)
+        asset.last_used = self.tick
+        return asset.surface
+
+    def baked(self, key, builder, scenes=None):
+        """Caches a generated surface; builder() is only called on a miss."""
+        asset = self.assets.get(key)
+        if asset is None:
+            asset = self._store(key, builder(), scenes)
+        asset.last_used = self.tick
+        return asset.surface
+
+    def _store(self, key, surf, scenes):
+        scenes = frozenset(scenes) if scenes else None
+        refs = 1 if scenes is None else len(scenes & self.active_scenes)
+        asset = _Asset(surf, scenes, refs, self.tick)
+        self.assets[key] = asset
+        self.current_bytes += asset.nbytes
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        if self.current_bytes > self.budget_bytes:
+            self._enforce_budget()
+        return asset
+
+    # --- SCENE LIFETIMES ---
+
+    def set_active_scenes(self, scenes):
+        scenes = set(scenes)
+        if scenes == self.active_scenes:
+            return
+        for scene in self.active_scenes - scenes: self.exit_scene(scene)
+        for scene in scenes - self.active_scenes: self.enter_scene(scene)
+
+    def enter_scene(self, scene):
+        if scene in self.active_scenes: return
+        self.active_scenes.add(scene)
+        for asset in self.assets.values():
+            if asset.scenes and scene in asset.scenes:
+                asset.refs += 1
+
+    def exit_scene(self, scene):
+        if scene not in self.active_scenes: return
+        self.active_scenes.discard(scene)
+        for key, asset in list(self.assets.items()):
+            if asset.scenes and scene in asset.scenes:
+                asset.refs -= 1
+                if asset.refs <= 0:
+                    self._evict(key)
+
+    def _evict(self, key):
+        asset = self.assets.pop(key)
+        self.current_bytes -= asset.nbytes
+        self.evictions += 1
+
+    def _enforce_budget(self):
+        """Drops unreferenced assets, least recently used first."""
+        idle = [k for k, a in self.assets.items() if a.refs <= 0]
+        idle.sort(key=lambda k: self.assets[k].last_used)
+        for key in idle:
+            if self.current_bytes <= self.budget_bytes: break
+            self._evict(key)
+
+        over = self.current_bytes > self.budget_bytes
+        if over and not self.over_budget:
+            print(f"AssetManager: {self.current_bytes / 1048576:.1f} MB resident exceeds "
+                  f"{self.budget_bytes / 1048576:.0f} MB budget (scenes: {sorted(self.active_scenes)})")
+        self.over_budget = over
+
+    # --- REPORTING ---
+
+    def next_frame(self):
+        self.tick += 1
+
+    def report(self):
+        return {
+            "current_mb": self.current_bytes / 1048576,
+            "peak_mb": self.peak_bytes / 1048576,
+            "budget_mb": self.budget_bytes / 1048576,
+            "assets": len(self.assets),
+            "evictions": self.evictions,
+            "scenes": sorted(self.active_scenes),
+        }
+
+
+_assets = None
+
+def get_asset_manager():
+    global _assets
+    if _assets is None:
+        _assets = AssetManager()
+    return _assets
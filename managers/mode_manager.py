@@ -1,4 +1,165 @@
+import os
+import json
+import random
+import struct
 from settings import *
+from world.world_gen import ENEMY_SPAWN_X, difficulty_at, roll_enemy, roll_scrap_wave, bolt_wave
+from managers.asset_manager import get_asset_manager
+
+# --- STORY LEVELS ---
+# Each level is a data file (assets/levels/level_N.json) listing its goal,
+# optional boss distance, the assets it needs and its enemy / scrap waves.
+# Waves are compiled once into flat binary timelines of fixed-size records
+# sorted by distance, so a level costs a few KB and the run only has to
+# compare the player's distance against the next record.
+#
+#   {"from": 600, "to": 2600, "every": 520, "kind": "MonsterSaucer", "y": [120, 400]}
+#   {"at": 2200, "kind": "red_core", "y": 260}
+#
+# Enemy kinds are the EnemyManager names or "random"; scrap kinds are scrap
+# types, "bolts" (a bolt line, optional "count") or "random" (the arcade roll).
+# Ranges and rolls are resolved at compile time from the level's seed.
+
+LEVEL_DIR = "assets/levels"
+LEVEL_CACHE_DIR = "assets/levels/cache"
+
+ENEMY_KINDS = ("BlightBeast", "GloomBat", "MonsterSaucer", "BushMonster")
+SCRAP_KINDS = ("bolt", "gear", "battery", "missile", "bomb", "red_core", "tine_soul", "gold_oracle")
+
+RECORD = struct.Struct("<fBhh")   # distance, kind index, x, y
+HEADER = struct.Struct("<4sII")   # magic, enemy records, scrap records
+MAGIC = b"ZLV1"
+
+
+class Timeline:
+    """Cursor over a compiled timeline; due() only looks at the next record."""
+    def __init__(self, data, kinds):
+        self.data = data
+        self.kinds = kinds
+        self.count = len(data) // RECORD.size
+        self.index = 0
+        self.next_at = self._distance(0)
+
+    def _distance(self, index):
+        if index >= self.count: return float('inf')
+        return RECORD.unpack_from(self.data, index * RECORD.size)[0]
+
+    def due(self, distance):
+        """(kind, x, y) of every record the player has reached since the last call."""
+        items = []
+        while self.next_at <= distance:
+            _, kind, x, y = RECORD.unpack_from(self.data, self.index * RECORD.size)
+            items.append((self.kinds[kind], x, y))
+            self.index += 1
+            self.next_at = self._distance(self.index)
+        return items
+
+
+class Level:
+    def __init__(self, level_id, meta, enemies, scrap):
+        self.level_id = level_id
+        self.name = meta.get("name", f"Level {level_id}")
+        self.seed = meta.get("seed", level_id)
+        self.goal = meta.get("goal", 3000 + level_id * 2000)
+        self.boss_at = meta.get("boss_at")
+        self.manifest = meta.get("manifest", {})
+        self.enemy_data = enemies
+        self.scrap_data = scrap
+
+    def enemy_timeline(self):
+        return Timeline(self.enemy_data, ENEMY_KINDS)
+
+    def scrap_waves(self):
+        """Scrap records grouped by distance: [(distance, [(x, y, kind), ...]), ...].
+        world.world_gen lays them out so they keep clear of the level's rocks."""
+        waves = []
+        for offset in range(0, len(self.scrap_data), RECORD.size):
+            d, kind, x, y = RECORD.unpack_from(self.scrap_data, offset)
+            if not waves or waves[-1][0] != d: waves.append((d, []))
+            waves[-1][1].append((x, y, SCRAP_KINDS[kind]))
+        return waves
+
+
+def level_path(level_id, level_dir=LEVEL_DIR):
+    return os.path.join(level_dir, f"level_{level_id}.json")
+
+def level_exists(level_id, level_dir=LEVEL_DIR):
+    return os.path.exists(level_path(level_id, level_dir))
+
+def _wave_distances(wave):
+    if "at" in wave: return [wave["at"]]
+    return list(range(wave["from"], wave["to"], wave["every"]))
+
+def _wave_y(rng, wave, low, high):
+    y = wave.get("y", [low, high])
+    return rng.randint(*y) if isinstance(y, list) else y
+
+def compile_level(meta):
+    """Wave entries -> (enemy records, scrap records) as bytes."""
+    rng = random.Random(meta.get("seed", 0))
+    enemies, scrap = [], []
+
+    for wave in meta.get("enemies", []):
+        for d in _wave_distances(wave):
+            kind = wave["kind"]
+            if kind == "random": kind = roll_enemy(rng)
+            enemies.append((d, ENEMY_KINDS.index(kind), ENEMY_SPAWN_X, _wave_y(rng, wave, 100, HEIGHT - 100)))
+
+    for wave in meta.get("scrap", []):
+        for d in _wave_distances(wave):
+            y = _wave_y(rng, wave, 100, GROUND_LINE - 200)
+            kind = wave["kind"]
+            if kind == "random": items = roll_scrap_wave(rng, y)
+            elif kind == "bolts": items = bolt_wave(y, wave.get("count", rng.randint(6, 12)))
+            else: items = [(WIDTH + 50, y, kind)]
+            scrap += [(d, SCRAP_KINDS.index(t), int(x), int(round(iy))) for x, iy, t in items]
+
+    # Stable sort keeps the pieces of one wave in their original order
+    enemies.sort(key=lambda r: r[0])
+    scrap.sort(key=lambda r: r[0])
+    return (b"".join(RECORD.pack(*r) for r in enemies),
+            b"".join(RECORD.pack(*r) for r in scrap))
+
+def _cache_path(level_id, cache_dir=LEVEL_CACHE_DIR):
+    return os.path.join(cache_dir, f"level_{level_id}.bin")
+
+def _read_cache(level_id, source):
+    cached = _cache_path(level_id)
+    try:
+        if os.path.getmtime(cached) < os.path.getmtime(source): return None
+        with open(cached, "rb") as f:
+            data = f.read()
+        magic, n_enemy, n_scrap = HEADER.unpack_from(data)
+        if magic != MAGIC: return None
+        split = HEADER.size + n_enemy * RECORD.size
+        return data[HEADER.size:split], data[split:split + n_scrap * RECORD.size]
+    except:
+        return None
+
+_levels = {}
+
+def load_level(level_id):
+    """Loads a level the first time it is played; compiled timelines come from
+    the cache when it is fresh, otherwise the waves are compiled in memory."""
+    level = _levels.get(level_id)
+    if level is None:
+        source = level_path(level_id)
+        with open(source) as f:
+            meta = json.load(f)
+        timelines = _read_cache(level_id, source) or compile_level(meta)
+        level = _levels[level_id] = Level(level_id, meta, *timelines)
+    return level
+
+def prefetch(manifest):
+    """Loads a level's images into the asset manager ahead of its first frame."""
+    assets = get_asset_manager()
+    for scene, paths in manifest.items():
+        for path in paths:
+            try:
+                assets.image(path, [scene])
+            except:
+                pass
+
 
 class ModeManager:
     """
@@ -13,6 +174,7 @@ class ModeManager:
         self.current_level_id = 1
         self.story_goal_distance = 5000 # 5km to finish a level
         self.is_boss_active = False
+        self.level = None # Compiled data of the story level being played
 
     def set_mode(self, mode, level_id=1):
         """Switches the game mode and resets mode-specific goals."""
@@ -25,6 +187,25 @@ class ModeManager:
             self.story_goal_distance = 3000 + (level_id * 2000)
         else:
             self.story_goal_distance = float('inf') # Infinite for Arcade
+            self.level = None
+
+    def start_level(self, level_id):
+        """Loads (and compiles, on first play) a story level and prefetches its assets."""
+        self.set_mode("STORY", level_id)
+        self.level = load_level(level_id)
+        self.story_goal_distance = self.level.goal
+        prefetch(self.level.manifest)
+
+    def next_level(self):
+        """Moves story progress to the following level, if there is one."""
+        if level_exists(self.current_level_id + 1):
+            self.current_level_id += 1
+
+    def run_seed(self):
+        """Story levels always lay out the same rocks; arcade runs get a fresh seed."""
+        if self.current_mode == "STORY" and self.level:
+            return self.level.seed
+        return random.randrange(1 << 32)
 
     def check_victory_condition(self, distance):
         """Determines if the current run/mission is successful."""
@@ -38,8 +219,8 @@ class ModeManager:
         Keeps your existing difficulty curve but allows story spikes.
         """
         if self.current_mode == "ARCADE":
-            # Endless scaling: Difficulty increases 10% every 1km
-            return 1.0 + (distance / 10000)
+            # Endless scaling shared with the world generator
+            return difficulty_at(distance)
         else:
             # Story scaling: Locked to level difficulty
             return 1.0 + (self.current_level_id * 0.2)
@@ -53,6 +234,7 @@ class ModeManager:
         summary = {
             "bolts_earned": 0,
             "story_unlocked": False,
+            "next_level": False,
             "message": ""
         }
 
@@ -69,7 +251,31 @@ class ModeManager:
                 summary["bolts_earned"] = bonus
                 summary["story_unlocked"] = True
                 summary["message"] = "MISSION ACCOMPLISHED"
+                # Retry replays this level; the player moves on via next_level()
+                summary["next_level"] = level_exists(self.current_level_id + 1)
             else:
                 summary["message"] = "MISSION FAILED"
 
-        return summary
\ No newline at end of file
+        return summary
+
+
+def build_cache(level_dir=LEVEL_DIR, cache_dir=LEVEL_CACHE_DIR):
+    """
+    Compiles every level file to its binary timeline ahead of time.
+    Run once per build:  python -m managers.mode_manager
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    level_id = 1
+    while level_exists(level_id, level_dir):
+        with open(level_path(level_id, level_dir)) as f:
+            enemies, scrap = compile_level(json.load(f))
+        with open(_cache_path(level_id, cache_dir), "wb") as out:
+            out.write(HEADER.pack(MAGIC, len(enemies) // RECORD.size, len(scrap) // RECORD.size))
+            out.write(enemies)
+            out.write(scrap)
+        print(f"compiled {level_path(level_id, level_dir)}: {len(enemies) + len(scrap)} bytes")
+        level_id += 1
+
+
+if __name__ == "__main__":
+    build_cache()
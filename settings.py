@@ -50,6 +50,13 @@ GROUND_LINE = HEIGHT - GROUND_HEIGHT
 # --- Assets & UI ---
 FONT_MAIN = "assets/fonts/8-bitanco.ttf"
 SFX_MACHINE_GUN = "assets/sfx/machine_gun.mp3"
+SURFACE_MEMORY_BUDGET_MB = 160  # Resident image budget (kiosk boxes have 512 MB total)
+
+# --- Debug ---
+DEBUG_ALLOC_TRACKER = False       # Count Surface/transform/mask/font allocations per call site
+ALLOC_REPORT_PATH = "alloc_report.txt"
+DEBUG_OVERDRAW = False            # Draw into a counting target and show a fill-rate heatmap
+OVERDRAW_REPORT_PATH = "overdraw_report.txt"
 
 # --- Difficulty & Scaling ---
 BASE_SCROLL_SPEED = 250      # Matches your PLAYER_SPEED
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+# --- EVENT KINDS ---
+HIT = "hit"                # Player weapon connected with an enemy
+PLAYER_HIT = "player_hit"  # Huey took a bullet or rammed a rock
+DEATH = "death"            # Enemy destroyed
+PICKUP = "pickup"          # Scrap collected
+
+EVENT_KINDS = (HIT, PLAYER_HIT, DEATH, PICKUP)
+
+
+class CombatEvent:
+    """One coalesced event: everything that landed on the same target/bucket this frame."""
+    __slots__ = ("kind", "x", "y", "count", "scale", "target", "tag")
+
+    def __init__(self, kind, x, y, scale, target, tag):
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.count = 1
+        self.scale = scale
+        self.target = target
+        self.tag = tag
+
+    def merge(self, x, y, scale):
+        # Running average keeps the effect centred on the cluster
+        self.count += 1
+        self.x += (x - self.x) / self.count
+        self.y += (y - self.y) / self.count
+        self.scale = max(self.scale, scale)
+
+
+class CombatEventBus:
+    """
+    Per-frame queue for combat feedback. Gameplay (damage, score, summons)
+    still happens immediately; only the VFX/audio side is posted here and
+    merged by target entity or screen bucket before consumers run once.
+    """
+    def __init__(self, bucket_size=48):
+        self.bucket_size = bucket_size
+        self.pending = {kind: OrderedDict() for kind in EVENT_KINDS}
+        self.consumers = {kind: [] for kind in EVENT_KINDS}
+
+        # Stats: how much work coalescing saved
+        self.posted = 0
+        self.delivered = 0
+
+    def subscribe(self, kind, consumer):
+        """consumer(events) is called once per flush with that kind's coalesced events."""
+        self.consumers[kind].append(consumer)
+
+    def post(self, kind, x, y, target=None, scale=1.0, tag=None, key=None):
+        if key is None:
+            if target is not None:
+                key = id(target)
+            else:
+                key = (int(x) // self.bucket_size, int(y) // self.bucket_size)
+
+        bucket = self.pending[kind]
+        event = bucket.get(key)
+        if event is None:
+            bucket[key] = CombatEvent(kind, x, y, scale, target, tag)
+        else:
+            event.merge(x, y, scale)
+        self.posted += 1
+
+    def flush(self):
+        for kind in EVENT_KINDS:
+            bucket = self.pending[kind]
+            if not bucket: continue
+            events = list(bucket.values())
+            bucket.clear()
+            self.delivered += len(events)
+            for consumer in self.consumers[kind]:
+                consumer(events)
+
+    def clear(self):
+        for bucket in self.pending.values():
+            bucket.clear()
@@ -1,41 +1,35 @@
-import pygame
-import random
 from entities.projectiles import ProjectileManager
 
 class CombatSystem:
     def __init__(self, game):
         self.game = game 
-        self.manager = ProjectileManager()
+        self.manager = ProjectileManager(game.world, game.targeting)
         self.selected_weapon = "machine_gun"
         
         # --- NEW STATE FOR SPECIALS ---
         self.laser_active = False 
 
-    def fire(self, player, enemies, dt):
+    def fire(self, player, dt):
         if self.selected_weapon == "machine_gun":
-            if self.manager.fire_machine_gun(player, enemies, dt):
+            if self.manager.fire_machine_gun(player, dt):
                 return 5.0 
                 
         elif self.selected_weapon == "missile":
-            self.manager.launch_missile(player, enemies)
+            self.manager.launch_missile(player)
             return 0.0 
             
         elif self.selected_weapon == "gravity_bomb":
-            self.manager.trigger_gravity_bomb(player, enemies)
+            self.manager.trigger_gravity_bomb(player)
             return 0.0
             
         return 0.0
 
     # --- NEW: TINE'S LIGHTNING (Triggered once per press) ---
-    def trigger_lightning(self, player, enemies):
+    def trigger_lightning(self, player):
         """Finds targets and tells the manager to draw/damage with lightning."""
-        # Find all enemies on screen
-        targets = [e for e in enemies if e.rect.right > 0 and e.rect.left < 1280]
-        if targets:
-            # Sort by distance to player to hit the closest ones
-            targets.sort(key=lambda e: pygame.math.Vector2(e.rect.center).distance_to(player.rect.center))
-            # Pick up to 3 targets for a 'chain' effect
-            chain_targets = targets[:3]
+        # Up to 3 on-screen enemies, closest to the player first, for a 'chain' effect
+        chain_targets = self.game.targeting.on_screen(player.rect.center, 3)
+        if chain_targets:
             self.manager.spawn_lightning(player.rect.center, chain_targets)
 
     # --- NEW: RED'S LASER (Continuous while holding) ---
@@ -0,0 +1,320 @@
+import random
+import math
+from settings import GROUND_LINE
+from core.ecs import np
+from core import stamps
+
+# --- ENTITY SYSTEMS ---
+# Each system updates one archetype of a core.ecs.World in bulk: one numpy
+# expression per column with numpy, one plain loop over the columns without.
+# Systems that remove entities kill the owning sprite so its groups drop it too.
+
+def _retire(objects):
+    for obj in objects:
+        if obj is not None: obj.kill()
+    return objects
+
+
+def movement_system(world, name, dt):
+    """Integrates velocity: x += vx * dt, y += vy * dt."""
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return
+    c = archetype.columns
+    if np is not None:
+        c["x"][:n] += c["vx"][:n] * dt
+        c["y"][:n] += c["vy"][:n] * dt
+        return
+    x, y, vx, vy = c["x"], c["y"], c["vx"], c["vy"]
+    for i in range(n):
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+
+
+def wobble_system(world, name, dt):
+    """Advances each row's wobble_phase by phase_rate and bobs it: y += sin(wobble_phase) * wobble."""
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return
+    c = archetype.columns
+    if np is not None:
+        phase = c["wobble_phase"][:n]
+        phase += c["phase_rate"][:n] * dt
+        c["y"][:n] += np.sin(phase) * c["wobble"][:n]
+        return
+    phase, rate, wobble, y = c["wobble_phase"], c["phase_rate"], c["wobble"], c["y"]
+    for i in range(n):
+        phase[i] += rate[i] * dt
+        y[i] += math.sin(phase[i]) * wobble[i]
+
+
+def sync_rects(world, name):
+    """Copies positions into the owning sprites' rects for drawing and sprite collisions."""
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return
+    xs, ys = archetype.view("x"), archetype.view("y")
+    if np is not None:
+        xs, ys = xs.tolist(), ys.tolist()
+    for obj, x, y in zip(archetype.objects, xs, ys):
+        obj.rect.center = (x, y)
+
+
+def bounds_system(world, name, left=None, right=None, keep=None, top=None, bottom=None):
+    """
+    Removes entities whose box lies entirely left of `left`, right of `right`,
+    above `top` or below `bottom`. Rows whose bool column `keep` is set (the
+    boss) are never culled.
+    """
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return []
+    c = archetype.columns
+    if np is not None:
+        x, half_w = c["x"][:n], c["half_w"][:n]
+        out = np.zeros(n, dtype=bool)
+        if left is not None: out |= x + half_w < left
+        if right is not None: out |= x - half_w > right
+        if top is not None or bottom is not None:
+            y, half_h = c["y"][:n], c["half_h"][:n]
+            if top is not None: out |= y + half_h < top
+            if bottom is not None: out |= y - half_h > bottom
+        if keep is not None: out &= ~c[keep][:n]
+    else:
+        x, half_w = c["x"], c["half_w"]
+        y, half_h = c["y"], c["half_h"]
+        out = [(left is not None and x[i] + half_w[i] < left) or
+               (right is not None and x[i] - half_w[i] > right) or
+               (top is not None and y[i] + half_h[i] < top) or
+               (bottom is not None and y[i] - half_h[i] > bottom) for i in range(n)]
+        if keep is not None:
+            out = [hit and not c[keep][i] for i, hit in enumerate(out)]
+    return _retire(world.despawn_where(name, out))
+
+
+def lifetime_system(world, name, dt, rate=1.0):
+    """Counts the life column down; expired entities get expire() (if any) and are removed."""
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return []
+    life = archetype.columns["life"]
+    if np is not None:
+        life[:n] -= rate * dt
+        expired = life[:n] <= 0
+    else:
+        for i in range(n): life[i] -= rate * dt
+        expired = [life[i] <= 0 for i in range(n)]
+    removed = world.despawn_where(name, expired)
+    for obj in removed:
+        if hasattr(obj, "expire"): obj.expire()
+    return _retire(removed)
+
+
+# --- ENEMY SYSTEMS ---
+
+GLOOM_COLOR = (120, 0, 200)
+GLOOM_CHANCE = 0.3   # Chance per enemy per frame to shed an aura particle
+GLOOM_SPREAD = 15
+GLOOM_DRIFT = 20
+GLOOM_FADE = 500
+GLOOM_ALPHA_STEP = 16 # Fading particles reuse stamps in 16-alpha buckets
+
+def aura_system(world, dt, emitters="enemy", particles="gloom"):
+    """Sheds purple gloom particles around non-boss enemies, drifts and fades them."""
+    source = world.archetypes[emitters]
+    n = source.count
+    if n:
+        c = source.columns
+        if np is not None:
+            rows = np.flatnonzero((np.random.random(n) < GLOOM_CHANCE) & ~c["boss"][:n])
+            xs, ys = c["x"][rows].tolist(), c["y"][rows].tolist()
+        else:
+            rows = [i for i in range(n) if not c["boss"][i] and random.random() < GLOOM_CHANCE]
+            xs, ys = [c["x"][i] for i in rows], [c["y"][i] for i in rows]
+        for x, y in zip(xs, ys):
+            world.spawn(particles,
+                        x=x + random.randint(-GLOOM_SPREAD, GLOOM_SPREAD),
+                        y=y + random.randint(-GLOOM_SPREAD, GLOOM_SPREAD),
+                        vx=random.uniform(-1, 1) * GLOOM_DRIFT,
+                        vy=random.uniform(-1, 1) * GLOOM_DRIFT,
+                        life=255.0, size=random.randint(2, 4))
+
+    movement_system(world, particles, dt)
+    lifetime_system(world, particles, dt, rate=GLOOM_FADE)
+
+
+def draw_gloom(world, screen, particles="gloom"):
+    archetype = world.archetypes[particles]
+    n = archetype.count
+    if not n: return
+    xs, ys, sizes = archetype.view("x"), archetype.view("y"), archetype.view("size")
+    if np is not None:
+        alphas = np.minimum(255, (archetype.view("life").astype(int) // GLOOM_ALPHA_STEP + 1) * GLOOM_ALPHA_STEP)
+        xs, ys, sizes, alphas = xs.tolist(), ys.tolist(), sizes.tolist(), alphas.tolist()
+    else:
+        alphas = [min(255, (int(life) // GLOOM_ALPHA_STEP + 1) * GLOOM_ALPHA_STEP) for life in archetype.view("life")]
+
+    # Only a few dozen (size, alpha) stamps exist; look each up once per frame
+    frame_stamps = {}
+    batch = []
+    for x, y, size, alpha in zip(xs, ys, sizes, alphas):
+        stamp = frame_stamps.get((size, alpha))
+        if stamp is None:
+            stamp = frame_stamps[(size, alpha)] = stamps.disc(size * 2, GLOOM_COLOR, alpha)
+        batch.append((stamp, (x, y)))
+    screen.blits(batch, False)
+
+
+def shooting_system(world, name, dt, *args):
+    """
+    Advances every shoot_timer; rows whose timer reaches their shoot_every
+    (0 = never) call obj.shoot(*args) and restart their cooldown.
+    """
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return
+    c = archetype.columns
+    timer, every = c["shoot_timer"], c["shoot_every"]
+    if np is not None:
+        timer[:n] += dt
+        ready = np.flatnonzero((every[:n] > 0) & (timer[:n] >= every[:n])).tolist()
+    else:
+        for i in range(n): timer[i] += dt
+        ready = [i for i in range(n) if every[i] > 0 and timer[i] >= every[i]]
+    shooters = [archetype.objects[row] for row in ready]
+    for row in ready: timer[row] = 0.0
+    for obj in shooters: obj.shoot(*args)
+
+
+# --- SCRAP SYSTEMS ---
+
+MAGNET_ACCEL = 1500     # Pull speed gained per second inside the magnet range
+MAGNET_MAX_SPEED = 900
+SCRAP_BOB_SPEED = 4
+SCRAP_BOB_AMOUNT = 0.8
+SCRAP_FLOOR = GROUND_LINE - 20
+
+def magnet_system(world, name, dt, target, tables, scroll_speed):
+    """
+    Pulls scrap inside its magnet range toward target; the rest scrolls with
+    the world (scroll_speed, as rocks do), drifts and bobs. Range and drift
+    come from per-kind tables
+    ({"magnet_range": ..., "drift_speed": ...}) indexed by the kind column.
+    """
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return
+    c = archetype.columns
+    tx, ty = target
+    ranges, drifts = tables["magnet_range"], tables["drift_speed"]
+    if np is not None:
+        x, y = c["x"][:n], c["y"][:n]
+        bob_timer, speed = c["bob_timer"][:n], c["attract_speed"][:n]
+        kind = c["kind"][:n]
+        bob_timer += SCRAP_BOB_SPEED * dt
+
+        dx, dy = tx - x, ty - y
+        dist = np.hypot(dx, dy)
+        pulled = dist < ranges[kind]
+        speed[:] = np.where(pulled, np.minimum(MAGNET_MAX_SPEED, speed + MAGNET_ACCEL * dt), 0.0)
+
+        step = np.divide(speed * dt, dist, out=np.zeros(n), where=dist > 0)
+        drift = drifts[kind] * dt + np.sin(bob_timer) * SCRAP_BOB_AMOUNT
+        x += np.where(pulled, dx * step, -scroll_speed * dt)
+        y += np.where(pulled, dy * step, drift)
+        np.minimum(y, SCRAP_FLOOR, out=y)
+        return
+
+    x, y = c["x"], c["y"]
+    bob_timer, speed, kind = c["bob_timer"], c["attract_speed"], c["kind"]
+    for i in range(n):
+        bob_timer[i] += SCRAP_BOB_SPEED * dt
+        dx, dy = tx - x[i], ty - y[i]
+        dist = (dx * dx + dy * dy) ** 0.5
+        if dist < ranges[kind[i]]:
+            speed[i] = min(MAGNET_MAX_SPEED, speed[i] + MAGNET_ACCEL * dt)
+            if dist > 0:
+                x[i] += dx / dist * speed[i] * dt
+                y[i] += dy / dist * speed[i] * dt
+        else:
+            x[i] -= scroll_speed * dt
+            y[i] += drifts[kind[i]] * dt + math.sin(bob_timer[i]) * SCRAP_BOB_AMOUNT
+            speed[i] = 0.0
+        if y[i] > SCRAP_FLOOR: y[i] = SCRAP_FLOOR
+
+
+def formation_system(world, name, dt, target, split_range, scroll_speed):
+    """
+    Scrolls (at scroll_speed), drifts and bobs scrap formations as single
+    boxes (max_y keeps their lowest piece off the ground) and returns the
+    rows whose box has come within split_range of target, i.e. that should
+    break into pieces.
+    """
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return []
+    c = archetype.columns
+    tx, ty = target
+    if np is not None:
+        x, y, half_w, half_h = c["x"][:n], c["y"][:n], c["half_w"][:n], c["half_h"][:n]
+        bob_timer = c["bob_timer"][:n]
+        bob_timer += SCRAP_BOB_SPEED * dt
+        x -= scroll_speed * dt
+        y += c["drift_speed"][:n] * dt + np.sin(bob_timer) * SCRAP_BOB_AMOUNT
+        np.minimum(y, c["max_y"][:n], out=y)
+        # Distance from target to the nearest point of each box
+        dx = np.maximum(np.abs(x - tx) - half_w, 0.0)
+        dy = np.maximum(np.abs(y - ty) - half_h, 0.0)
+        return np.flatnonzero(np.hypot(dx, dy) < split_range).tolist()
+
+    x, y, half_w, half_h = c["x"], c["y"], c["half_w"], c["half_h"]
+    bob_timer = c["bob_timer"]
+    rows = []
+    for i in range(n):
+        bob_timer[i] += SCRAP_BOB_SPEED * dt
+        x[i] -= scroll_speed * dt
+        y[i] = min(c["max_y"][i], y[i] + c["drift_speed"][i] * dt + math.sin(bob_timer[i]) * SCRAP_BOB_AMOUNT)
+        dx = max(abs(x[i] - tx) - half_w[i], 0.0)
+        dy = max(abs(y[i] - ty) - half_h[i], 0.0)
+        if (dx * dx + dy * dy) ** 0.5 < split_range: rows.append(i)
+    return rows
+
+
+# --- COLLISION ---
+
+def overlap_rows(world, name, rect):
+    """Rows of name whose box overlaps rect (e.g. enemy bullets against the player)."""
+    archetype = world.archetypes[name]
+    n = archetype.count
+    if not n: return []
+    c = archetype.columns
+    if np is not None:
+        x, y, half_w, half_h = c["x"][:n], c["y"][:n], c["half_w"][:n], c["half_h"][:n]
+        return np.flatnonzero((x + half_w > rect.left) & (x - half_w < rect.right) &
+                              (y + half_h > rect.top) & (y - half_h < rect.bottom)).tolist()
+    x, y, half_w, half_h = c["x"], c["y"], c["half_w"], c["half_h"]
+    return [i for i in range(n) if x[i] + half_w[i] > rect.left and x[i] - half_w[i] < rect.right
+            and y[i] + half_h[i] > rect.top and y[i] - half_h[i] < rect.bottom]
+
+
+def collision_pairs(world, a, b):
+    """
+    Overlapping (row in a, row in b) pairs, tested box against box on
+    x/y/half_w/half_h. Rows of a come out in ascending order.
+    """
+    A, B = world.archetypes[a], world.archetypes[b]
+    na, nb = A.count, B.count
+    if not na or not nb: return []
+    ca, cb = A.columns, B.columns
+    if np is not None:
+        hit = ((np.abs(ca["x"][:na, None] - cb["x"][None, :nb]) < ca["half_w"][:na, None] + cb["half_w"][None, :nb]) &
+               (np.abs(ca["y"][:na, None] - cb["y"][None, :nb]) < ca["half_h"][:na, None] + cb["half_h"][None, :nb]))
+        rows_a, rows_b = np.nonzero(hit)
+        return list(zip(rows_a.tolist(), rows_b.tolist()))
+    pairs = []
+    for i in range(na):
+        for j in range(nb):
+            if (abs(ca["x"][i] - cb["x"][j]) < ca["half_w"][i] + cb["half_w"][j] and
+                    abs(ca["y"][i] - cb["y"][j]) < ca["half_h"][i] + cb["half_h"][j]):
+                pairs.append((i, j))
+    return pairs
@@ -0,0 +1,219 @@
+import pygame
+import os
+import wave
+from settings import SFX_MACHINE_GUN
+
+# --- CUE TABLE ---
+# One entry per sound the game plays. Several cues can share a source file;
+# the file is only decoded once and each cue applies its own volume per channel.
+#   max_voices:   how many copies of this cue may ring at the same time
+#   min_interval: milliseconds before the same cue may be retriggered
+#   priority:     higher priority cues may steal channels from lower ones
+SFX_CUES = {
+    "machine_gun":    {"path": SFX_MACHINE_GUN,                 "volume": 0.15, "max_voices": 3, "min_interval": 45,  "priority": 1},
+    "bullet_hit":     {"path": "assets/sfx/explosion_old.mp3",  "volume": 0.2,  "max_voices": 3, "min_interval": 50,  "priority": 1},
+    "explosion":      {"path": "assets/sfx/explosion.wav",      "volume": 0.4,  "max_voices": 4, "min_interval": 60,  "priority": 3},
+    "player_explosion":{"path": "assets/sfx/explosion.wav",     "volume": 1.0,  "max_voices": 2, "min_interval": 100, "priority": 5},
+    "gravity_boom":   {"path": "assets/sfx/explosion.wav",      "volume": 0.8,  "max_voices": 2, "min_interval": 150, "priority": 4},
+    "scrap_pickup":   {"path": "assets/sfx/scrap_pickup.mp3",   "volume": 0.5,  "max_voices": 3, "min_interval": 40,  "priority": 2},
+    "special_pickup": {"path": "assets/sfx/special_pickup.mp3", "volume": 0.7,  "max_voices": 2, "min_interval": 80,  "priority": 4},
+    "engine_loop":    {"path": "assets/sfx/engine_loop.mp3",    "volume": 0.1,  "max_voices": 1, "min_interval": 0,   "priority": 5},
+    "engine_stall":   {"path": "assets/sfx/engine_stall.mp3",   "volume": 1.0,  "max_voices": 1, "min_interval": 500, "priority": 4},
+    "lightning":      {"path": "assets/sfx/tine_lightning.mp3", "volume": 0.6,  "max_voices": 2, "min_interval": 100, "priority": 4},
+    "laser_loop":     {"path": "assets/sfx/Red_Laser.mp3",      "volume": 0.4,  "max_voices": 1, "min_interval": 0,   "priority": 5},
+    "red_railgun":    {"path": "assets/sfx/Red_Laser.mp3",      "volume": 0.25, "max_voices": 1, "min_interval": 200, "priority": 3},
+    "tine_zap":       {"path": "assets/sfx/tine_lightning.mp3", "volume": 0.2,  "max_voices": 2, "min_interval": 150, "priority": 3},
+    "titan_shoot":    {"path": "assets/sfx/titan_shoot.mp3",    "volume": 0.3,  "max_voices": 2, "min_interval": 150, "priority": 2},
+    "titan_lightning":{"path": "assets/sfx/tine_lightning.mp3", "volume": 1.0,  "max_voices": 1, "min_interval": 300, "priority": 4},
+    "titan_roar":     {"path": "assets/sfx/titan_roar.mp3",     "volume": 1.0,  "max_voices": 1, "min_interval": 1000, "priority": 6},
+    "low_health":     {"path": "assets/sfx/low_health_beep.mp3", "volume": 0.2, "max_voices": 1, "min_interval": 500, "priority": 3},
+}
+
+# Decoded PCM copies of the MP3s live here (see build_cache below)
+SFX_CACHE_DIR = "assets/sfx/cache"
+
+# Looping sounds (engine hum, Red's laser) get their own reserved channels so
+# one-shot cues never land on them and voice stealing never cuts them off.
+LOOP_CHANNELS = ["engine", "laser"]
+
+
+class SoundCue:
+    """A named, budgeted handle to a decoded sound. Drop-in for Sound.play()."""
+    def __init__(self, bank, name, sound, volume, max_voices, min_interval, priority):
+        self.bank = bank
+        self.name = name
+        self.sound = sound
+        self.volume = volume
+        self.max_voices = max_voices
+        self.min_interval = min_interval
+        self.priority = priority
+        self.last_played = -min_interval
+        self.voices = [] # Channels currently ringing with this cue, oldest first
+
+    def play(self):
+        return self.bank.play(self)
+
+    def stop(self):
+        for channel in self.voices:
+            if channel.get_sound() is self.sound: channel.stop()
+        self.voices = []
+
+    def prune(self):
+        """Forgets channels that finished or were reused by something else."""
+        self.voices = [c for c in self.voices if c.get_busy() and c.get_sound() is self.sound]
+        return len(self.voices)
+
+
+class SFXBank:
+    def __init__(self, cues=SFX_CUES, cache_dir=SFX_CACHE_DIR):
+        self.cue_specs = cues
+        self.cache_dir = cache_dir
+        self.sounds = {}  # source path -> decoded Sound (None if it failed to load)
+        self.cues = {}    # cue name -> SoundCue
+        self.loop_channels = {}
+        self.enabled = pygame.mixer.get_init() is not None
+
+        # Stats for tuning budgets
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+        if self.enabled:
+            pygame.mixer.set_reserved(len(LOOP_CHANNELS))
+            for i, name in enumerate(LOOP_CHANNELS):
+                self.loop_channels[name] = pygame.mixer.Channel(i)
+
+    # --- LOADING ---
+
+    def _cache_path(self, path):
+        base = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, base + ".wav")
+
+    def _decode(self, path):
+        """Loads each source file once, preferring a fresh PCM cache over the MP3."""
+        if path in self.sounds:
+            return self.sounds[path]
+
+        sound = None
+        cached = self._cache_path(path)
+        try:
+            if os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(path):
+                sound = pygame.mixer.Sound(cached)
+        except:
+            sound = None
+
+        if sound is None:
+            try:
+                sound = pygame.mixer.Sound(path)
+            except:
+                sound = None
+
+        self.sounds[path] = sound
+        return sound
+
+    def cue(self, name):
+        """Returns the SoundCue for a name, or None if audio or the file is missing."""
+        if not self.enabled or name not in self.cue_specs:
+            return None
+        if name not in self.cues:
+            spec = self.cue_specs[name]
+            sound = self._decode(spec["path"])
+            if sound is None:
+                self.cues[name] = None
+            else:
+                self.cues[name] = SoundCue(self, name, sound, spec["volume"], spec["max_voices"],
+                                           spec["min_interval"], spec["priority"])
+        return self.cues[name]
+
+    def loop_channel(self, name):
+        return self.loop_channels.get(name)
+
+    # --- PLAYBACK ---
+
+    def play(self, cue):
+        now = pygame.time.get_ticks()
+        if now - cue.last_played < cue.min_interval:
+            self.dropped += 1
+            return None
+
+        # 1. Per-cue voice budget: recycle this cue's own oldest voice
+        channel = None
+        if cue.prune() >= cue.max_voices:
+            channel = cue.voices.pop(0)
+
+        # 2. Any free channel
+        if channel is None:
+            channel = pygame.mixer.find_channel()
+
+        # 3. Steal from the lowest priority cue that is ringing
+        if channel is None:
+            channel = self._steal_voice(cue.priority)
+            if channel is None:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+
+        channel.set_volume(cue.volume)
+        channel.play(cue.sound)
+        cue.voices.append(channel)
+        cue.last_played = now
+        self.played += 1
+        return channel
+
+    def _steal_voice(self, priority):
+        victim = None
+        for other in self.cues.values():
+            if other is None or other.priority > priority or not other.prune():
+                continue
+            if victim is None or other.priority < victim.priority:
+                victim = other
+        if victim is None:
+            return None
+        channel = victim.voices.pop(0)
+        channel.stop()
+        return channel
+
+    def stop_all(self):
+        for cue in self.cues.values():
+            if cue: cue.stop()
+
+
+_bank = None
+
+def get_sfx_bank():
+    """Shared bank so every system decodes each sound exactly once."""
+    global _bank
+    if _bank is None:
+        _bank = SFXBank()
+    return _bank
+
+def get_cue(name):
+    return get_sfx_bank().cue(name)
+
+
+def build_cache(cues=SFX_CUES, cache_dir=SFX_CACHE_DIR):
+    """
+    Decodes every MP3 in the cue table to a WAV in the mixer's output format,
+    so startup loads raw PCM instead of running the MP3 decoder.
+    Run once per build:  python -m systems.sfx_bank
+    """
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.mixer.init()
+    frequency, size, channels = pygame.mixer.get_init()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    bank = SFXBank(cues, cache_dir)
+    for path in sorted({spec["path"] for spec in cues.values()}):
+        if not path.endswith(".mp3") or not os.path.exists(path):
+            continue
+        sound = pygame.mixer.Sound(path)
+        with wave.open(bank._cache_path(path), "wb") as out:
+            out.setnchannels(channels)
+            out.setsampwidth(abs(size) // 8)
+            out.setframerate(frequency)
+            out.writeframes(sound.get_raw())
+        print(f"cached {path}")
+
+
+if __name__ == "__main__":
+    build_cache()
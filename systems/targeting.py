@@ -0,0 +1,163 @@
+import pygame
+import math
+from settings import WIDTH, HEIGHT
+from core.ecs import np
+
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+class Targeting:
+    """
+    Shared enemy lookup for homing missiles, companions, lightning and bombs.
+    Enemy positions are bucketed into a uniform grid the first time anyone
+    asks in a frame, so each query only looks at the cells around it instead
+    of every enemy. Results are enemy sprites, nearest first.
+    """
+    def __init__(self, world, archetype="enemy", cell_size=128):
+        self.world = world
+        self.archetype = archetype
+        self.cell_size = cell_size
+        self.stale = True
+
+        self.objects = []
+        self.xs, self.ys, self.lefts = [], [], []
+        self.cells = {}        # (cx, cy) -> rows
+        self.grid_bounds = (0, 0, 0, 0) # min cx, max cx, min cy, max cy
+        self.by_left = []      # rows sorted by left edge
+        self.sorted_lefts = []
+
+    def invalidate(self):
+        """Call once per frame (and after spawns/kills that queries must see)."""
+        self.stale = True
+
+    # --- BUILD ---
+
+    def _build(self):
+        archetype = self.world.archetypes[self.archetype]
+        n = archetype.count
+        c = archetype.columns
+        self.objects = archetype.objects[:]
+        cs = self.cell_size
+        self.cells = {}
+
+        if np is not None and n:
+            x, y = c["x"][:n], c["y"][:n]
+            lefts = x - c["half_w"][:n]
+            cx = np.floor_divide(x, cs).astype(np.int64)
+            cy = np.floor_divide(y, cs).astype(np.int64)
+            # Group rows by cell: sort by a combined key, then split at key changes
+            keys = cx * 1_000_003 + cy
+            order = np.argsort(keys, kind="stable")
+            _, starts = np.unique(keys[order], return_index=True)
+            bounds = starts.tolist() + [n]
+            order_list, cx_list, cy_list = order.tolist(), cx.tolist(), cy.tolist()
+            for start, end in zip(bounds, bounds[1:]):
+                first = order_list[start]
+                self.cells[(cx_list[first], cy_list[first])] = order_list[start:end]
+            by_left = np.argsort(lefts, kind="stable")
+            self.xs, self.ys, self.lefts = x.tolist(), y.tolist(), lefts.tolist()
+            self.by_left = by_left.tolist()
+            self.sorted_lefts = lefts[by_left].tolist()
+        else:
+            self.xs = [c["x"][i] for i in range(n)]
+            self.ys = [c["y"][i] for i in range(n)]
+            self.lefts = [c["x"][i] - c["half_w"][i] for i in range(n)]
+            for row in range(n):
+                key = (int(self.xs[row] // cs), int(self.ys[row] // cs))
+                self.cells.setdefault(key, []).append(row)
+            self.by_left = sorted(range(n), key=lambda row: self.lefts[row])
+            self.sorted_lefts = [self.lefts[row] for row in self.by_left]
+        if self.cells:
+            gx = [cell[0] for cell in self.cells]
+            gy = [cell[1] for cell in self.cells]
+            self.grid_bounds = (min(gx), max(gx), min(gy), max(gy))
+        self.stale = False
+
+    def _ready(self):
+        if self.stale: self._build()
+
+    def _alive(self, row):
+        # A sprite killed since the build (e.g. culled this frame) is skipped
+        return self.objects[row].alive()
+
+    # --- QUERIES ---
+
+    def _ring(self, cx, cy, r):
+        """Cells at Chebyshev distance r from (cx, cy)."""
+        if r == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cy - r)
+            yield (cx + dx, cy + r)
+        for dy in range(-r + 1, r):
+            yield (cx - r, cy + dy)
+            yield (cx + r, cy + dy)
+
+    def nearest_k(self, pos, k, max_dist=math.inf, view=None, exclude=None):
+        """
+        Up to k enemies strictly closer than max_dist to pos, nearest first.
+        view (a Rect) keeps only enemies whose centre lies inside it.
+        """
+        self._ready()
+        if not self.objects or k <= 0: return []
+        px, py = pos
+        cs = self.cell_size
+        cx, cy = int(px // cs), int(py // cs)
+        # Rings beyond this can't hold anything in range (or on the grid at all)
+        min_cx, max_cx, min_cy, max_cy = self.grid_bounds
+        span = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+        max_ring = span if max_dist == math.inf else min(span, int(max_dist // cs) + 1)
+
+        found = []  # (dist, row)
+        for r in range(max_ring + 1):
+            for cell in self._ring(cx, cy, r):
+                for row in self.cells.get(cell, ()):
+                    x, y = self.xs[row], self.ys[row]
+                    if view is not None and not view.collidepoint(x, y): continue
+                    obj = self.objects[row]
+                    if obj is exclude or not self._alive(row): continue
+                    dist = math.hypot(x - px, y - py)
+                    if dist < max_dist: found.append((dist, row))
+            # Anything in a farther ring is at least r * cell_size away
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= r * cs: break
+        found.sort()
+        return [self.objects[row] for _, row in found[:k]]
+
+    def nearest(self, pos, max_dist=math.inf, view=None, exclude=None):
+        hits = self.nearest_k(pos, 1, max_dist, view, exclude)
+        return hits[0] if hits else None
+
+    def within(self, pos, radius):
+        """Every enemy whose centre is within radius of pos (inclusive)."""
+        self._ready()
+        px, py = pos
+        cs = self.cell_size
+        hits = []
+        for gx in range(int((px - radius) // cs), int((px + radius) // cs) + 1):
+            for gy in range(int((py - radius) // cs), int((py + radius) // cs) + 1):
+                for row in self.cells.get((gx, gy), ()):
+                    if math.hypot(self.xs[row] - px, self.ys[row] - py) <= radius and self._alive(row):
+                        hits.append(self.objects[row])
+        return hits
+
+    def leftmost(self, min_left=-math.inf, max_left=math.inf):
+        """The enemy with the smallest left edge strictly between min_left and max_left."""
+        self._ready()
+        lefts = self.sorted_lefts
+        lo, hi = 0, len(lefts)
+        while lo < hi:  # First left edge > min_left
+            mid = (lo + hi) // 2
+            if lefts[mid] <= min_left: lo = mid + 1
+            else: hi = mid
+        for i in range(lo, len(lefts)):
+            if lefts[i] >= max_left: break
+            row = self.by_left[i]
+            if self._alive(row): return self.objects[row]
+        return None
+
+    def on_screen(self, pos, k):
+        """Up to k enemies with their centre on screen, nearest to pos first."""
+        return self.nearest_k(pos, k, view=SCREEN_RECT)
+
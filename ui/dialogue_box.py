@@ -1,6 +1,7 @@
 import pygame
 import random
 from settings import *
+from managers.asset_manager import get_asset_manager, PLAYING
 
 class DialogueBox:
     def __init__(self):
@@ -69,13 +70,26 @@ class DialogueBox:
             ]
         }
 
-        # Load Portrait
+        self.assets = get_asset_manager()
+
+        # Glass panel with the typed text so far; only new characters are added to it
+        self.layouts = {}
+        self.box = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.box_text = None
+        self.box_panel = None
+        self.revealed = 0
+
+    @property
+    def portrait(self):
+        size = (self.portrait_size, self.portrait_size)
         try:
-            self.portrait = pygame.image.load("assets/sprites/huey_plane1.png").convert_alpha()
-            self.portrait = pygame.transform.scale(self.portrait, (self.portrait_size, self.portrait_size))
+            return self.assets.image("assets/sprites/huey_plane1.png", [PLAYING], size=size)
         except:
-            self.portrait = pygame.Surface((self.portrait_size, self.portrait_size))
-            self.portrait.fill((100, 100, 100))
+            def placeholder():
+                surf = pygame.Surface(size)
+                surf.fill((100, 100, 100))
+                return surf
+            return self.assets.baked(("placeholder", "portrait"), placeholder, [PLAYING])
 
     def trigger_random_quip(self, category="frustration"):
         if not self.active:
@@ -129,44 +143,83 @@ class DialogueBox:
             # Slide Down
             self.current_y += (self.hidden_y - self.current_y) * 0.1
 
-    def draw(self, screen):
-        if self.current_y >= HEIGHT: return
+    # --- LAYOUT & PANEL CACHE ---
 
-        # Draw main container (Glass UI)
-        rect = pygame.Rect(20, self.current_y, self.width, self.height)
-        
-        # Background: Dark blue tint for 'spectral/tech' feel
-        bg_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (10, 20, 40, 240), (0, 0, self.width, self.height), border_radius=15)
-        
-        # Border: Glows gold if a Skyfall quip, cyan otherwise
-        border_color = (255, 215, 0) if "Skyfall" in self.display_text else (0, 200, 255)
-        pygame.draw.rect(bg_surf, border_color, (0, 0, self.width, self.height), 2, border_radius=15)
-        screen.blit(bg_surf, rect)
-
-        # Draw Portrait
-        screen.blit(self.portrait, (rect.x + self.padding, rect.y + (self.height - self.portrait_size)//2))
+    def layout(self, text):
+        """
+        Wraps and renders a quip once. Returns the line surfaces with their
+        y offset, plus one (line, x0, x1) column span per character of text so
+        the typewriter can reveal it a character at a time.
+        """
+        if text in self.layouts:
+            return self.layouts[text]
 
-        # Text Layout
-        text_x = rect.x + self.portrait_size + (self.padding * 2)
-        visible_text = self.display_text[:self.current_char_index]
-        
-        words = visible_text.split(' ')
+        max_width = self.width - (self.portrait_size + self.padding * 3)
+        words = text.split(' ')
         lines = []
         current_line = ""
-        
         for word in words:
             test_line = current_line + word + " "
-            if self.font.size(test_line)[0] < (self.width - (self.portrait_size + self.padding * 3)):
+            if self.font.size(test_line)[0] < max_width:
                 current_line = test_line
             else:
                 lines.append(current_line)
                 current_line = word + " "
         lines.append(current_line)
 
+        # Spectral text color for companions
+        color = (200, 255, 200) if any(x in text for x in ["whisper", "ghost", "memory", "Skyfall"]) else WHITE
+        rendered = []
+        spans = []
         for i, line in enumerate(lines):
-            if i > 2: break 
-            # Spectral text color for companions
-            color = (200, 255, 200) if any(x in self.display_text for x in ["whisper", "ghost", "memory", "Skyfall"]) else WHITE
-            txt_surf = self.font.render(line, True, color)
-            screen.blit(txt_surf, (text_x, rect.y + self.padding + (i * 22)))
\ No newline at end of file
+            surf = self.font.render(line, True, color)
+            rendered.append((surf, self.padding + (i * 22)))
+            offsets = [self.font.size(line[:k])[0] for k in range(len(line))] + [surf.get_width()]
+            for k in range(len(line)):
+                # Only the first three lines fit in the box
+                spans.append((i, offsets[k], offsets[k + 1]) if i <= 2 else None)
+
+        self.layouts[text] = (rendered, spans)
+        return self.layouts[text]
+
+    def get_panel(self, border_color):
+        """Background, border and portrait composed once per border colour."""
+        def build():
+            surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            # Background: Dark blue tint for 'spectral/tech' feel
+            pygame.draw.rect(surf, (10, 20, 40, 240), (0, 0, self.width, self.height), border_radius=15)
+            pygame.draw.rect(surf, border_color, (0, 0, self.width, self.height), 2, border_radius=15)
+            surf.blit(self.portrait, (self.padding, (self.height - self.portrait_size)//2))
+            return surf
+        return self.assets.baked(("dialogue_panel", border_color), build, [PLAYING])
+
+    def reveal(self):
+        """Copies the characters typed since the last frame from the pre-rendered lines onto the box."""
+        rendered, spans = self.layout(self.display_text)
+        text_x = self.portrait_size + (self.padding * 2)
+        end = min(self.current_char_index, len(spans))
+        for span in spans[self.revealed:end]:
+            if span is None: continue
+            line, x0, x1 = span
+            surf, y = rendered[line]
+            self.box.blit(surf, (text_x + x0, y), (x0, 0, x1 - x0, surf.get_height()))
+        self.revealed = max(self.revealed, end)
+
+    def draw(self, screen):
+        if self.current_y >= HEIGHT: return
+
+        # Border: Glows gold if a Skyfall quip, cyan otherwise
+        border_color = (255, 215, 0) if "Skyfall" in self.display_text else (0, 200, 255)
+        panel = self.get_panel(border_color)
+        if (self.box_text != self.display_text or self.box_panel is not panel
+                or self.current_char_index < self.revealed):
+            # New quip, replayed quip or a rebuilt panel: start from a clean panel
+            self.box.fill((0, 0, 0, 0))
+            self.box.blit(panel, (0, 0))
+            self.box_text = self.display_text
+            self.box_panel = panel
+            self.revealed = 0
+
+        if self.revealed < self.current_char_index:
+            self.reveal()
+        screen.blit(self.box, (20, self.current_y))
@@ -0,0 +1,121 @@
+import pygame
+
+# Printable ASCII covers every HUD label, counter and warning
+CHARSET = "".join(chr(c) for c in range(32, 127))
+
+
+class GlyphAtlas:
+    """
+    One font at one size, rasterised once into a single white strip. Text is
+    drawn as a batch of glyph blits out of a tinted copy of the strip, so
+    drawing a string never touches FreeType.
+    """
+    def __init__(self, font, charset=CHARSET):
+        self.height = font.get_height()
+        self.rects = {}
+        self.advances = {}
+
+        glyphs = []
+        x = 0
+        for ch, metrics in zip(charset, font.metrics(charset)):
+            surf = font.render(ch, True, (255, 255, 255))
+            glyphs.append((ch, surf, x))
+            self.rects[ch] = pygame.Rect(x, 0, surf.get_width(), surf.get_height())
+            # Pen advance, not the rendered width: glyphs may overhang their cell
+            self.advances[ch] = metrics[4] if metrics else surf.get_width()
+            x += surf.get_width() + 1 # 1px gutter so filtering never bleeds
+
+        self.atlas = pygame.Surface((max(1, x), self.height), pygame.SRCALPHA)
+        for ch, surf, gx in glyphs:
+            self.atlas.blit(surf, (gx, 0))
+        self.tints = {}
+
+    def tinted(self, color, alpha=255):
+        """The strip in one colour. Rendering in white and multiplying gives the same pixels as rendering in colour."""
+        key = (tuple(color[:3]), alpha)
+        atlas = self.tints.get(key)
+        if atlas is None:
+            atlas = self.atlas.copy()
+            atlas.fill((*color[:3], alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self.tints[key] = atlas
+        return atlas
+
+    def measure(self, text):
+        advances = self.advances
+        return sum(advances.get(ch, 0) for ch in text)
+
+    def size(self, text):
+        return self.measure(text), self.height
+
+    def draw(self, surface, text, pos, color, alpha=255):
+        """Blits text with its top-left at pos; returns the covered rect like Surface.blit."""
+        atlas = self.tinted(color, alpha)
+        x, y = pos
+        rects, advances = self.rects, self.advances
+        batch = []
+        for ch in text:
+            rect = rects.get(ch)
+            if rect is not None:
+                batch.append((atlas, (x, y), rect))
+                x += advances[ch]
+        surface.blits(batch, False)
+        return pygame.Rect(pos[0], pos[1], x - pos[0], self.height)
+
+
+class GlyphLine:
+    """
+    A retained line of atlas text for values that change every frame. Setting
+    new text only clears and re-blits from the first character that differs,
+    so a ticking counter costs one or two glyphs per frame.
+    """
+    def __init__(self, atlas, color, max_chars):
+        self.atlas = atlas
+        self.color = color
+        width = max(atlas.advances.values()) * max_chars
+        self.surface = pygame.Surface((width, atlas.height), pygame.SRCALPHA)
+        self.text = ""
+        self.offsets = [0] # x of each character, plus the end of the line
+
+    @property
+    def width(self):
+        return self.offsets[-1]
+
+    def set(self, text):
+        if text == self.text:
+            return
+        same = 0
+        limit = min(len(text), len(self.text))
+        while same < limit and text[same] == self.text[same]:
+            same += 1
+
+        x = self.offsets[same]
+        self.surface.fill((0, 0, 0, 0), (x, 0, self.surface.get_width() - x, self.atlas.height))
+        self.atlas.draw(self.surface, text[same:], (x, 0), self.color)
+
+        offsets = self.offsets[:same + 1]
+        advances = self.atlas.advances
+        for ch in text[same:]:
+            offsets.append(offsets[-1] + advances.get(ch, 0))
+        self.offsets = offsets
+        self.text = text
+
+    def draw(self, screen, pos):
+        return screen.blit(self.surface, pos, (0, 0, self.width, self.atlas.height))
+
+
+_atlases = {}
+
+def get_atlas(path, size, fallback=("Arial", None, False, False)):
+    """
+    Shared atlas per font file and size. fallback is the (name, size, bold,
+    italic) SysFont used when the file is missing, like the old try/except loads.
+    """
+    key = (path, size)
+    if key not in _atlases:
+        try:
+            font = pygame.font.Font(path, size)
+        except:
+            name, sys_size, bold, italic = fallback
+            font = pygame.font.SysFont(name, sys_size or size, bold=bold, italic=italic)
+        _atlases[key] = GlyphAtlas(font)
+    return _atlases[key]
@@ -1,185 +1,244 @@
 import pygame
 import math
 from settings import *
+from systems.sfx_bank import get_cue
+from ui.glyph_atlas import get_atlas, GlyphLine
+
+PULSE_LEVELS = 8 # Colour pulses are quantised so widgets repaint a bounded number of times
+
+class HUDWidget:
+    """
+    Retained HUD element. It owns a cached surface that is only repainted when
+    the value bound to it changes; a value should already be rounded to what
+    the screen can show (bar pixels, whole metres, pulse level).
+    """
+    def __init__(self, hud, rect, painter):
+        self.hud = hud
+        self.rect = pygame.Rect(rect)
+        self.painter = painter # painter(surface, value, origin)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.value = None
+
+    def bind(self, value):
+        if value != self.value:
+            self.value = value
+            self.hud.dirty.append(self)
+
+    def repaint(self):
+        self.surface.fill((0, 0, 0, 0))
+        self.painter(self.surface, self.value, self.rect.topleft)
+
+    def draw(self, screen):
+        screen.blit(self.surface, self.rect)
 
 class HUD:
-    def __init__(self):
-        # 1. Load Custom Fonts
-        try:
-            self.main_font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 24)
-            self.hint_font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 16)
-            self.dist_font = pygame.font.Font("assets/fonts/8-bitanco.ttf", 20)
-        except:
-            self.main_font = pygame.font.SysFont("Arial", 22, bold=True)
-            self.hint_font = pygame.font.SysFont("Arial", 16, italic=True)
-            self.dist_font = pygame.font.SysFont("Arial", 18, bold=True)
+    def __init__(self, scheduler):
+        # 1. Custom Fonts, rasterised once into glyph atlases shared by every HUD
+        self.main_font = get_atlas(FONT_MAIN, 24, ("Arial", 22, True, False))
+        self.hint_font = get_atlas(FONT_MAIN, 16, ("Arial", 16, False, True))
+        self.dist_font = get_atlas(FONT_MAIN, 20, ("Arial", 18, True, False))
         
         # 2. SFX
-        try:
-            self.sfx_warning = pygame.mixer.Sound("assets/sfx/low_health_beep.mp3")
-            self.sfx_warning.set_volume(0.2)
-        except:
-            self.sfx_warning = None
+        self.sfx_warning = get_cue("low_health")
             
         # 3. State & Animation
         self.hint_text = ""
         self.hint_alpha = 0 
-        self.hint_timer = 0
+        self.scheduler = scheduler
+        self.hint = None # Timer that ends the current hint
         self.pulse_time = 0 
         
         # 4. Dimensions
         self.bar_w, self.bar_h = 220, 16 
         self.margin = 30
 
+        # 5. Retained widgets, one cached surface per panel. Whatever changed
+        # this frame is queued on `dirty` and repainted once in draw().
+        self.dirty = []
+        m = self.margin
+        self.status_widget = HUDWidget(self, (m - 10, m - 10, self.bar_w + 20, 160), self._paint_status_panel)
+        self.weapons_widget = HUDWidget(self, (m, HEIGHT - 180, 400, 160), self._paint_weapons_hud)
+        self.widgets = [self.status_widget, self.weapons_widget]
+
+        # Score and distance tick almost every frame: glyph lines only re-blit
+        # the characters that changed
+        self.credits_line = GlyphLine(self.hint_font, (150, 150, 150), 13)
+        self.credits_line.set("SCRAP CREDITS")
+        self.score_line = GlyphLine(self.main_font, LUMEN_GOLD, 8)
+        self.dist_line = GlyphLine(self.dist_font, WHITE, 10)
+        self.hint_surf = None
+        self.hint_key = None
+
     def show_hint(self, text, duration=3.0):
         self.hint_text = text
-        self.hint_timer = duration
+        if self.hint: self.hint.cancel()
+        self.hint = self.scheduler.after(duration, self.end_hint)
         self.hint_alpha = 255
 
+    def end_hint(self):
+        self.hint = None
+
     def update(self, dt, player):
         self.pulse_time += dt * 5
         
         # Hint fading
-        if self.hint_timer > 0:
-            self.hint_timer -= dt
-        else:
+        if self.hint is None:
             self.hint_alpha = max(0, self.hint_alpha - 200 * dt)
 
         # Smart Warnings
         if player.is_alive:
-            if player.weight > (MAX_WEIGHT_CAPACITY * 0.85) and self.hint_timer <= 0:
+            if player.weight > (MAX_WEIGHT_CAPACITY * 0.85) and self.hint is None:
                 self.show_hint("WARNING: MAXIMUM CARGO WEIGHT REACHED", 2.0)
-            elif player.health < (PLAYER_HEALTH * 0.25) and self.hint_timer <= 0:
+            elif player.health < (PLAYER_HEALTH * 0.25) and self.hint is None:
                 self.show_hint("CRITICAL HULL DAMAGE", 1.0)
             # CHANGE: Added Low Fuel warning for Laser
-            elif player.laser_fuel > 0 and player.laser_fuel < 50 and self.hint_timer <= 0:
+            elif player.laser_fuel > 0 and player.laser_fuel < 50 and self.hint is None:
                 self.show_hint("LASER CORE LOW", 0.5)
 
     def draw(self, screen, player, score):
         # --- 1. Top Left: Cockpit Gauges ---
-        self._draw_status_panel(screen, player)
+        self.status_widget.bind(self._status_value(player))
         
         # --- 2. Top Right: Expedition Data ---
-        self._draw_score_panel(screen, score, player.distance)
+        self.score_line.set(f"{score:06}")
+        self.dist_line.set(f"{int(player.distance)}m")
 
         # --- 3. Bottom Left: Ordinance System ---
-        self._draw_weapons_hud(screen, player)
+        fuel_w = int(max(0, min(1.0, player.laser_fuel / 300)) * 80) # Assuming 300 is max fuel capacity
+        self.weapons_widget.bind((player.missiles, player.bombs, player.lightning_charges, player.laser_fuel > 0, fuel_w))
+
+        # Repaint only what changed, then a fixed number of blits
+        for widget in self.dirty:
+            widget.repaint()
+        self.dirty = []
+        for widget in self.widgets:
+            widget.draw(screen)
+        self._draw_score_panel(screen)
 
         # --- 4. Center: Warnings/Tutorials ---
         if self.hint_alpha > 0:
             self._draw_hint_box(screen)
 
-    def _draw_status_panel(self, screen, player):
-        x, y = self.margin, self.margin
-        panel_rect = pygame.Rect(x - 10, y - 10, self.bar_w + 20, 160)
-        self._draw_glass_rect(screen, panel_rect)
+    def _pulse(self, speed):
+        """0..1 sine pulse, quantised to PULSE_LEVELS."""
+        s = (math.sin(self.pulse_time * speed) + 1) / 2
+        return int(s * PULSE_LEVELS) / PULSE_LEVELS
+
+    def _bar_width(self, ratio):
+        return int(max(0, min(1.0, ratio)) * self.bar_w)
 
+    def _status_value(self, player):
         # Hull Integrity
         h_ratio = player.health / player.max_health # Updated to use dynamic max_health
         h_color = (255, 50, 50)
         if h_ratio < 0.3:
-            pulse = (math.sin(self.pulse_time * 2) + 1) / 2
-            h_color = (255, 50 + (200 * pulse), 50 + (200 * pulse))
-        self._draw_bar(screen, x, y + 20, h_ratio, h_color, "HULL STABILITY")
+            pulse = self._pulse(2)
+            h_color = (255, int(50 + (200 * pulse)), int(50 + (200 * pulse)))
 
         # Engine Heat
         heat_ratio = player.heat / player.heat_system.max_heat # Updated for dynamic heat
         heat_color = HEAT_RED
         if player.is_stalled:
             heat_color = WHITE if (int(self.pulse_time * 2) % 2 == 0) else (255, 255, 100)
-        self._draw_bar(screen, x, y + 70, heat_ratio, heat_color, "THERMAL LOAD")
 
         # Cargo Weight
         w_ratio = player.weight / player.max_weight
         w_color = (0, 200, 255) if w_ratio < 0.8 else (255, 165, 0)
-        self._draw_bar(screen, x, y + 120, w_ratio, w_color, "CARGO MASS")
-
-    def _draw_score_panel(self, screen, score, distance):
+        return (self._bar_width(h_ratio), h_color, self._bar_width(heat_ratio), heat_color,
+                self._bar_width(w_ratio), w_color)
+
+    def _paint_status_panel(self, surface, value, origin):
+        hull_w, h_color, heat_w, heat_color, weight_w, w_color = value
+        ox, oy = origin
+        x, y = self.margin - ox, self.margin - oy
+        self._draw_glass_rect(surface, surface.get_rect())
+        self._draw_bar(surface, x, y + 20, hull_w, h_color, "HULL STABILITY")
+        self._draw_bar(surface, x, y + 70, heat_w, heat_color, "THERMAL LOAD")
+        self._draw_bar(surface, x, y + 120, weight_w, w_color, "CARGO MASS")
+
+    def _draw_score_panel(self, screen):
         x = WIDTH - self.margin
         y = self.margin
-        score_txt = self.main_font.render(f"{score:06}", True, LUMEN_GOLD)
-        score_rect = score_txt.get_rect(topright=(x, y))
-        lbl = self.hint_font.render("SCRAP CREDITS", True, (150, 150, 150))
-        screen.blit(lbl, (x - lbl.get_width(), y - 15))
-        screen.blit(score_txt, score_rect)
-        dist_txt = self.dist_font.render(f"{int(distance)}m", True, WHITE)
-        screen.blit(dist_txt, (x - dist_txt.get_width(), y + 35))
-
-    def _draw_weapons_hud(self, screen, player):
+        self.credits_line.draw(screen, (x - self.credits_line.width, y - 15))
+        self.score_line.draw(screen, (x - self.score_line.width, y))
+        self.dist_line.draw(screen, (x - self.dist_line.width, y + 35))
+
+    def _paint_weapons_hud(self, surface, value, origin):
         """Ordinance Display including Specials."""
-        x, y = self.margin, HEIGHT - 180 # Moved up to fit new rows
+        missiles, bombs, charges, laser_active, fuel_w = value
+        x, y = 0, 0
         
         # 1. Missile (R)
-        self._draw_weapon_icon(screen, x, y, "R", f"MISSILE x{player.missiles}", WHITE, player.missiles > 0)
+        self._draw_weapon_icon(surface, x, y, "R", f"MISSILE x{missiles}", WHITE, missiles > 0)
         
         # 2. G-Bomb (G)
-        self._draw_weapon_icon(screen, x, y + 40, "G", f"G-BOMB x{player.bombs}", (100, 200, 255), player.bombs > 0)
+        self._draw_weapon_icon(surface, x, y + 40, "G", f"G-BOMB x{bombs}", (100, 200, 255), bombs > 0)
 
         # 3. Tine's Lightning (Q) - CHANGE: Added Lightning
         l_color = (150, 230, 255)
-        self._draw_weapon_icon(screen, x, y + 80, "Q", f"LIGHTNING x{player.lightning_charges}", l_color, player.lightning_charges > 0)
+        self._draw_weapon_icon(surface, x, y + 80, "Q", f"LIGHTNING x{charges}", l_color, charges > 0)
 
         # 4. Red's Laser (E) - CHANGE: Added Laser Fuel Bar
         laser_color = (255, 50, 50)
-        self._draw_weapon_icon(screen, x, y + 120, "E", "RED LASER", laser_color, player.laser_fuel > 0)
+        self._draw_weapon_icon(surface, x, y + 120, "E", "RED LASER", laser_color, laser_active)
         # Laser Fuel mini-bar
-        fuel_ratio = player.laser_fuel / 300 # Assuming 300 is max fuel capacity
-        self._draw_mini_bar(screen, x + 180, y + 132, fuel_ratio, laser_color)
+        self._draw_mini_bar(surface, x + 180, y + 132, fuel_w, laser_color)
 
-    def _draw_weapon_icon(self, screen, x, y, key, label, color, active):
+    def _draw_weapon_icon(self, surface, x, y, key, label, color, active):
         """Helper to draw weapon slots consistently."""
         alpha = 255 if active else 80
         # Key Box
-        pygame.draw.rect(screen, (30, 30, 30), (x, y, 30, 30))
-        pygame.draw.rect(screen, color if active else (100, 100, 100), (x, y, 30, 30), 1)
-        k_text = self.hint_font.render(key, True, color if active else (100, 100, 100))
-        screen.blit(k_text, k_text.get_rect(center=(x+15, y+15)))
+        pygame.draw.rect(surface, (30, 30, 30), (x, y, 30, 30))
+        pygame.draw.rect(surface, color if active else (100, 100, 100), (x, y, 30, 30), 1)
+        k_w, k_h = self.hint_font.size(key)
+        self.hint_font.draw(surface, key, (x + 15 - k_w // 2, y + 15 - k_h // 2), color if active else (100, 100, 100))
         
         # Text Label
-        txt = self.main_font.render(f"  {label}", True, color if active else (100, 100, 100))
-        txt.set_alpha(alpha)
-        screen.blit(txt, (x + 35, y + 2))
+        self.main_font.draw(surface, f"  {label}", (x + 35, y + 2), color if active else (100, 100, 100), alpha)
 
-    def _draw_mini_bar(self, screen, x, y, ratio, color):
+    def _draw_mini_bar(self, surface, x, y, fill_w, color):
         """Small bar for secondary fuels."""
         w, h = 80, 8
-        pygame.draw.rect(screen, (20, 20, 20), (x, y, w, h))
-        pygame.draw.rect(screen, color, (x, y, int(w * ratio), h))
-        pygame.draw.rect(screen, (100, 100, 100), (x, y, w, h), 1)
+        pygame.draw.rect(surface, (20, 20, 20), (x, y, w, h))
+        pygame.draw.rect(surface, color, (x, y, fill_w, h))
+        pygame.draw.rect(surface, (100, 100, 100), (x, y, w, h), 1)
 
-    def _draw_bar(self, screen, x, y, ratio, color, label):
-        lbl = self.hint_font.render(label, True, (200, 200, 200))
-        screen.blit(lbl, (x, y - 18))
+    def _draw_bar(self, surface, x, y, fill_w, color, label):
+        self.hint_font.draw(surface, label, (x, y - 18), (200, 200, 200))
         bg_rect = pygame.Rect(x, y, self.bar_w, self.bar_h)
-        pygame.draw.rect(screen, (30, 30, 35), bg_rect)
-        fill_w = int(max(0, min(1.0, ratio)) * self.bar_w)
+        pygame.draw.rect(surface, (30, 30, 35), bg_rect)
         if fill_w > 0:
             fill_rect = pygame.Rect(x, y, fill_w, self.bar_h)
-            pygame.draw.rect(screen, color, fill_rect)
-        pygame.draw.rect(screen, (150, 150, 150), bg_rect, 1)
+            pygame.draw.rect(surface, color, fill_rect)
+        pygame.draw.rect(surface, (150, 150, 150), bg_rect, 1)
 
-    def _draw_glass_rect(self, screen, rect):
-        glass = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(glass, (0, 0, 0, 140), (0, 0, rect.width, rect.height))
+    def _draw_glass_rect(self, surface, rect):
+        pygame.draw.rect(surface, (0, 0, 0, 140), rect)
         length = 10
-        pygame.draw.line(glass, (0, 200, 255), (0,0), (length, 0), 2)
-        pygame.draw.line(glass, (0, 200, 255), (0,0), (0, length), 2)
-        screen.blit(glass, rect)
+        pygame.draw.line(surface, (0, 200, 255), rect.topleft, (rect.left + length, rect.top), 2)
+        pygame.draw.line(surface, (0, 200, 255), rect.topleft, (rect.left, rect.top + length), 2)
 
     def _draw_hint_box(self, screen):
-        hint_surf = self.hint_font.render(self.hint_text, True, WHITE)
-        hint_surf.set_alpha(self.hint_alpha)
-        border_color = WHITE
+        border_level = 0
         if any(word in self.hint_text for word in ["WARNING", "CRITICAL", "LOW"]):
-            s = (math.sin(self.pulse_time * 2) + 1) / 2
-            border_color = (255, 50 + (100 * s), 50 + (100 * s))
-        box_w = hint_surf.get_width() + 60
+            border_level = self._pulse(2)
+        key = (self.hint_text, border_level)
+        if key != self.hint_key:
+            self.hint_surf = self._build_hint_box(self.hint_text, border_level)
+            self.hint_key = key
+        self.hint_surf.set_alpha(self.hint_alpha)
+        screen.blit(self.hint_surf, self.hint_surf.get_rect(center=(WIDTH // 2, HEIGHT - 250)))
+
+    def _build_hint_box(self, text, border_level):
+        """Box and text composited once, then faded as a whole with set_alpha."""
+        text_w, text_h = self.hint_font.size(text)
+        border_color = WHITE
+        if any(word in text for word in ["WARNING", "CRITICAL", "LOW"]):
+            border_color = (255, int(50 + (100 * border_level)), int(50 + (100 * border_level)))
+        box_w = text_w + 60
         box_h = 44
-        box_rect = pygame.Rect(0, 0, box_w, box_h)
-        box_rect.center = (WIDTH // 2, HEIGHT - 250)
         bg_surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
         pygame.draw.rect(bg_surf, (20, 0, 0, 180), (0, 0, box_w, box_h))
         pygame.draw.rect(bg_surf, border_color, (0, 0, box_w, box_h), 2)
-        bg_surf.set_alpha(self.hint_alpha)
-        screen.blit(bg_surf, box_rect)
-        screen.blit(hint_surf, hint_surf.get_rect(center=box_rect.center))
\ No newline at end of file
+        self.hint_font.draw(bg_surf, text, ((box_w - text_w) // 2, (box_h - text_h) // 2), WHITE)
+        return bg_surf
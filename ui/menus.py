@@ -2,6 +2,14 @@ import pygame
 import random
 import math
 from settings import WIDTH, HEIGHT, WHITE, BLACK, LUMEN_GOLD, HEAT_RED
+from managers.asset_manager import get_asset_manager, MENU, PLAYING
+from core import stamps
+
+# Animated values are bucketed so cached layers are only rebuilt when the
+# change would actually be visible
+FADE_STEP = 4    # Background crossfade alpha
+ALPHA_STEP = 16  # Particle / text pulse alpha
+GLOW_LEVELS = 8  # Selected option colour pulse
 
 class MenuParticle:
     def __init__(self):
@@ -25,23 +33,15 @@ class MenuParticle:
             self.y = HEIGHT + 10
 
     def draw(self, screen):
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (255, 255, 180, int(max(0, self.alpha))), (self.size, self.size), self.size)
-        screen.blit(s, (self.x, self.y))
+        alpha = (int(max(0, self.alpha)) // ALPHA_STEP) * ALPHA_STEP
+        screen.blit(stamps.disc(self.size * 2, (255, 255, 180), alpha), (self.x, self.y))
 
 class MainMenu:
-    def __init__(self, screen):
-        self.screen = screen
+    def __init__(self):
         self.font_path = "assets/fonts/8-bitanco.ttf"
         
-        # Assets
-        try:
-            self.bg1 = pygame.transform.scale(pygame.image.load("assets/backgrounds/skyfall_bg1.jpeg").convert(), (WIDTH, HEIGHT))
-            self.bg2 = pygame.transform.scale(pygame.image.load("assets/backgrounds/skyfall_bg2.jpeg").convert(), (WIDTH, HEIGHT))
-        except:
-            self.bg1 = pygame.Surface((WIDTH, HEIGHT))
-            self.bg1.fill((30, 30, 50))
-            self.bg2 = self.bg1.copy()
+        # Assets (fetched per frame so they are freed while the menu is closed)
+        self.assets = get_asset_manager()
 
         # Intro State
         self.menu_state = "SPLASH"
@@ -59,10 +59,21 @@ class MainMenu:
         self.pulse_timer = 0
         
         # STREAMLINED OPTIONS
-        self.options = ["Start Game", "Workshop", "Exit"]
+        self.options = ["Start Game", "Story Mode", "Workshop", "Exit"]
         self.selected_index = 0
         self.button_alphas = [0] * len(self.options)
 
+        # The title box is baked per typed title; option labels per glow level
+        self.option_surfs = {}
+        try:
+            self.splash_font = pygame.font.Font(self.font_path, 30)
+            self.title_font = pygame.font.Font(self.font_path, 90)
+            self.sub_font = pygame.font.Font(self.font_path, 25)
+            self.opt_font = pygame.font.Font(self.font_path, 35)
+        except:
+            self.splash_font = self.title_font = self.sub_font = self.opt_font = None
+        self.splash_surf = None
+
         # Start Music
         try:
             if not pygame.mixer.music.get_busy():
@@ -72,6 +83,24 @@ class MainMenu:
         except:
             pass
 
+    @property
+    def bg1(self):
+        return self._background("assets/backgrounds/skyfall_bg1.jpeg")
+
+    @property
+    def bg2(self):
+        return self._background("assets/backgrounds/skyfall_bg2.jpeg")
+
+    def _background(self, path):
+        try:
+            return self.assets.image(path, [MENU], alpha=False, size=(WIDTH, HEIGHT))
+        except:
+            def placeholder():
+                surf = pygame.Surface((WIDTH, HEIGHT))
+                surf.fill((30, 30, 50))
+                return surf
+            return self.assets.baked(("placeholder", path), placeholder, [MENU])
+
     def update(self, dt):
         self.intro_timer += dt
         
@@ -110,64 +139,81 @@ class MainMenu:
         for p in self.particles:
             p.update(dt)
 
-    def draw(self):
+    def draw(self, screen):
         if self.menu_state == "SPLASH":
-            self.screen.fill(BLACK)
+            screen.fill(BLACK)
             try:
-                splash_font = pygame.font.Font(self.font_path, 30)
-                splash_surf = splash_font.render("BisIT Productions", True, (200, 200, 200))
-                splash_surf.set_alpha(self.splash_alpha)
-                self.screen.blit(splash_surf, (WIDTH//2 - splash_surf.get_width()//2, HEIGHT//2))
+                if self.splash_surf is None:
+                    self.splash_surf = self.splash_font.render("BisIT Productions", True, (200, 200, 200))
+                self.splash_surf.set_alpha(self.splash_alpha)
+                screen.blit(self.splash_surf, (WIDTH//2 - self.splash_surf.get_width()//2, HEIGHT//2))
             except: pass
             return
 
-        self.screen.blit(self.bg1, (0, 0))
-        self.bg2.set_alpha(self.fade_alpha)
-        self.screen.blit(self.bg2, (0, 0))
+        self.draw_backdrop(screen)
 
         for p in self.particles:
-            p.draw(self.screen)
-
-        if self.menu_state in ["TITLE_WRITE", "READY"]:
-            box_w, box_h = 700, 160
-            box_surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-            pygame.draw.rect(box_surf, (255, 253, 208, 180), (0, 0, box_w, box_h), border_radius=15)
-            pygame.draw.rect(box_surf, LUMEN_GOLD, (0, 0, box_w, box_h), width=3, border_radius=15)
-            self.screen.blit(box_surf, (WIDTH//2 - box_w//2, 80))
-
-            try:
-                title_font = pygame.font.Font(self.font_path, 90)
-                main_title = title_font.render(self.title_text_current, True, (60, 60, 60))
-                self.screen.blit(main_title, (WIDTH//2 - main_title.get_width()//2, 105))
-                
-                if self.menu_state == "READY":
-                    sub_font = pygame.font.Font(self.font_path, 25)
-                    sub_title = sub_font.render("SCRAPJET SKYWAYS", True, (100, 90, 0))
-                    self.screen.blit(sub_title, (WIDTH//2 - sub_title.get_width()//2, 190))
-            except: pass
+            p.draw(screen)
 
         if self.menu_state == "READY":
             try:
-                opt_font = pygame.font.Font(self.font_path, 35)
                 for i, option in enumerate(self.options):
                     is_sel = (i == self.selected_index)
-                    color = list(LUMEN_GOLD) if is_sel else [255, 255, 255]
-                    
-                    if is_sel:
-                        glow = (math.sin(self.pulse_timer) + 1) * 20
-                        color[1] = min(255, color[1] + glow)
-                    
-                    text = f"> {option} <" if is_sel else option
-                    surf = opt_font.render(text, True, color)
+                    level = int((math.sin(self.pulse_timer) + 1) * 0.5 * GLOW_LEVELS) if is_sel else 0
+                    surf = self.option_surface(i, is_sel, level)
                     surf.set_alpha(self.button_alphas[i])
                     
                     x_pos = WIDTH//2 - surf.get_width()//2
                     if is_sel: x_pos += math.sin(self.pulse_timer * 2) * 5
                     
-                    # Vertical spacing for 3 buttons
-                    self.screen.blit(surf, (x_pos, 350 + i * 80))
+                    # Vertical spacing for 4 buttons
+                    screen.blit(surf, (x_pos, 340 + i * 75))
             except: pass
 
+    def draw_backdrop(self, screen):
+        # Both backgrounds stay cached in the asset manager; the crossfade is
+        # drawn on top each frame instead of recomposing a full-screen layer
+        screen.blit(self.bg1, (0, 0))
+        fade = (int(self.fade_alpha) // FADE_STEP) * FADE_STEP
+        if fade > 0:
+            bg2 = self.bg2
+            bg2.set_alpha(fade)
+            screen.blit(bg2, (0, 0))
+
+        if self.menu_state in ["TITLE_WRITE", "READY"]:
+            key = ("menu_title", self.title_text_current, self.menu_state == "READY")
+            title = self.assets.baked(key, self.build_title, [MENU])
+            screen.blit(title, (WIDTH//2 - title.get_width()//2, 80))
+
+    def build_title(self):
+        box_w, box_h = 700, 160
+        box_surf = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        pygame.draw.rect(box_surf, (255, 253, 208, 180), (0, 0, box_w, box_h), border_radius=15)
+        pygame.draw.rect(box_surf, LUMEN_GOLD, (0, 0, box_w, box_h), width=3, border_radius=15)
+
+        try:
+            main_title = self.title_font.render(self.title_text_current, True, (60, 60, 60))
+            box_surf.blit(main_title, (box_w//2 - main_title.get_width()//2, 25))
+            
+            if self.menu_state == "READY":
+                sub_title = self.sub_font.render("SCRAPJET SKYWAYS", True, (100, 90, 0))
+                box_surf.blit(sub_title, (box_w//2 - sub_title.get_width()//2, 110))
+        except: pass
+        return box_surf
+
+    def option_surface(self, index, is_sel, level):
+        key = (index, is_sel, level)
+        surf = self.option_surfs.get(key)
+        if surf is None:
+            option = self.options[index]
+            color = list(LUMEN_GOLD) if is_sel else [255, 255, 255]
+            if is_sel:
+                color[1] = min(255, color[1] + level / GLOW_LEVELS * 40)
+            text = f"> {option} <" if is_sel else option
+            surf = self.opt_font.render(text, True, color)
+            self.option_surfs[key] = surf
+        return surf
+
     def handle_input(self, event):
         if self.menu_state != "READY":
             if event.type == pygame.KEYDOWN:
@@ -188,46 +234,75 @@ class MainMenu:
         return None
 
 class GameOverScreen:
-    def __init__(self, screen):
-        self.screen = screen
+    OPTIONS = ["Retry", "Main Menu", "Exit"]
+
+    def __init__(self):
         self.font_path = "assets/fonts/8-bitanco.ttf"
-        self.options = ["Retry", "Main Menu", "Exit"]
+        self.options = list(self.OPTIONS)
         self.selected_index = 0
         self.timer = 0
 
+        # Text is rendered once per value and reused while the screen is up
+        self.fonts = None
+        self.text_cache = {}
+
     def update(self, dt):
         self.timer += dt
 
-    def draw(self, distance, score):
+    def set_next_level(self, available):
+        """Offers 'Next Level' first after a won story mission with more to play."""
+        self.options = (["Next Level"] if available else []) + self.OPTIONS
+        self.selected_index = 0
+
+    def text(self, font_key, text, color):
+        key = (font_key, text, color)
+        surf = self.text_cache.get(key)
+        if surf is None:
+            surf = self.fonts[font_key].render(text, True, color)
+            self.text_cache[key] = surf
+        return surf
+
+    @staticmethod
+    def _build_overlay():
         overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         overlay.fill((20, 0, 0, 180)) 
-        self.screen.blit(overlay, (0, 0))
+        return overlay
+
+    def draw(self, screen, distance, score, title="SYSTEM FAILURE"):
+        overlay = get_asset_manager().baked(("gameover_overlay",), self._build_overlay, [PLAYING])
+        screen.blit(overlay, (0, 0))
 
         try:
-            title_font = pygame.font.Font(self.font_path, 80)
+            if self.fonts is None:
+                self.fonts = {"title": pygame.font.Font(self.font_path, 80),
+                              "stat": pygame.font.Font(self.font_path, 24),
+                              "opt": pygame.font.Font(self.font_path, 30)}
+                self.text_cache = {}
+
             off_x = random.randint(-2, 2)
-            title_surf = title_font.render("SYSTEM FAILURE", True, HEAT_RED)
-            self.screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2 + off_x, 150))
+            title_surf = self.text("title", title, HEAT_RED)
+            screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2 + off_x, 150))
 
-            stat_font = pygame.font.Font(self.font_path, 24)
-            dist_surf = stat_font.render(f"DISTANCE TRAVELED: {int(distance)}m", True, WHITE)
-            scrap_surf = stat_font.render(f"SCRAP RECOVERED: {score}", True, LUMEN_GOLD)
+            dist_surf = self.text("stat", f"DISTANCE TRAVELED: {int(distance)}m", WHITE)
+            scrap_surf = self.text("stat", f"SCRAP RECOVERED: {score}", LUMEN_GOLD)
             
-            self.screen.blit(dist_surf, (WIDTH//2 - dist_surf.get_width()//2, 280))
-            self.screen.blit(scrap_surf, (WIDTH//2 - scrap_surf.get_width()//2, 320))
+            screen.blit(dist_surf, (WIDTH//2 - dist_surf.get_width()//2, 280))
+            screen.blit(scrap_surf, (WIDTH//2 - scrap_surf.get_width()//2, 320))
 
-            opt_font = pygame.font.Font(self.font_path, 30)
             for i, opt in enumerate(self.options):
                 is_sel = (i == self.selected_index)
                 color = HEAT_RED if is_sel else (150, 150, 150)
                 
                 if is_sel:
                     alpha = 155 + math.sin(self.timer * 10) * 100
-                    color = (int(alpha), 50, 50)
+                    color = ((int(alpha) // ALPHA_STEP) * ALPHA_STEP, 50, 50)
                 
                 text = f"> {opt} <" if is_sel else opt
-                surf = opt_font.render(text, True, color)
-                self.screen.blit(surf, (WIDTH//2 - surf.get_width()//2, 450 + i * 60))
+                surf = self.text("opt", text, color)
+                screen.blit(surf, (WIDTH//2 - surf.get_width()//2, 450 + i * 60))
+
+            # Stats differ every run; keep the cache from growing across retries
+            if len(self.text_cache) > 64: self.text_cache = {}
 
         except Exception as e:
             print(f"Menu Draw Error: {e}")
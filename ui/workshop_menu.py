@@ -2,6 +2,8 @@ import pygame
 import random
 import math
 from settings import *
+from managers.asset_manager import get_asset_manager, WORKSHOP
+from core import stamps
 
 class DustParticle:
     """Floating dust motes to add ambience to the workshop."""
@@ -17,6 +19,7 @@ class DustParticle:
         self.vel_x = random.uniform(-10, 10)
         self.alpha = random.randint(50, 150)
         self.size = random.randint(1, 3)
+        self.image = stamps.rect(self.size, self.size, WHITE, (self.alpha // 16) * 16)
 
     def update(self, dt):
         self.y += self.vel_y * dt
@@ -25,22 +28,13 @@ class DustParticle:
             self.reset()
 
     def draw(self, screen):
-        s = pygame.Surface((self.size, self.size))
-        s.set_alpha(self.alpha)
-        s.fill(WHITE)
-        screen.blit(s, (self.x, self.y))
+        screen.blit(self.image, (self.x, self.y))
 
 class WorkshopMenu:
-    def __init__(self, screen, upgrade_manager):
-        self.screen = screen
+    def __init__(self, upgrade_manager):
         self.manager = upgrade_manager
         
-        try:
-            self.bg = pygame.image.load("assets/backgrounds/workshop.jpeg").convert()
-            self.bg = pygame.transform.scale(self.bg, (WIDTH, HEIGHT))
-        except:
-            self.bg = pygame.Surface((WIDTH, HEIGHT))
-            self.bg.fill((20, 15, 10))
+        self.assets = get_asset_manager()
 
         # Modern UI Fonts
         self.font_main = pygame.font.SysFont("Impact", 50)
@@ -58,10 +52,28 @@ class WorkshopMenu:
         self.feedback_color = LUMEN_GOLD
         self.glow_anim = 0
 
+        # Everything but the pulsing selection is one layer baked in the asset
+        # manager, repainted only when the selection, bolts or upgrade levels
+        # change. Only the key is kept here so leaving the scene frees it.
+        self.static_key = None
+        self.feedback_surf = None
+
+    @property
+    def bg(self):
+        try:
+            return self.assets.image("assets/backgrounds/workshop.jpeg", [WORKSHOP], alpha=False, size=(WIDTH, HEIGHT))
+        except:
+            def placeholder():
+                surf = pygame.Surface((WIDTH, HEIGHT))
+                surf.fill((20, 15, 10))
+                return surf
+            return self.assets.baked(("placeholder", "workshop"), placeholder, [WORKSHOP])
+
     def show_feedback(self, message, color=LUMEN_GOLD):
         self.feedback_msg = message
         self.feedback_timer = 2.0
         self.feedback_color = color
+        self.feedback_surf = self.font_ui.render(message, True, color)
 
     def handle_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -99,87 +111,117 @@ class WorkshopMenu:
             self.feedback_timer -= dt
         self.glow_anim += 5 * dt
 
-    def draw(self):
+    def draw(self, screen):
+        layer, selected_card = self.get_static_layer()
+        screen.blit(layer, (0, 0))
+        
+        for p in self.particles:
+            p.draw(screen)
+
+        # Feedback Notification
+        if self.feedback_timer > 0 and self.feedback_surf:
+            f_rect = self.feedback_surf.get_rect(center=(WIDTH//2, 130))
+            screen.blit(self.feedback_surf, f_rect)
+
+        # Selected card: pulsing glow behind the pre-drawn card
+        card_rect = self.card_rect(self.selected_index)
+        pulse = math.sin(self.glow_anim) * 4
+        pygame.draw.rect(screen, LUMEN_GOLD, card_rect.inflate(pulse, pulse), 0, 12)
+        screen.blit(selected_card, card_rect)
+
+    def card_rect(self, i):
+        # Layout logic: Split into two columns
+        col = i // 4 
+        row = i % 4
+        return pygame.Rect(60 + (col * 480), 180 + (row * 110), 440, 90)
+
+    def get_static_layer(self):
+        levels = tuple(self.manager.stats[name]["level"] for name in self.stat_names)
+        key = (self.selected_index, self.manager.total_bolts, levels)
+
+        layer = self.assets.baked(("workshop_static",), self.build_layer, [WORKSHOP])
+        selected_card = self.assets.baked(("workshop_selected_card",), self.build_card, [WORKSHOP])
+        if key == self.static_key:
+            return layer, selected_card
+        self.static_key = key
+
         # Draw base background with dark tint
-        self.screen.blit(self.bg, (0, 0))
+        layer.blit(self.bg, (0, 0))
         dark_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         dark_overlay.fill((0, 0, 0, 160))
-        self.screen.blit(dark_overlay, (0, 0))
-        
-        for p in self.particles:
-            p.draw(self.screen)
+        layer.blit(dark_overlay, (0, 0))
 
         # Top Bar
-        pygame.draw.rect(self.screen, (20, 20, 25), (0, 0, WIDTH, 100))
-        pygame.draw.line(self.screen, LUMEN_GOLD, (0, 100), (WIDTH, 100), 3)
+        pygame.draw.rect(layer, (20, 20, 25), (0, 0, WIDTH, 100))
+        pygame.draw.line(layer, LUMEN_GOLD, (0, 100), (WIDTH, 100), 3)
         
         header = self.font_main.render("WEI'S CUSTOMS", True, LUMEN_GOLD)
-        self.screen.blit(header, (40, 25))
+        layer.blit(header, (40, 25))
         
         bolts = self.font_ui.render(f"AVAIL. SCRAP: {self.manager.total_bolts} B", True, WHITE)
-        self.screen.blit(bolts, (WIDTH - 300, 35))
-
-        # Feedback Notification
-        if self.feedback_timer > 0:
-            f_surf = self.font_ui.render(self.feedback_msg, True, self.feedback_color)
-            f_rect = f_surf.get_rect(center=(WIDTH//2, 130))
-            self.screen.blit(f_surf, f_rect)
+        layer.blit(bolts, (WIDTH - 300, 35))
 
         # Drawing Upgrade Cards
         for i, name in enumerate(self.stat_names):
-            data = self.manager.stats[name]
-            is_sel = i == self.selected_index
-            
-            # Layout logic: Split into two columns
-            col = i // 4 
-            row = i % 4
-            x = 60 + (col * 480)
-            y = 180 + (row * 110)
-            
-            card_rect = pygame.Rect(x, y, 440, 90)
-            
-            # Selection Glow
-            if is_sel:
-                pulse = math.sin(self.glow_anim) * 4
-                pygame.draw.rect(self.screen, LUMEN_GOLD, card_rect.inflate(pulse, pulse), 0, 12)
-            
-            # Card Body
-            bg_color = (45, 45, 55) if not is_sel else (70, 65, 50)
-            pygame.draw.rect(self.screen, bg_color, card_rect, 0, 10)
-            pygame.draw.rect(self.screen, LUMEN_GOLD if is_sel else (100, 100, 110), card_rect, 2, 10)
-
-            # Icon/Type Decorator
-            is_weapon = any(k in name for k in ["charges", "fuel", "missile", "bomb"])
-            icon_color = (100, 200, 255) if is_weapon else (150, 255, 150)
-            pygame.draw.rect(self.screen, icon_color, (x+15, y+15, 10, 60), border_radius=5)
-
-            # Text Rendering
-            display_name = name.replace("_", " ").upper()
-            label = self.font_ui.render(display_name, True, WHITE)
-            self.screen.blit(label, (x + 40, y + 15))
-            
-            # Cost or Maxed
-            current_cost = self.manager.get_upgrade_cost(name)
-            if data["level"] < data.get("max", 10):
-                cost_color = WHITE if self.manager.total_bolts >= current_cost else (255, 100, 100)
-                cost_label = self.font_ui.render(f"{current_cost} B", True, cost_color)
-                self.screen.blit(cost_label, (card_rect.right - 90, y + 15))
-            else:
-                max_label = self.font_ui.render("MAX", True, (100, 255, 100))
-                self.screen.blit(max_label, (card_rect.right - 80, y + 15))
-
-            # Progress Bar or Ammo Count (THE FIX IS HERE)
-            if not is_weapon:
-                bar_bg = pygame.Rect(x + 40, y + 55, 300, 15)
-                pygame.draw.rect(self.screen, (20, 20, 25), bar_bg, border_radius=5)
-                progress = data["level"] / data["max"]
-                pygame.draw.rect(self.screen, (150, 255, 150), (x+40, y+55, 300 * progress, 15), border_radius=5)
-            else:
-                # Show specific count for weapons using 'level' key
-                ammo_text = self.font_small.render(f"STARTING STOCK: {data['level']}", True, (100, 200, 255))
-                self.screen.blit(ammo_text, (x + 45, y + 53))
+            if i != self.selected_index:
+                self.draw_card(layer, i, name, self.card_rect(i))
+
+        selected_card.fill((0, 0, 0, 0))
+        self.draw_card(selected_card, self.selected_index, self.stat_names[self.selected_index],
+                       pygame.Rect((0, 0), selected_card.get_size()))
 
         # Footer
         footer_text = "[UP/DOWN] BROWSE   [ENTER] PURCHASE   [ESC] LAUNCH"
         footer_surf = self.font_small.render(footer_text, True, (150, 150, 150))
-        self.screen.blit(footer_surf, (WIDTH // 2 - footer_surf.get_rect().width // 2, HEIGHT - 40))
\ No newline at end of file
+        layer.blit(footer_surf, (WIDTH // 2 - footer_surf.get_rect().width // 2, HEIGHT - 40))
+        return layer, selected_card
+
+    def build_layer(self):
+        # A fresh surface (first visit or evicted on scene exit) is blank
+        self.static_key = None
+        return pygame.Surface((WIDTH, HEIGHT))
+
+    def build_card(self):
+        self.static_key = None
+        return pygame.Surface(self.card_rect(0).size, pygame.SRCALPHA)
+
+    def draw_card(self, surface, i, name, card_rect):
+        data = self.manager.stats[name]
+        is_sel = i == self.selected_index
+        x, y = card_rect.topleft
+        
+        # Card Body
+        bg_color = (45, 45, 55) if not is_sel else (70, 65, 50)
+        pygame.draw.rect(surface, bg_color, card_rect, 0, 10)
+        pygame.draw.rect(surface, LUMEN_GOLD if is_sel else (100, 100, 110), card_rect, 2, 10)
+
+        # Icon/Type Decorator
+        is_weapon = any(k in name for k in ["charges", "fuel", "missile", "bomb"])
+        icon_color = (100, 200, 255) if is_weapon else (150, 255, 150)
+        pygame.draw.rect(surface, icon_color, (x+15, y+15, 10, 60), border_radius=5)
+
+        # Text Rendering
+        display_name = name.replace("_", " ").upper()
+        label = self.font_ui.render(display_name, True, WHITE)
+        surface.blit(label, (x + 40, y + 15))
+        
+        # Cost or Maxed
+        current_cost = self.manager.get_upgrade_cost(name)
+        if data["level"] < data.get("max", 10):
+            cost_color = WHITE if self.manager.total_bolts >= current_cost else (255, 100, 100)
+            cost_label = self.font_ui.render(f"{current_cost} B", True, cost_color)
+            surface.blit(cost_label, (card_rect.right - 90, y + 15))
+        else:
+            max_label = self.font_ui.render("MAX", True, (100, 255, 100))
+            surface.blit(max_label, (card_rect.right - 80, y + 15))
+
+        # Progress Bar or Ammo Count (THE FIX IS HERE)
+        if not is_weapon:
+            bar_bg = pygame.Rect(x + 40, y + 55, 300, 15)
+            pygame.draw.rect(surface, (20, 20, 25), bar_bg, border_radius=5)
+            progress = data["level"] / data["max"]
+            pygame.draw.rect(surface, (150, 255, 150), (x+40, y+55, 300 * progress, 15), border_radius=5)
+        else:
+            # Show specific count for weapons using 'level' key
+            ammo_text = self.font_small.render(f"STARTING STOCK: {data['level']}", True, (100, 200, 255))
+            surface.blit(ammo_text, (x + 45, y + 53))
@@ -2,6 +2,16 @@ import pygame
 import random
 import math
 from settings import *
+from managers.asset_manager import get_asset_manager, PLAYING
+from world.parallax import tint_surface
+from core import stamps
+
+# Pre-rendered mist sprites: every size paired with every opacity
+MIST_COLOR = (220, 230, 255) # Indigo-tinted white for the astral vibe
+MIST_SIZES = [(150, 40), (220, 60), (300, 80), (400, 100)]
+MIST_ALPHAS = [40, 70, 100]
+
+STREAK_COLOR = (150, 180, 255)
 
 class SplashParticle:
     def __init__(self, x, y, is_astral=False):
@@ -22,24 +32,23 @@ class SplashParticle:
     def draw(self, screen):
         size = int(self.life * 6)
         if size > 0:
-            glow = pygame.Surface((size*3, size*3), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (*self.color, 50), (size*1.5, size*1.5), size*1.5)
+            glow = stamps.disc(size*3, self.color, 50)
             screen.blit(glow, glow.get_rect(center=(int(self.pos.x), int(self.pos.y))), special_flags=pygame.BLEND_RGB_ADD)
             pygame.draw.circle(screen, self.color, (int(self.pos.x), int(self.pos.y)), size)
 
 class CloudMist:
     """Soft rolling clouds that sit on the ground level."""
-    def __init__(self):
+    def __init__(self, sprites):
+        self.sprites = sprites
         self.reset()
         self.x = random.randint(0, WIDTH) # Initial random spread
 
     def reset(self):
         self.x = WIDTH + random.randint(50, 500)
         self.y = GROUND_LINE - random.randint(10, 40)
-        self.size_w = random.randint(150, 400)
-        self.size_h = random.randint(40, 100)
+        self.image = random.choice(self.sprites)
+        self.size_w, self.size_h = self.image.get_size()
         self.speed = random.uniform(100, 250)
-        self.alpha = random.randint(40, 100)
 
     def update(self, dt):
         self.x -= self.speed * dt
@@ -47,33 +56,53 @@ class CloudMist:
             self.reset()
 
     def draw(self, screen):
-        mist_surf = pygame.Surface((self.size_w, self.size_h), pygame.SRCALPHA)
-        # Indigo-tinted white for the astral vibe
-        pygame.draw.ellipse(mist_surf, (220, 230, 255, self.alpha), (0, 0, self.size_w, self.size_h))
-        screen.blit(mist_surf, (self.x, self.y))
+        screen.blit(self.image, (self.x, self.y))
 
 class Ground:
     def __init__(self):
         self.surface_y = GROUND_LINE
         
-        try:
-            self.image = pygame.image.load("assets/backgrounds/ground.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.image.get_width(), GROUND_HEIGHT))
-        except:
-            self.image = pygame.Surface((WIDTH, GROUND_HEIGHT))
-            self.image.fill((20, 20, 40)) 
-            
+        self.assets = get_asset_manager()
         self.width = self.image.get_width()
         self.scroll = 0
         self.particles = []
         self.splash_timer = 0
         
-        self.streaks = []
-        for _ in range(10):
-            self.streaks.append({'x': random.randint(0, WIDTH), 'y': random.randint(2, GROUND_HEIGHT-2), 'w': random.randint(40, 100)})
+        # Speed streaks are baked into one screen-wide strip that scrolls and wraps
+        self.streak_strip = self._build_streak_strip(10)
+        self.streak_scroll = 0
 
         # New: Sea of Clouds system
-        self.mist_layers = [CloudMist() for _ in range(6)]
+        mist_sprites = [stamps.ellipse(w, h, MIST_COLOR, a) for w, h in MIST_SIZES for a in MIST_ALPHAS]
+        self.mist_layers = [CloudMist(mist_sprites) for _ in range(6)]
+
+    @property
+    def image(self):
+        return self.assets.baked(("ground_strip", GROUND_HEIGHT), self._build_image, [PLAYING])
+
+    def tinted_image(self, tint):
+        if tint <= 0: return self.image
+        return self.assets.baked(("ground_strip", GROUND_HEIGHT, "tint", tint), lambda: tint_surface(self.image, tint), [PLAYING])
+
+    def _build_image(self):
+        try:
+            image = pygame.image.load("assets/backgrounds/ground.png").convert_alpha()
+            return pygame.transform.scale(image, (image.get_width(), GROUND_HEIGHT))
+        except:
+            image = pygame.Surface((WIDTH, GROUND_HEIGHT))
+            image.fill((20, 20, 40)) 
+            return image
+
+    def _build_streak_strip(self, count):
+        strip = pygame.Surface((WIDTH, GROUND_HEIGHT))
+        strip.fill((0, 0, 0))
+        for _ in range(count):
+            x, y, w = random.randint(0, WIDTH), random.randint(5, GROUND_HEIGHT - 10), random.randint(40, 100)
+            # Streaks crossing the seam are drawn on both ends so the strip tiles
+            pygame.draw.rect(strip, STREAK_COLOR, (x, y, w, 2))
+            pygame.draw.rect(strip, STREAK_COLOR, (x - WIDTH, y, w, 2))
+        strip.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return strip
 
     def update(self, dt, player_rect, is_skimming):
         self.scroll = (self.scroll + (PLAYER_SPEED * 1.2) * dt) % self.width
@@ -92,11 +121,7 @@ class Ground:
                 self.splash_timer = 0
 
         # 3. Update Streaks
-        for s in self.streaks:
-            s['x'] -= (PLAYER_SPEED * 1.5) * dt
-            if s['x'] < -s['w']:
-                s['x'] = WIDTH + random.randint(10, 100)
-                s['y'] = random.randint(5, GROUND_HEIGHT - 10)
+        self.streak_scroll = (self.streak_scroll + (PLAYER_SPEED * 1.5) * dt) % WIDTH
 
         for p in self.particles[:]:
             p.update(dt)
@@ -110,21 +135,22 @@ class Ground:
             return True
         return False
 
-    def draw(self, screen):
-        # 1. Main Ground Texture
+    def draw(self, screen, tint=0):
+        # 1. Main Ground Texture (pre-tinted while the boss darkens the sky)
+        image = self.tinted_image(tint)
         tiles_needed = (WIDTH // self.width) + 2
         for i in range(tiles_needed):
             x_pos = (i * self.width) - self.scroll
-            screen.blit(self.image, (x_pos, self.surface_y))
+            screen.blit(image, (x_pos, self.surface_y))
         
         # 2. Draw Mist (Behind the player/splashes but over the ground)
         for mist in self.mist_layers:
             mist.draw(screen)
 
         # 3. Draw Speed Streaks
-        for s in self.streaks:
-            streak_rect = pygame.Rect(s['x'], self.surface_y + s['y'], s['w'], 2)
-            pygame.draw.rect(screen, (150, 180, 255, 80), streak_rect)
+        x = -int(self.streak_scroll)
+        screen.blit(self.streak_strip, (x, self.surface_y))
+        screen.blit(self.streak_strip, (x + WIDTH, self.surface_y))
 
         # 4 Draw splashes
         for p in self.particles:
@@ -2,6 +2,7 @@ import pygame
 import random
 import math
 from settings import WIDTH, HEIGHT, GROUND_LINE, SKY_BLUE
+from managers.asset_manager import get_asset_manager, PLAYING
 
 # --- Constants ---
 SUNSET_ORANGE = (255, 110, 60)
@@ -11,6 +12,46 @@ LUMEN_GOLD = (255, 215, 0)
 WHITE = (255, 255, 255)
 BOSS_SKY_COLOR = (45, 10, 50) 
 
+# Boss "darkness" the enemy manager dims the world with. Instead of a full-screen
+# overlay pass it is folded into the sky colour and into pre-tinted layer images.
+BOSS_TINT_COLOR = (30, 0, 60) # Deep Indigo
+TINT_STEP = 30                # Layer tints are baked every 30 alpha (0..150 = 5 variants per run)
+
+def quantize_tint(alpha):
+    return int(round(alpha / TINT_STEP)) * TINT_STEP
+
+def tint_surface(image, alpha):
+    """Copy of image as if a BOSS_TINT_COLOR overlay at alpha had been blitted over it."""
+    tinted = image.copy()
+    keep = 255 - alpha
+    tinted.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+    tinted.fill(tuple(c * alpha // 255 for c in BOSS_TINT_COLOR), special_flags=pygame.BLEND_RGB_ADD)
+    return tinted
+
+# --- Sky colour lookup ---
+# The day/night/boss blend only depends on the day angle and the boss factor,
+# so it is tabulated once instead of re-run through trig every update.
+SKY_ANGLE_STEPS = 360
+SKY_BOSS_STEPS = 20
+
+def _sky_color(angle, boss_factor):
+    if angle <= math.pi:
+        t, target = max(0, math.sin(angle)), SKY_BLUE
+    else:
+        t, target = abs(math.sin(angle)), NIGHT_NAVY
+    base = [SUNSET_ORANGE[i] * (1 - t) + target[i] * t for i in range(3)]
+    return tuple(base[i] * (1 - boss_factor) + BOSS_SKY_COLOR[i] * boss_factor for i in range(3))
+
+SKY_LUT = [[_sky_color(a / SKY_ANGLE_STEPS * 2 * math.pi, b / SKY_BOSS_STEPS) for a in range(SKY_ANGLE_STEPS)]
+           for b in range(SKY_BOSS_STEPS + 1)]
+
+# The star field is one batched blit of pre-drawn star stamps. The batch is only
+# rebuilt when the fade bucket or the twinkle step changes (the twinkle is a ~2s
+# sine, 16 steps per cycle). A single full-width star surface was tried but
+# blitting that much transparent area cost more than the stars themselves.
+STAR_ALPHA_STEP = 16
+TWINKLE_STEP_MS = 130
+
 class Sun:
     def __init__(self):
         self.center_x = WIDTH // 2
@@ -19,6 +60,7 @@ class Sun:
         self.pos = [0, 0]
         self.radius = 45
         self.color = list(LUMEN_GOLD)
+        self.glows = {} # is_night -> pre-drawn glow
 
     def update(self, angle):
         self.pos[0] = self.center_x + math.cos(angle) * self.orbit_radius
@@ -29,8 +71,11 @@ class Sun:
         glow_color = (100, 100, 150, 40) if is_night else (255, 200, 50, 60)
         
         glow_size = self.radius * 2 if not is_night else self.radius * 1.5
-        glow_surf = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, glow_color, (int(glow_size), int(glow_size)), int(glow_size))
+        glow_surf = self.glows.get(is_night)
+        if glow_surf is None:
+            glow_surf = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, glow_color, (int(glow_size), int(glow_size)), int(glow_size))
+            self.glows[is_night] = glow_surf
         screen.blit(glow_surf, (self.pos[0] - glow_size, self.pos[1] - glow_size))
         
         pygame.draw.circle(screen, color, (int(self.pos[0]), int(self.pos[1])), self.radius)
@@ -42,14 +87,12 @@ class Star:
         self.size = random.randint(1, 3)
         self.flicker = random.uniform(0, math.pi)
 
-    def draw(self, screen, alpha):
+    def twinkle_alpha(self, alpha, ticks):
         current_alpha = max(0, min(255, int(alpha)))
-        if current_alpha <= 0: return
-        flicker_val = (0.4 + 0.6 * math.sin(pygame.time.get_ticks() * 0.003 + self.flicker))
+        if current_alpha <= 0: return 0
+        flicker_val = (0.4 + 0.6 * math.sin(ticks * 0.003 + self.flicker))
         s_alpha = int(max(0, min(255, current_alpha * flicker_val)))
-        star_surf = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(star_surf, (255, 255, 255, s_alpha), (self.size, self.size), self.size)
-        screen.blit(star_surf, (self.x, self.y))
+        return (s_alpha // STAR_ALPHA_STEP) * STAR_ALPHA_STEP
 
 class Bird:
     def __init__(self):
@@ -76,15 +119,15 @@ class WindStreak:
         self.length = random.randint(20, 50)
         self.speed = random.randint(300, 500)
         self.alpha = random.randint(30, 80)
+        self.image = pygame.Surface((self.length, 2), pygame.SRCALPHA)
+        self.image.fill((255, 255, 255, self.alpha))
     def update(self, dt):
         self.x -= self.speed * dt
         if self.x < -self.length:
             self.x = WIDTH + 10
             self.y = random.randint(20, GROUND_LINE - 100)
     def draw(self, screen):
-        streak_surf = pygame.Surface((self.length, 2), pygame.SRCALPHA)
-        streak_surf.fill((255, 255, 255, self.alpha))
-        screen.blit(streak_surf, (self.x, self.y))
+        screen.blit(self.image, (self.x, self.y))
 
 class Cloud(pygame.sprite.Sprite):
     def __init__(self, image, start_on_screen=False):
@@ -106,49 +149,77 @@ class Cloud(pygame.sprite.Sprite):
         screen.blit(self.image, (self.x, self.y))
 
 class ParallaxLayer:
-    def __init__(self, image_path, internal_speed, y_pos=0, stretch_to_bottom=False, scale=1.0, alpha=255):
-        original_surf = pygame.image.load(image_path).convert_alpha()
+    def __init__(self, image_path, internal_speed, y_pos=0, stretch_to_bottom=False, scale=1.0, alpha=255, occluded_below=None):
+        self.image_path = image_path
+        self.stretch_to_bottom = stretch_to_bottom
+        self.scale = scale
+        self.alpha = alpha
+        self.occluded_below = occluded_below # Rows under this y are always covered (e.g. by the ground)
+        self.assets = get_asset_manager()
+        
+        self.y_pos = y_pos
+        self.width = self.image.get_width()
+        self.internal_speed = internal_speed
+        self.x = 0
+        
+    @property
+    def image(self):
+        return self.assets.baked(self._key(), self._build_image, [PLAYING])
+
+    def tinted_image(self, tint):
+        if tint <= 0: return self.image
+        return self.assets.baked(self._key() + ("tint", tint), lambda: tint_surface(self.image, tint), [PLAYING])
+
+    def _key(self):
+        return ("layer", self.image_path, self.y_pos, self.stretch_to_bottom, self.scale, self.alpha, self.occluded_below)
+
+    def _build_image(self):
+        original_surf = pygame.image.load(self.image_path).convert_alpha()
         w, h = original_surf.get_size()
         
-        if stretch_to_bottom:
-            target_h = HEIGHT - y_pos
+        if self.stretch_to_bottom:
+            target_h = HEIGHT - self.y_pos
             ratio = target_h / h
-            scaled_w = int(w * ratio * scale)
+            scaled_w = int(w * ratio * self.scale)
             scaled_h = target_h
         else:
-            scaled_w = int(w * scale)
-            scaled_h = int(h * scale)
+            scaled_w = int(w * self.scale)
+            scaled_h = int(h * self.scale)
             
-        self.image = pygame.transform.scale(original_surf, (scaled_w, scaled_h))
-        self.image.set_alpha(alpha) 
-        
-        self.width = self.image.get_width()
-        self.y_pos = y_pos
-        self.internal_speed = internal_speed
-        self.x = 0
-        
+        image = pygame.transform.scale(original_surf, (scaled_w, scaled_h))
+        # Crop the part that ends up hidden, it would only cost fill-rate
+        if self.occluded_below is not None and self.y_pos + scaled_h > self.occluded_below:
+            image = image.subsurface((0, 0, scaled_w, max(1, self.occluded_below - self.y_pos))).copy()
+        image.set_alpha(self.alpha) 
+        return image
+
     def update(self, dt):
         self.x -= self.internal_speed * dt
         if self.x <= -self.width: self.x += self.width
         
-    def draw(self, screen):
+    def draw(self, screen, tint=0):
+        image = self.tinted_image(tint)
         tiles_needed = (WIDTH // self.width) + 2
         for i in range(tiles_needed):
-            screen.blit(self.image, (self.x + (i * self.width), self.y_pos))
+            screen.blit(image, (self.x + (i * self.width), self.y_pos))
 
 class ParallaxBackground:
     def __init__(self):
         self.bg_color = list(SKY_BLUE)
         self.stars = [Star() for _ in range(70)]
         self.star_alpha = 0
+        self.star_stamps = {} # (size, alpha) -> pre-drawn star
+        self.star_blits = []
+        self.star_key = None
         self.sun = Sun()
         self.boss_factor = 0.0
         self.target_boss_factor = 0.0
+        self.sky_tint = 0 # Quantized boss tint alpha for the layer images
         self.wind_streaks = [WindStreak() for _ in range(8)]
         self.birds = [Bird() for _ in range(3)]
         
         try:
-            self.cloud_img = pygame.image.load("assets/backgrounds/cloud.png").convert_alpha()
+            self.cloud_img = get_asset_manager().image("assets/backgrounds/cloud.png", [PLAYING])
         except:
             self.cloud_img = pygame.Surface((100, 50), pygame.SRCALPHA)
             pygame.draw.ellipse(self.cloud_img, (255, 255, 255, 150), (0, 0, 100, 50))
@@ -159,14 +230,15 @@ class ParallaxBackground:
             self.active_clouds.append(Cloud(self.cloud_img, start_on_screen=True))
 
         # --- Layers ---
-        self.far_mountains = ParallaxLayer("assets/backgrounds/mountain.png", 20, GROUND_LINE - 450, True, scale=1.5, alpha=80)
+        # Everything below GROUND_LINE is covered by the opaque Ground strip
+        self.far_mountains = ParallaxLayer("assets/backgrounds/mountain.png", 20, GROUND_LINE - 450, True, scale=1.5, alpha=80, occluded_below=GROUND_LINE)
         
-        # New: Parallax Fog layer (drawn between far and near mountains)
-        self.fog_x = 0
-        self.fog_speed = 35
+        # Parallax Fog layer (drawn between far and near mountains). It is one flat
+        # sky-coloured band, so a single full-width strip is refilled, never reallocated.
+        self.fog_surf = pygame.Surface((WIDTH, 150), pygame.SRCALPHA)
+        self.fog_color = None
 
-        self.mountains = ParallaxLayer("assets/backgrounds/mountain.png", 50, GROUND_LINE - 320, True, scale=1.2)
-        self.ground_layer = ParallaxLayer("assets/backgrounds/ground.png", 200, GROUND_LINE, True, scale=1.0)
+        self.mountains = ParallaxLayer("assets/backgrounds/mountain.png", 50, GROUND_LINE - 320, True, scale=1.2, occluded_below=GROUND_LINE)
 
     def enter_boss_mode(self):
         self.target_boss_factor = 1.0
@@ -175,7 +247,7 @@ class ParallaxBackground:
         self.target_boss_factor = 0.0
         self.boss_factor = 0.0 
 
-    def update(self, player_distance, dt):
+    def update(self, player_distance, dt, sky_tint=0):
         if self.boss_factor < self.target_boss_factor:
             self.boss_factor = min(self.target_boss_factor, self.boss_factor + 2.0 * dt)
         elif self.boss_factor > self.target_boss_factor:
@@ -185,25 +257,23 @@ class ParallaxBackground:
         normalized_angle = time_angle % (2 * math.pi)
         self.sun.update(normalized_angle)
         is_night = normalized_angle > math.pi
-        day_intensity = max(0, math.sin(normalized_angle))
         
         if not is_night:
-            base_r = SUNSET_ORANGE[0] * (1 - day_intensity) + SKY_BLUE[0] * day_intensity
-            base_g = SUNSET_ORANGE[1] * (1 - day_intensity) + SKY_BLUE[1] * day_intensity
-            base_b = SUNSET_ORANGE[2] * (1 - day_intensity) + SKY_BLUE[2] * day_intensity
             self.star_alpha = max(0, self.star_alpha - 250 * dt)
         else:
-            night_intensity = abs(math.sin(normalized_angle))
-            base_r = SUNSET_ORANGE[0] * (1 - night_intensity) + NIGHT_NAVY[0] * night_intensity
-            base_g = SUNSET_ORANGE[1] * (1 - night_intensity) + NIGHT_NAVY[1] * night_intensity
-            base_b = SUNSET_ORANGE[2] * (1 - night_intensity) + NIGHT_NAVY[2] * night_intensity
             self.star_alpha = min(255, self.star_alpha + 100 * dt)
 
         b_f = max(0.0, min(1.0, self.boss_factor))
-        final_r = base_r * (1 - b_f) + BOSS_SKY_COLOR[0] * b_f
-        final_g = base_g * (1 - b_f) + BOSS_SKY_COLOR[1] * b_f
-        final_b = base_b * (1 - b_f) + BOSS_SKY_COLOR[2] * b_f
+        angle_i = int(normalized_angle / (2 * math.pi) * SKY_ANGLE_STEPS) % SKY_ANGLE_STEPS
+        final_r, final_g, final_b = SKY_LUT[int(round(b_f * SKY_BOSS_STEPS))][angle_i]
+
+        # Boss tint, same result as the old overlay blit on top of the sky
+        t_f = max(0.0, min(1.0, sky_tint / 255))
+        final_r = final_r * (1 - t_f) + BOSS_TINT_COLOR[0] * t_f
+        final_g = final_g * (1 - t_f) + BOSS_TINT_COLOR[1] * t_f
+        final_b = final_b * (1 - t_f) + BOSS_TINT_COLOR[2] * t_f
         self.bg_color = [int(final_r), int(final_g), int(final_b)]
+        self.sky_tint = quantize_tint(sky_tint)
 
         for s in self.wind_streaks: s.update(dt)
         for b in self.birds: b.update(dt)
@@ -220,39 +290,52 @@ class ParallaxBackground:
 
         speed_mult = 1.0 + (b_f * 0.5)
         self.far_mountains.update(dt * speed_mult)
-        
-        # Update Fog parallax
-        self.fog_x = (self.fog_x - self.fog_speed * dt * speed_mult) % WIDTH
-
         self.mountains.update(dt * speed_mult)
-        self.ground_layer.update(dt * speed_mult)
 
     def draw(self, screen):
-        screen.fill(tuple(self.bg_color))
+        # Sky only down to the ground line, the Ground strip covers the rest
+        screen.fill(tuple(self.bg_color), (0, 0, WIDTH, GROUND_LINE))
         
         safe_star_alpha = int(max(0, min(255, self.star_alpha)))
         total_star_alpha = max(safe_star_alpha, int(self.boss_factor * 150))
-        for star in self.stars:
-            star.draw(screen, total_star_alpha)
+        self.draw_stars(screen, total_star_alpha)
 
         if self.boss_factor < 0.8:
             self.sun.draw(screen, safe_star_alpha > 120) 
         
         # DRAW ORDER
-        self.far_mountains.draw(screen)
+        self.far_mountains.draw(screen, self.sky_tint)
         
-        # Draw Parallax Fog (Atmospheric Perspective)
-        # We create a gradient-like fog that matches the sky color
-        fog_surf = pygame.Surface((WIDTH, 150), pygame.SRCALPHA)
+        # Draw Parallax Fog (Atmospheric Perspective), matching the sky color
         fog_color = (*self.bg_color, 120) # Use sky color with some alpha
-        pygame.draw.rect(fog_surf, fog_color, (0, 0, WIDTH, 150))
-        # Layering two fog strips for a scrolling "mist" effect
-        screen.blit(fog_surf, (self.fog_x, GROUND_LINE - 350))
-        screen.blit(fog_surf, (self.fog_x - WIDTH, GROUND_LINE - 350))
+        if fog_color != self.fog_color:
+            self.fog_surf.fill(fog_color)
+            self.fog_color = fog_color
+        screen.blit(self.fog_surf, (0, GROUND_LINE - 350))
 
         for cloud in self.active_clouds: cloud.draw(screen)
         for b in self.birds: b.draw(screen)
         
-        self.mountains.draw(screen) 
+        self.mountains.draw(screen, self.sky_tint) 
         for s in self.wind_streaks: s.draw(screen)
-        self.ground_layer.draw(screen)
\ No newline at end of file
+
+    def draw_stars(self, screen, alpha):
+        alpha = (alpha // STAR_ALPHA_STEP) * STAR_ALPHA_STEP
+        if alpha <= 0: return
+        twinkle = pygame.time.get_ticks() // TWINKLE_STEP_MS
+        if (alpha, twinkle) != self.star_key:
+            self.star_blits = []
+            for star in self.stars:
+                s_alpha = star.twinkle_alpha(alpha, twinkle * TWINKLE_STEP_MS)
+                if s_alpha > 0:
+                    self.star_blits.append((self.star_stamp(star.size, s_alpha), (star.x, star.y)))
+            self.star_key = (alpha, twinkle)
+        screen.blits(self.star_blits, False)
+
+    def star_stamp(self, size, alpha):
+        stamp = self.star_stamps.get((size, alpha))
+        if stamp is None:
+            stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (255, 255, 255, alpha), (size, size), size)
+            self.star_stamps[(size, alpha)] = stamp
+        return stamp
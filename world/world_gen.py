@@ -0,0 +1,229 @@
+import pygame
+import random
+import math
+import queue
+import threading
+from collections import deque
+from settings import WIDTH, HEIGHT, GROUND_LINE, BASE_SCROLL_SPEED
+from entities.scrap import SCRAP_TYPES
+from systems.entity_systems import SCRAP_FLOOR
+
+# --- WORLD GENERATOR ---
+# Rocks, scrap waves and enemies are laid out in distance chunks by a worker
+# thread, a few chunks ahead of the player, from the run seed. Rock surfaces
+# (scaled, rotated, masked) are built there too, so reaching a placement only
+# hands ready-made data to its manager.
+
+CHUNK_LENGTH = 1500 # Distance per chunk (about 6s of flight at base speed)
+LOOKAHEAD = 3       # Chunks kept ready ahead of the one being played
+
+OBSTACLE_SPAWN_X = WIDTH + 150
+ENEMY_SPAWN_X = WIDTH + 50
+SCRAP_BOX = 40      # Rough pickup size used when keeping scrap out of rocks
+SCRAP_BOB_SWING = 24 # How far a piece's bob can carry it from its drift line (at 60 fps)
+# Placements spawn on the first frame past their distance, so a rock and a
+# wave can each land up to a frame's scroll (2x speed at 60 fps) late
+SPAWN_SLACK = 2 * BASE_SCROLL_SPEED * 2 // 60
+SCRAP_RETRIES = 5
+
+def difficulty_at(distance):
+    """World speed multiplier at a distance: +10% every 5000, capped at 2x."""
+    return min(2.0, 1.0 + (distance / 5000) * 0.1)
+
+def seconds_to_distance(seconds, distance):
+    """How far the world scrolls in `seconds` around `distance`."""
+    return seconds * BASE_SCROLL_SPEED * difficulty_at(distance)
+
+def roll_enemy(rng):
+    # Probabilities adjusted for "Monster Saucer" dominance (40% chance)
+    choice = rng.random()
+    if choice < 0.10: return "BlightBeast"
+    if choice < 0.35: return "GloomBat"
+    if choice < 0.75: return "MonsterSaucer" # Saucer: 0.35 to 0.75 = 40% spawn rate!
+    return "BushMonster"
+
+def bolt_wave(start_y, count):
+    """A wavy line of count bolts entering from the right edge."""
+    return [(WIDTH + (i * 55), start_y + math.sin(i * 0.5) * 25, "bolt") for i in range(count)]
+
+def roll_scrap_wave(rng, start_y):
+    """(x, y, scrap type) of each piece, x on screen at spawn."""
+    roll = rng.random()
+    if roll < 0.20:
+        sub_roll = rng.random()
+        if sub_roll < 0.55: # Lowered to 10% of the 20% for Cici
+            choice = "gold_oracle"
+        elif sub_roll < 0.60:
+            choice = "red_core"
+        else:
+            choice = "tine_soul"
+        return [(WIDTH + 100, start_y, choice)]
+    if roll < 0.60:
+        return [(WIDTH + 50, start_y, rng.choice(["bomb", "missile", "battery", "gear"]))]
+    return bolt_wave(start_y, rng.randint(6, 12))
+
+
+class Chunk:
+    def __init__(self, index):
+        self.index = index
+        self.start = index * CHUNK_LENGTH
+        self.end = self.start + CHUNK_LENGTH
+        self.rocks = []       # (distance, y, image, mask)
+        self.placements = []  # (distance, kind, data), sorted by distance
+
+
+class WorldGenerator:
+    """
+    Streams the run's layout into the managers. handlers maps a placement kind
+    ("rock", "scrap", "enemy") to the callable that spawns it; advance() calls
+    them as the player's distance reaches each placement. Kinds without a
+    handler are skipped (story levels bring their own enemy timeline).
+    scrap_waves, given by a story level as [(distance, items), ...], replace
+    the rolled scrap waves and get the same keep-clear-of-rocks pass.
+    """
+    def __init__(self, seed, rock_image, handlers, scrap_waves=None):
+        self.rock_image = rock_image
+        self.handlers = handlers
+        self.rng = random.Random(seed)
+        self.scrap_waves = deque(scrap_waves) if scrap_waves is not None else None
+
+        # Worker state: where the next spawn of each kind falls
+        self.next_index = 0
+        self.next_rock = seconds_to_distance(self.rock_interval(0), 0)
+        self.next_enemy = seconds_to_distance(self.enemy_interval(0), 0)
+        self.next_scrap = seconds_to_distance(self.rng.uniform(2.5, 4.5), 0)
+        self.prev_rocks = []
+        self.rocks_ahead = [] # Next chunk's rocks, laid out before its scrap
+
+        # Main thread state
+        self.pending = deque()
+        self.loaded_until = 0
+
+        self.ready = queue.Queue(LOOKAHEAD)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="world-gen", daemon=True)
+        self.thread.start()
+
+    # --- MAIN THREAD ---
+
+    def advance(self, distance):
+        # Pull chunks that have finished generating; wait only if the player
+        # has run past everything generated so far
+        while self.loaded_until <= distance + CHUNK_LENGTH:
+            try:
+                chunk = self.ready.get(block=self.loaded_until <= distance, timeout=5.0)
+            except queue.Empty:
+                break
+            self.pending.extend(chunk.placements)
+            self.loaded_until = chunk.end
+
+        pending = self.pending
+        while pending and pending[0][0] <= distance:
+            _, kind, data = pending.popleft()
+            handler = self.handlers.get(kind)
+            if handler: handler(data)
+
+    def stop(self):
+        self.stopped.set()
+
+    # --- WORKER ---
+
+    def _run(self):
+        while not self.stopped.is_set():
+            chunk = self.build_chunk(self.next_index)
+            self.next_index += 1
+            while not self.stopped.is_set():
+                try:
+                    self.ready.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def rock_interval(self, distance):
+        # As difficulty increases, rocks come faster: every 1.0s at 2x instead of 2.0s
+        return max(0.4, 2.0 / difficulty_at(distance))
+
+    def enemy_interval(self, distance):
+        return max(0.7, 3.5 / math.sqrt(difficulty_at(distance)))
+
+    def build_chunk(self, index):
+        chunk = Chunk(index)
+        rng = self.rng
+
+        # Rocks run a chunk ahead, so scrap near the end of this chunk is
+        # also checked against the first rocks of the next one
+        while self.next_rock < chunk.end + CHUNK_LENGTH:
+            d = self.next_rock
+            self.rocks_ahead.append(self.build_rock(rng, d))
+            self.next_rock += seconds_to_distance(self.rock_interval(d), d)
+        chunk.rocks = [rock for rock in self.rocks_ahead if rock[0] < chunk.end]
+        self.rocks_ahead = self.rocks_ahead[len(chunk.rocks):]
+
+        while "enemy" in self.handlers and self.next_enemy < chunk.end:
+            d = self.next_enemy
+            chunk.placements.append((d, "enemy", (roll_enemy(rng), ENEMY_SPAWN_X, rng.randint(100, HEIGHT - 100))))
+            self.next_enemy += seconds_to_distance(self.enemy_interval(d), d)
+
+        nearby_rocks = self.prev_rocks + chunk.rocks + self.rocks_ahead
+        if self.scrap_waves is not None:
+            waves = self.scrap_waves
+            while waves and waves[0][0] < chunk.end:
+                d, items = waves.popleft()
+                items = self.clear_of_rocks(rng, d, items, nearby_rocks)
+                if items: chunk.placements.append((d, "scrap", items))
+        else:
+            while "scrap" in self.handlers and self.next_scrap < chunk.end:
+                d = self.next_scrap
+                items = self.place_scrap_wave(rng, d, nearby_rocks)
+                if items: chunk.placements.append((d, "scrap", items))
+                self.next_scrap += seconds_to_distance(rng.uniform(2.5, 4.5), d)
+
+        chunk.placements += [(d, "rock", (y, image, mask)) for d, y, image, mask in chunk.rocks]
+        chunk.placements.sort(key=lambda p: p[0])
+        self.prev_rocks = chunk.rocks
+        return chunk
+
+    def build_rock(self, rng, distance):
+        # Randomly scale and rotate each rock to prevent repetitiveness
+        size = rng.randint(40, 110)
+        image = pygame.transform.scale(self.rock_image, (size, size))
+        image = pygame.transform.rotate(image, rng.randint(0, 360))
+        y = rng.randint(100, GROUND_LINE - 100)
+        return distance, y, image, pygame.mask.from_surface(image)
+
+    def place_scrap_wave(self, rng, distance, rocks):
+        """A rolled scrap wave that keeps clear of the rocks around it."""
+        items = roll_scrap_wave(rng, rng.randint(100, GROUND_LINE - 200))
+        return self.clear_of_rocks(rng, distance, items, rocks)
+
+    def clear_of_rocks(self, rng, distance, items, rocks):
+        """
+        Moves a scrap wave clear of the rocks around it. Positions are
+        compared in world space (spawn distance + screen x); a wave that still
+        hits a rock after a few re-rolled heights drops the blocked pieces.
+        """
+        rock_rects = []
+        for d, y, image, _ in rocks:
+            rect = image.get_rect(center=(d + OBSTACLE_SPAWN_X, y))
+            if abs(rect.centerx - (distance + WIDTH)) < CHUNK_LENGTH: rock_rects.append(rect.inflate(SPAWN_SLACK, 0))
+
+        for attempt in range(SCRAP_RETRIES + 1):
+            blocked = [self.scrap_rect(distance, x, y, kind).collidelist(rock_rects) != -1 for x, y, kind in items]
+            if not any(blocked): return items
+            if attempt < SCRAP_RETRIES:
+                # Same wave at another height
+                shift = rng.randint(100, GROUND_LINE - 200) - items[0][1]
+                items = [(x, y + shift, kind) for x, y, kind in items]
+        return [item for item, hit in zip(items, blocked) if not hit]
+
+    @staticmethod
+    def scrap_rect(distance, x, y, kind):
+        """
+        World-space box a piece sweeps until it leaves the screen. Free scrap
+        scrolls with the rocks, so only its downward drift moves it relative
+        to them (at base speed it is on screen longest, so drifts furthest).
+        """
+        seconds = (x + SCRAP_BOX / 2) / BASE_SCROLL_SPEED
+        low = min(SCRAP_FLOOR, y + SCRAP_TYPES[kind]["drift"] * seconds)
+        top = y - SCRAP_BOX // 2 - SCRAP_BOB_SWING
+        return pygame.Rect(distance + x - SCRAP_BOX // 2, top, SCRAP_BOX, max(0, low - y) + SCRAP_BOX + 2 * SCRAP_BOB_SWING)